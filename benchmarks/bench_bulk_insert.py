@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Сравнение пакетной вставки задач (add_tasks_bulk) с построчной (add_task).
+Запуск: python benchmarks/bench_bulk_insert.py --rows 20000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.database_manager import DatabaseManager  # noqa: E402
+from models.task import Task  # noqa: E402
+
+
+def make_tasks(count):
+    due = datetime.now() + timedelta(days=7)
+    for i in range(count):
+        yield Task(f"Задача {i}", "Описание задачи", 1 + i % 3, due, None, None)
+
+
+def run(label, fill, rows):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    db = DatabaseManager(path)
+    try:
+        db.create_tables()
+        started = time.perf_counter()
+        fill(db, make_tasks(rows))
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+        os.unlink(path)
+    print(f"{label:<10} {rows:>8} строк  {elapsed:8.3f} c  {rows / elapsed:12.0f} строк/с")
+    return elapsed
+
+
+def per_row(db, tasks):
+    for task in tasks:
+        db.add_task(task)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    slow = run("add_task", per_row, args.rows)
+    fast = run("bulk", lambda db, tasks: db.add_tasks_bulk(tasks, args.chunk_size), args.rows)
+    print(f"ускорение: x{slow / fast:.1f}")
+
+
+if __name__ == "__main__":
+    main()
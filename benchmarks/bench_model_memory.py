@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Память на один экземпляр Task / Project / User: модели со __slots__ против
+тех же классов с обычным __dict__ (как было до перехода на __slots__).
+Запуск: python benchmarks/bench_model_memory.py --count 200000
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.project import Project  # noqa: E402
+from models.task import Task  # noqa: E402
+from models.user import User  # noqa: E402
+
+
+def with_dict(cls):
+    # Копия класса без __slots__: атрибуты экземпляра снова живут в __dict__
+    namespace = {
+        name: value for name, value in vars(cls).items()
+        if name != "__slots__" and name not in cls.__slots__
+    }
+    return type(f"Dict{cls.__name__}", (), namespace)
+
+
+def bytes_per_instance(factory, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    due = datetime(2030, 1, 1)
+    cases = [
+        (Task, lambda cls: lambda i: cls("Задача", "Описание", 2, due, 1, 1)),
+        (Project, lambda cls: lambda i: cls("Проект", "Описание", due, due)),
+        (User, lambda cls: lambda i: cls("user", "user@example.com", "developer")),
+    ]
+    print(f"{'модель':<8} {'__dict__':>10} {'__slots__':>10}  экономия")
+    for cls, make in cases:
+        old = bytes_per_instance(make(with_dict(cls)), args.count)
+        new = bytes_per_instance(make(cls), args.count)
+        print(f"{cls.__name__:<8} {old:>8.0f} Б {new:>8.0f} Б  {1 - new / old:6.1%}")
+    print("значения полей (строки, datetime) учитываются в обоих столбцах")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Сравнение поиска задач через LIKE и через FTS5 на разных объёмах данных.
+Запуск: python benchmarks/bench_search.py --sizes 10000,100000,1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.data_generator import VOCABULARY  # noqa: E402
+from database.database_manager import DatabaseManager  # noqa: E402
+from models.task import Task  # noqa: E402
+
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+QUERIES = [VOCABULARY[i] for i in (50, 300, 1200, 2500)] + [VOCABULARY[700][:4]]
+
+
+def make_tasks(count, rnd):
+    for _ in range(count):
+        words = rnd.choices(VOCABULARY, WEIGHTS, k=15)
+        title = " ".join(words[:3])
+        description = " ".join(words[3:])
+        yield Task(title, description, rnd.randint(1, 3), None, None, None)
+
+
+def measure(search, repeats):
+    started = time.perf_counter()
+    for _ in range(repeats):
+        for query in QUERIES:
+            search(query)
+    return (time.perf_counter() - started) / (repeats * len(QUERIES)) * 1000
+
+
+def run(rows, limit, repeats):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    db = DatabaseManager(path)
+    try:
+        db.create_tables()
+        db.add_tasks_bulk(make_tasks(rows, random.Random(rows)), chunk_size=5000)
+        like_ms = measure(lambda q: db._search_like(q, limit), repeats)
+        fts_ms = measure(lambda q: db.search_tasks(q, limit), repeats) if db.fts_enabled else None
+    finally:
+        db.close()
+        os.unlink(path)
+    fts = f"{fts_ms:9.2f} мс  x{like_ms / fts_ms:.1f}" if fts_ms else "   FTS5 недоступен"
+    print(f"{rows:>9} строк  LIKE {like_ms:9.2f} мс  FTS {fts}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for rows in (int(size) for size in args.sizes.split(",")):
+        run(rows, args.limit, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Генератор синтетических данных для бенчмарков: пользователи, проекты и задачи
+с перекосом, как в реальных трекерах — несколько «горячих» проектов и
+исполнителей собирают большую часть задач, половина задач уже закрыта.
+"""
+
+import random
+from datetime import datetime, timedelta
+from itertools import accumulate
+
+from models.project import Project
+from models.task import Task
+from models.user import User
+
+SYLLABLES = "ка ро ми на ле то су пе ды зо ви ба гу ло ре си".split()
+# Словарь из ~4000 слов с распределением Ципфа: частые слова есть почти везде,
+# а типичный поисковый запрос попадает в небольшую долю задач.
+VOCABULARY = sorted({a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES})
+STATUSES = ("pending", "in_progress", "completed")
+STATUS_WEIGHTS = (30, 20, 50)
+ROLES = ("developer", "developer", "developer", "manager", "admin")
+
+
+def zipf_weights(count, exponent=1.1) -> list[float]:
+    return list(accumulate(1 / (rank + 1) ** exponent for rank in range(count)))
+
+
+class DataGenerator:
+    def __init__(self, seed=42, now=None) -> None:
+        self.rnd = random.Random(seed)
+        self.now = now or datetime(2026, 1, 1)
+        self._word_weights = zipf_weights(len(VOCABULARY))
+
+    @staticmethod
+    def sizes_for(tasks) -> tuple[int, int]:
+        # (пользователей, проектов) для заданного числа задач
+        return max(1, tasks // 100), max(1, tasks // 500)
+
+    def words(self, count) -> str:
+        return " ".join(self.rnd.choices(VOCABULARY, cum_weights=self._word_weights, k=count))
+
+    def users(self, count):
+        for i in range(count):
+            yield User(f"user{i}", f"user{i}@example.com", self.rnd.choice(ROLES))
+
+    def projects(self, count):
+        for i in range(count):
+            start = self.now - timedelta(days=self.rnd.randint(0, 365))
+            end = start + timedelta(days=180)
+            yield Project(f"Проект {i} {self.words(2)}", self.words(8), start, end)
+
+    def tasks(self, count, user_ids, project_ids):
+        # Ранги проектов и исполнителей перемешаны, чтобы «горячие» id не шли подряд
+        user_ids, project_ids = list(user_ids), list(project_ids)
+        self.rnd.shuffle(user_ids)
+        self.rnd.shuffle(project_ids)
+        user_weights = zipf_weights(len(user_ids))
+        project_weights = zipf_weights(len(project_ids))
+        for _ in range(count):
+            due = None
+            if self.rnd.random() < 0.9:
+                due = self.now + timedelta(hours=self.rnd.randint(-60 * 24, 60 * 24))
+            task = Task(
+                self.words(4),
+                self.words(16),
+                self.rnd.randint(1, 3),
+                due,
+                self.rnd.choices(project_ids, cum_weights=project_weights)[0],
+                self.rnd.choices(user_ids, cum_weights=user_weights)[0],
+            )
+            task.status = self.rnd.choices(STATUSES, STATUS_WEIGHTS)[0]
+            yield task
+
+    def populate(self, db, tasks) -> dict:
+        users, projects = self.sizes_for(tasks)
+        user_ids = db.add_users_bulk(self.users(users))
+        project_ids = db.add_projects_bulk(self.projects(projects))
+        task_ids = db.add_tasks_bulk(self.tasks(tasks, user_ids, project_ids), chunk_size=5000)
+        return {"user_ids": user_ids, "project_ids": project_ids, "task_ids": task_ids}
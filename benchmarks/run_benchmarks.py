@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Набор бенчмарков DatabaseManager и контроллеров на синтетических данных.
+Каждый размер прогоняется на временном файле SQLite, сеть не нужна.
+
+Запуск:
+    python benchmarks/run_benchmarks.py --sizes 10000,100000,1000000 --output results.json
+    python benchmarks/run_benchmarks.py --sizes 10000 --baseline results.json --tolerance 0.25
+С --baseline результаты сравниваются с сохранёнными; при регрессии код выхода 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.data_generator import VOCABULARY, DataGenerator  # noqa: E402
+from controllers.project_controller import ProjectController  # noqa: E402
+from controllers.task_controller import TaskController  # noqa: E402
+from database.database_manager import DatabaseManager  # noqa: E402
+from database.write_behind import WriteBehindQueue  # noqa: E402
+
+INSERT_ROWS = 2000
+LOOKUPS = 2000
+PAGES = 20
+SEARCHES = 20
+# Разовые сценарии повторяются, чтобы один замер не зависел от шума
+REPEATS = 5
+
+
+def timed(ops, action) -> dict:
+    started = time.perf_counter()
+    action()
+    seconds = time.perf_counter() - started
+    return {"ops": ops, "seconds": round(seconds, 6), "per_op_ms": round(seconds / ops * 1000, 6)}
+
+
+def scenario_insert(db, gen, ids) -> dict:
+    # Построчная вставка с коммитом на каждую задачу; объём фиксирован
+    tasks = list(gen.tasks(INSERT_ROWS, ids["user_ids"], ids["project_ids"]))
+    return timed(len(tasks), lambda: [db.add_task(t) for t in tasks])
+
+
+def scenario_get_by_id(db, gen, ids) -> dict:
+    sample = gen.rnd.choices(ids["task_ids"], k=LOOKUPS)
+    return timed(len(sample), lambda: [db.get_task_by_id(i) for i in sample])
+
+
+def scenario_listing(db, gen, ids) -> dict:
+    def walk():
+        for order_by in ("id", "due_date", "priority"):
+            cursor = None
+            for _ in range(PAGES):
+                _, cursor = db.page_tasks(after=cursor, limit=100, order_by=order_by)
+                if cursor is None:
+                    break
+    return timed(3 * PAGES, walk)
+
+
+def scenario_search(db, gen, ids) -> dict:
+    queries = [VOCABULARY[gen.rnd.randrange(100, len(VOCABULARY))] for _ in range(SEARCHES)]
+    controller = TaskController(db)
+    return timed(len(queries), lambda: [controller.search_tasks(q, limit=50) for q in queries])
+
+
+def scenario_overdue_sweep(db, gen, ids) -> dict:
+    controller = TaskController(db)
+    return timed(
+        REPEATS, lambda: [controller.get_overdue_tasks(now=gen.now) for _ in range(REPEATS)]
+    )
+
+
+def scenario_project_progress(db, gen, ids) -> dict:
+    controller = ProjectController(db)
+    return timed(REPEATS, lambda: [controller.get_all_project_progress() for _ in range(REPEATS)])
+
+
+def scenario_status_updates(db, gen, ids) -> dict:
+    # Поток смен статуса: COMMIT на каждый вызов
+    updates = _status_updates(gen, ids)
+    controller = TaskController(db)
+    return timed(len(updates), lambda: [controller.update_task_status(*u) for u in updates])
+
+
+def scenario_status_write_behind(db, gen, ids) -> dict:
+    # Тот же поток через очередь с групповым коммитом, включая финальный flush()
+    updates = _status_updates(gen, ids)
+    queue = WriteBehindQueue(db)
+    controller = TaskController(db, write_behind=queue)
+
+    def run():
+        for u in updates:
+            controller.update_task_status(*u)
+        controller.flush()
+    try:
+        return timed(len(updates), run)
+    finally:
+        queue.close()
+
+
+def _status_updates(gen, ids) -> list[tuple[int, str]]:
+    statuses = ("pending", "in_progress", "completed")
+    return [(gen.rnd.choice(ids["task_ids"]), gen.rnd.choice(statuses)) for _ in range(INSERT_ROWS)]
+
+
+SCENARIOS = {
+    "get_by_id": scenario_get_by_id,
+    "listing": scenario_listing,
+    "search": scenario_search,
+    "overdue_sweep": scenario_overdue_sweep,
+    "project_progress": scenario_project_progress,
+    "insert": scenario_insert,
+    "status_updates": scenario_status_updates,
+    "status_write_behind": scenario_status_write_behind,
+}
+
+
+def run_size(rows, scenarios, seed) -> dict:
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    db = DatabaseManager(path)
+    results = {}
+    try:
+        db.create_tables()
+        gen = DataGenerator(seed)
+        holder = {}
+        results["bulk_insert"] = timed(rows, lambda: holder.update(gen.populate(db, rows)))
+        db.optimize(analyze=True)
+        for name in scenarios:
+            results[name] = SCENARIOS[name](db, gen, holder)
+    finally:
+        db.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
+    return results
+
+
+def compare(results, baseline, tolerance) -> list[str]:
+    regressions = []
+    for size, scenarios in results.items():
+        for name, current in scenarios.items():
+            previous = baseline.get(size, {}).get(name)
+            if not previous:
+                continue
+            ratio = current["per_op_ms"] / previous["per_op_ms"] if previous["per_op_ms"] else 1.0
+            mark = ""
+            if ratio > 1 + tolerance:
+                mark = "  РЕГРЕССИЯ"
+                regressions.append(f"{size}/{name}")
+            print(f"{size:>9} {name:<18} {previous['per_op_ms']:>12.4f} -> "
+                  f"{current['per_op_ms']:>12.4f} мс/оп  x{ratio:.2f}{mark}")
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="куда сохранить результаты в JSON")
+    parser.add_argument("--baseline", help="JSON с прошлым прогоном для сравнения")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="допустимое замедление, доля")
+    args = parser.parse_args()
+    args.scenarios = [name for name in args.scenarios.split(",") if name]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"неизвестные сценарии: {', '.join(sorted(unknown))}")
+    return args
+
+
+def run_sizes(sizes, scenarios, seed) -> dict:
+    results = {}
+    for rows in (int(size) for size in sizes.split(",")):
+        results[str(rows)] = run_size(rows, scenarios, seed)
+        for name, r in results[str(rows)].items():
+            print(f"{rows:>9} {name:<18} {r['ops']:>7} оп  {r['seconds']:>9.3f} c  "
+                  f"{r['per_op_ms']:>10.4f} мс/оп")
+    return results
+
+
+def make_report(results, seed) -> dict:
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def main():
+    args = parse_args()
+    results = run_sizes(args.sizes, args.scenarios, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(make_report(results, args.seed), f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"регрессии: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+from controllers.project_controller import ProjectController
+from controllers.task_controller import TaskController
+from controllers.user_controller import UserController
+from database.database_manager import DEFAULT_BATCH_SIZE, DEFAULT_PAGE_SIZE
+from models.project import Project
+from models.task import Task
+from models.user import User
+
+# Асинхронные фасады над контроллерами: те же методы и результаты, но работа
+# с базой идёт через AsyncExecutor и не блокирует цикл событий. Методы iter_*
+# возвращают асинхронные итераторы. Один AsyncExecutor можно разделить между
+# всеми тремя контроллерами.
+
+
+class AsyncTaskController:
+    def __init__(self, executor, write_behind=None) -> None:
+        self.executor = executor
+        self.sync = TaskController(executor.db, write_behind)
+
+    def transaction(self):
+        return self.executor.transaction()
+
+    async def add_task(
+        self, title, description, priority, due_date, project_id, assignee_id
+    ) -> int:
+        return await self.executor.write(
+            self.sync.add_task, title, description, priority, due_date, project_id, assignee_id
+        )
+
+    async def get_task(self, task_id) -> Task | None:
+        return await self.executor.read(self.sync.get_task, task_id)
+
+    async def get_tasks_by_ids(self, ids) -> dict[int, Task]:
+        return await self.executor.read(self.sync.get_tasks_by_ids, ids)
+
+    async def get_all_tasks(self) -> list[Task]:
+        return await self.executor.read(self.sync.get_all_tasks)
+
+    async def page_tasks(
+        self, after=None, limit=DEFAULT_PAGE_SIZE, order_by="id", filters=None, offset=None
+    ):
+        return await self.executor.read(
+            self.sync.page_tasks, after, limit, order_by, filters, offset
+        )
+
+    async def count_tasks(self, filters=None) -> int:
+        return await self.executor.read(self.sync.count_tasks, filters)
+
+    async def get_changes(self, since=None) -> dict | None:
+        return await self.executor.read(self.sync.get_changes, since)
+
+    def iter_tasks(self, batch_size=DEFAULT_BATCH_SIZE):
+        return self.executor.stream(self.sync.iter_tasks, batch_size, batch_size=batch_size)
+
+    async def update_task(self, task_id, **kwargs) -> bool:
+        return await self.executor.write(self.sync.update_task, task_id, **kwargs)
+
+    async def delete_task(self, task_id) -> bool:
+        return await self.executor.write(self.sync.delete_task, task_id)
+
+    async def search_tasks(self, query, limit=None) -> list[Task]:
+        return await self.executor.read(self.sync.search_tasks, query, limit)
+
+    async def search_task_snippets(self, query, limit=None) -> list[tuple[Task, str]]:
+        return await self.executor.read(self.sync.search_task_snippets, query, limit)
+
+    async def update_task_status(self, task_id, new_status) -> bool:
+        if self.sync.write_behind is not None:
+            return await self.executor.call(self.sync.update_task_status, task_id, new_status)
+        return await self.executor.write(self.sync.update_task_status, task_id, new_status)
+
+    async def flush(self) -> None:
+        await self.executor.call(self.sync.flush)
+
+    async def fetch_tasks_columnar(self, filters=None):
+        return await self.executor.read(self.sync.fetch_tasks_columnar, filters)
+
+    async def get_overdue_tasks(
+        self, now=None, project_id=None, assignee_id=None, limit=None
+    ) -> list[Task]:
+        return await self.executor.read(
+            self.sync.get_overdue_tasks, now, project_id, assignee_id, limit
+        )
+
+    async def get_tasks_by_project(self, project_id) -> list[Task]:
+        return await self.executor.read(self.sync.get_tasks_by_project, project_id)
+
+    def iter_tasks_by_project(self, project_id, batch_size=DEFAULT_BATCH_SIZE):
+        return self.executor.stream(
+            self.sync.iter_tasks_by_project, project_id, batch_size, batch_size=batch_size
+        )
+
+    async def get_tasks_by_user(self, user_id) -> list[Task]:
+        return await self.executor.read(self.sync.get_tasks_by_user, user_id)
+
+    def iter_tasks_by_user(self, user_id, batch_size=DEFAULT_BATCH_SIZE):
+        return self.executor.stream(
+            self.sync.iter_tasks_by_user, user_id, batch_size, batch_size=batch_size
+        )
+
+
+class AsyncProjectController:
+    def __init__(self, executor) -> None:
+        self.executor = executor
+        self.sync = ProjectController(executor.db)
+
+    def transaction(self):
+        return self.executor.transaction()
+
+    async def add_project(self, name, description, start_date, end_date) -> int:
+        return await self.executor.write(
+            self.sync.add_project, name, description, start_date, end_date
+        )
+
+    async def get_project(self, project_id) -> Project | None:
+        return await self.executor.read(self.sync.get_project, project_id)
+
+    async def get_projects_by_ids(self, ids) -> dict[int, Project]:
+        return await self.executor.read(self.sync.get_projects_by_ids, ids)
+
+    async def get_all_projects(self) -> list[Project]:
+        return await self.executor.read(self.sync.get_all_projects)
+
+    async def page_projects(
+        self, after=None, limit=DEFAULT_PAGE_SIZE, order_by="id", filters=None, offset=None
+    ):
+        return await self.executor.read(
+            self.sync.page_projects, after, limit, order_by, filters, offset
+        )
+
+    async def count_projects(self, filters=None) -> int:
+        return await self.executor.read(self.sync.count_projects, filters)
+
+    async def get_changes(self, since=None) -> dict | None:
+        return await self.executor.read(self.sync.get_changes, since)
+
+    async def update_project(self, project_id, **kwargs) -> bool:
+        return await self.executor.write(self.sync.update_project, project_id, **kwargs)
+
+    async def delete_project(self, project_id) -> bool:
+        return await self.executor.write(self.sync.delete_project, project_id)
+
+    async def update_project_status(self, project_id, new_status) -> bool:
+        return await self.executor.write(self.sync.update_project_status, project_id, new_status)
+
+    async def get_project_stats(self, project_ids=None) -> dict[int, dict]:
+        return await self.executor.read(self.sync.get_project_stats, project_ids)
+
+    async def get_task_counts(self, project_id) -> dict[str, int]:
+        return await self.executor.read(self.sync.get_task_counts, project_id)
+
+    async def get_open_task_counts(self) -> dict[int, int]:
+        return await self.executor.read(self.sync.get_open_task_counts)
+
+    async def get_project_progress(self, project_id) -> float:
+        return await self.executor.read(self.sync.get_project_progress, project_id)
+
+    async def get_all_project_progress(self) -> dict[int, float]:
+        return await self.executor.read(self.sync.get_all_project_progress)
+
+
+class AsyncUserController:
+    def __init__(self, executor) -> None:
+        self.executor = executor
+        self.sync = UserController(executor.db)
+
+    def transaction(self):
+        return self.executor.transaction()
+
+    async def add_user(self, username, email, role) -> int:
+        return await self.executor.write(self.sync.add_user, username, email, role)
+
+    async def get_user(self, user_id) -> User | None:
+        return await self.executor.read(self.sync.get_user, user_id)
+
+    async def get_users_by_ids(self, ids) -> dict[int, User]:
+        return await self.executor.read(self.sync.get_users_by_ids, ids)
+
+    async def get_all_users(self) -> list[User]:
+        return await self.executor.read(self.sync.get_all_users)
+
+    async def page_users(
+        self, after=None, limit=DEFAULT_PAGE_SIZE, order_by="id", filters=None, offset=None
+    ):
+        return await self.executor.read(
+            self.sync.page_users, after, limit, order_by, filters, offset
+        )
+
+    async def count_users(self, filters=None) -> int:
+        return await self.executor.read(self.sync.count_users, filters)
+
+    async def get_changes(self, since=None) -> dict | None:
+        return await self.executor.read(self.sync.get_changes, since)
+
+    async def update_user(self, user_id, **kwargs) -> bool:
+        return await self.executor.write(self.sync.update_user, user_id, **kwargs)
+
+    async def delete_user(self, user_id) -> bool:
+        return await self.executor.write(self.sync.delete_user, user_id)
+
+    async def get_user_tasks(self, user_id) -> list:
+        return await self.executor.read(self.sync.get_user_tasks, user_id)
+
+    async def get_task_counts(self, user_id) -> dict[str, int]:
+        return await self.executor.read(self.sync.get_task_counts, user_id)
+
+    async def get_workload(self) -> dict[int, int]:
+        return await self.executor.read(self.sync.get_workload)
@@ -1,9 +1,13 @@
+from database.database_manager import DEFAULT_PAGE_SIZE
 from models.project import Project
 
 class ProjectController:
     def __init__(self, db_manager) -> None:
         self.db = db_manager
 
+    def transaction(self):
+        return self.db.transaction()
+
     def add_project(self, name, description, start_date, end_date) -> int:
         project = Project(name, description, start_date, end_date)
         return self.db.add_project(project)
@@ -11,9 +15,23 @@ class ProjectController:
     def get_project(self, project_id) -> Project | None:
         return self.db.get_project_by_id(project_id)
 
+    def get_projects_by_ids(self, ids) -> dict[int, Project]:
+        return self.db.get_projects_by_ids(ids)
+
     def get_all_projects(self) -> list[Project]:
         return self.db.get_all_projects()
 
+    def page_projects(
+        self, after=None, limit=DEFAULT_PAGE_SIZE, order_by="id", filters=None, offset=None
+    ):
+        return self.db.page_projects(after, limit, order_by, filters, offset)
+
+    def count_projects(self, filters=None) -> int:
+        return self.db.count_projects(filters)
+
+    def get_changes(self, since=None) -> dict | None:
+        return self.db.get_changes("projects", since)
+
     def update_project(self, project_id, **kwargs) -> bool:
         return self.db.update_project(project_id, **kwargs)
 
@@ -23,13 +41,27 @@ class ProjectController:
     def update_project_status(self, project_id, new_status) -> bool:
         return self.db.update_project(project_id, status=new_status)
 
+    def get_project_stats(self, project_ids=None) -> dict[int, dict]:
+        return self.db.get_project_stats(project_ids)
+
+    def get_task_counts(self, project_id) -> dict[str, int]:
+        return self.db.get_task_counts("project", project_id)
+
+    def get_open_task_counts(self) -> dict[int, int]:
+        return self.db.get_open_task_counts("project")
+
     def get_project_progress(self, project_id) -> float:
-        project = self.db.get_project_by_id(project_id)
-        if not project:
+        stats = self.db.get_project_stats([project_id]).get(project_id)
+        if not stats:
             return 0.0
-        # Простая логика: завершён — 100, на паузе — 50, активный — 0
-        if project.status == "completed":
-            return 100.0
-        elif project.status == "on_hold":
-            return 50.0
-        return 0.0
\ No newline at end of file
+        return _progress(stats)
+
+    def get_all_project_progress(self) -> dict[int, float]:
+        return {pid: _progress(stats) for pid, stats in self.db.get_project_stats().items()}
+
+
+def _progress(stats) -> float:
+    # Доля выполненных задач; у проекта без задач прогресс определяется его статусом
+    if stats["total"]:
+        return stats["completion"]
+    return 100.0 if stats["project_status"] == "completed" else 0.0
@@ -1,8 +1,15 @@
+from database.database_manager import DEFAULT_BATCH_SIZE, DEFAULT_PAGE_SIZE
 from models.task import Task
 
 class TaskController:
-    def __init__(self, db_manager) -> None:
+    def __init__(self, db_manager, write_behind=None) -> None:
         self.db = db_manager
+        # WriteBehindQueue: update_task_status ставит обновление в очередь
+        # с групповым коммитом вместо COMMIT на каждый вызов
+        self.write_behind = write_behind
+
+    def transaction(self):
+        return self.db.transaction()
 
     def add_task(self, title, description, priority, due_date, project_id, assignee_id) -> int:
         task = Task(title, description, priority, due_date, project_id, assignee_id)
@@ -11,44 +18,69 @@ class TaskController:
     def get_task(self, task_id) -> Task | None:
         return self.db.get_task_by_id(task_id)
 
+    def get_tasks_by_ids(self, ids) -> dict[int, Task]:
+        return self.db.get_tasks_by_ids(ids)
+
     def get_all_tasks(self) -> list[Task]:
         return self.db.get_all_tasks()
 
+    def page_tasks(
+        self, after=None, limit=DEFAULT_PAGE_SIZE, order_by="id", filters=None, offset=None
+    ):
+        return self.db.page_tasks(after, limit, order_by, filters, offset)
+
+    def count_tasks(self, filters=None) -> int:
+        return self.db.count_tasks(filters)
+
+    def get_changes(self, since=None) -> dict | None:
+        return self.db.get_changes("tasks", since)
+
+    def iter_tasks(self, batch_size=DEFAULT_BATCH_SIZE):
+        return self.db.iter_tasks(batch_size)
+
     def update_task(self, task_id, **kwargs) -> bool:
         return self.db.update_task(task_id, **kwargs)
 
     def delete_task(self, task_id) -> bool:
         return self.db.delete_task(task_id)
 
-    def search_tasks(self, query) -> list[Task]:
-        return self.db.search_tasks(query)
+    def search_tasks(self, query, limit=None) -> list[Task]:
+        return self.db.search_tasks(query, limit)
 
-    def update_task_status(self, task_id, new_status) -> bool:
-        return self.db.update_task(task_id, status=new_status)
+    def search_task_snippets(self, query, limit=None) -> list[tuple[Task, str]]:
+        return self.db.search_task_snippets(query, limit)
+
+    def task_matches(self, task, query) -> bool:
+        return self.db.task_matches(task, query)
 
-    def get_overdue_tasks(self) -> list[Task]:
-        dtm = __import__("datetime")
-        now = dtm.datetime.now()
+    def search_key(self, query) -> tuple[str, tuple[str, ...]]:
+        return self.db.search_key(query)
 
-        tasks = self.db.get_all_tasks()
-        result: list[Task] = []
+    def update_task_status(self, task_id, new_status) -> bool:
+        if self.write_behind is not None:
+            return self.write_behind.update(task_id, new_status)
+        return self.db.update_task(task_id, status=new_status)
 
-        for t in tasks:
-            due = getattr(t, "due_date", None)
+    def flush(self) -> None:
+        if self.write_behind is not None:
+            self.write_behind.flush()
 
-            if isinstance(due, str) and due:
-                try:
-                    due = dtm.datetime.fromisoformat(due)
-                except Exception:
-                    continue
+    def fetch_tasks_columnar(self, filters=None):
+        return self.db.fetch_tasks_columnar(filters)
 
-        if (due is not None) and (getattr(t, "status", None) != "completed") and (due < now):
-            result.append(t)
-        
-        return result
+    def get_overdue_tasks(
+        self, now=None, project_id=None, assignee_id=None, limit=None
+    ) -> list[Task]:
+        return self.db.get_overdue_tasks(now, project_id, assignee_id, limit)
 
     def get_tasks_by_project(self, project_id) -> list[Task]:
         return self.db.get_tasks_by_project(project_id)
 
+    def iter_tasks_by_project(self, project_id, batch_size=DEFAULT_BATCH_SIZE):
+        return self.db.iter_tasks_by_project(project_id, batch_size)
+
     def get_tasks_by_user(self, user_id) -> list[Task]:
-        return self.db.get_tasks_by_user(user_id)
\ No newline at end of file
+        return self.db.get_tasks_by_user(user_id)
+
+    def iter_tasks_by_user(self, user_id, batch_size=DEFAULT_BATCH_SIZE):
+        return self.db.iter_tasks_by_user(user_id, batch_size)
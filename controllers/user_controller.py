@@ -1,9 +1,13 @@
+from database.database_manager import DEFAULT_PAGE_SIZE
 from models.user import User
 
 class UserController:
     def __init__(self, db_manager) -> None:
         self.db = db_manager
 
+    def transaction(self):
+        return self.db.transaction()
+
     def add_user(self, username, email, role) -> int:
         user = User(username, email, role)
         return self.db.add_user(user)
@@ -11,9 +15,23 @@ class UserController:
     def get_user(self, user_id) -> User | None:
         return self.db.get_user_by_id(user_id)
 
+    def get_users_by_ids(self, ids) -> dict[int, User]:
+        return self.db.get_users_by_ids(ids)
+
     def get_all_users(self) -> list[User]:
         return self.db.get_all_users()
 
+    def page_users(
+        self, after=None, limit=DEFAULT_PAGE_SIZE, order_by="id", filters=None, offset=None
+    ):
+        return self.db.page_users(after, limit, order_by, filters, offset)
+
+    def count_users(self, filters=None) -> int:
+        return self.db.count_users(filters)
+
+    def get_changes(self, since=None) -> dict | None:
+        return self.db.get_changes("users", since)
+
     def update_user(self, user_id, **kwargs) -> bool:
         return self.db.update_user(user_id, **kwargs)
 
@@ -21,4 +39,10 @@ class UserController:
         return self.db.delete_user(user_id)
 
     def get_user_tasks(self, user_id) -> list:
-        return self.db.get_tasks_by_user(user_id)
\ No newline at end of file
+        return self.db.get_tasks_by_user(user_id)
+
+    def get_task_counts(self, user_id) -> dict[str, int]:
+        return self.db.get_task_counts("assignee", user_id)
+
+    def get_workload(self) -> dict[int, int]:
+        return self.db.get_open_task_counts("assignee")
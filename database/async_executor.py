@@ -0,0 +1,273 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from itertools import islice
+
+from database.database_manager import DEFAULT_BATCH_SIZE
+
+# Сколько порций потокового чтения поток-читатель может выбрать впрок
+STREAM_PREFETCH = 2
+_END = object()
+# Транзакция, открытая в текущей задаче asyncio (и унаследованная её дочерними задачами)
+_transaction = contextvars.ContextVar("async_transaction", default=None)
+
+
+class _ReadCall:
+    """Один вызов в потоке-читателе; умеет прервать свой запрос из другого потока."""
+
+    def __init__(self, pool) -> None:
+        self.pool = pool
+        self.cancelled = False
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def run(self, fn, *args, **kwargs):
+        # Читатель берётся заранее: вложенные pool.reader() в том же потоке
+        # получают это же подключение, и его можно прервать через interrupt().
+        with self.pool.reader() as conn:
+            with self._lock:
+                if self.cancelled:
+                    raise asyncio.CancelledError()
+                self._conn = conn
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._conn = None
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            # Писателя (база :memory: без читателей) не прерываем: на нём идут чужие записи
+            if self._conn is not None and self._conn is not self.pool.writer:
+                self._conn.interrupt()
+
+
+class _ReaderStream:
+    """Генератор fn(*args), который живёт в одном потоке-читателе до конца чтения.
+
+    Поток ждёт разрешения (credits) перед каждой порцией, так что медленный
+    потребитель не копит результат в памяти. Порции, конец (_END) и ошибка
+    передаются в очередь цикла событий.
+    """
+
+    def __init__(self, loop, pool, fn, args, batch_size) -> None:
+        self.loop = loop
+        self.fn = fn
+        self.args = args
+        self.batch_size = batch_size
+        self.queue = asyncio.Queue()
+        self.credits = threading.Semaphore(STREAM_PREFETCH)
+        self.call = _ReadCall(pool)
+
+    def produce(self) -> None:
+        # Выполняется в потоке-читателе
+        try:
+            self.call.run(self._pump)
+            self._emit(_END)
+        except BaseException as exc:
+            self._emit(exc)
+
+    def _pump(self) -> None:
+        gen = self.fn(*self.args)
+        try:
+            while self._send_batch(gen):
+                pass
+        finally:
+            gen.close()
+
+    def _send_batch(self, gen) -> bool:
+        self.credits.acquire()
+        if self.call.cancelled:
+            return False
+        batch = _take(gen, self.batch_size)
+        if batch:
+            self._emit(batch)
+        return bool(batch)
+
+    def _emit(self, item) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, item)
+        except RuntimeError:
+            pass                    # цикл событий уже закрыт
+
+    async def next_batch(self):
+        # Следующая порция или None в конце; ошибка потока-читателя поднимается здесь
+        item = await self.queue.get()
+        if item is _END:
+            return None
+        if isinstance(item, BaseException):
+            raise item
+        self.credits.release()
+        return item
+
+    def cancel(self) -> None:
+        # Прерывает идущий запрос и будит поток, если он ждёт разрешения
+        self.call.cancel()
+        self.credits.release()
+
+
+class AsyncExecutor:
+    """Выполняет синхронные вызовы DatabaseManager вне цикла событий asyncio.
+
+    Записи идут по очереди в единственном потоке писателя, чтения — в пуле
+    потоков размером с пул читателей базы. Отмена и таймаут снимают ещё не
+    начатый вызов; идущее чтение прерывается через sqlite3 interrupt(), а
+    начатая запись доводится до конца, поэтому после таймаута записи её
+    результат мог уже попасть в базу.
+    """
+
+    def __init__(self, db, readers=None, timeout=None) -> None:
+        self.db = db
+        self.timeout = timeout
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        self._readers = ThreadPoolExecutor(
+            max_workers=readers or max(1, db.pool.size), thread_name_prefix="db-reader"
+        )
+        # Не пускает чужие записи внутрь открытой транзакции: все они идут
+        # через один поток, а блокировка писателя в базе реентерабельна.
+        self._write_lock = asyncio.Lock()
+        self._active = None
+
+    def _in_transaction(self) -> bool:
+        # Задача, созданная внутри блока и пережившая его, снова пишет через блокировку
+        return self._active is not None and _transaction.get() is self._active
+
+    async def _wait(self, future, timeout):
+        return await asyncio.wait_for(future, self.timeout if timeout is None else timeout)
+
+    async def read(self, fn, *args, timeout=None, **kwargs):
+        loop = asyncio.get_running_loop()
+        if self._in_transaction():
+            job = functools.partial(fn, *args, **kwargs)
+            return await self._wait(loop.run_in_executor(self._writer, job), timeout)
+        call = _ReadCall(self.db.pool)
+        job = functools.partial(call.run, fn, *args, **kwargs)
+        try:
+            return await self._wait(loop.run_in_executor(self._readers, job), timeout)
+        except (asyncio.CancelledError, TimeoutError):
+            call.cancel()
+            raise
+
+    async def write(self, fn, *args, timeout=None, **kwargs):
+        loop = asyncio.get_running_loop()
+        job = functools.partial(fn, *args, **kwargs)
+        if self._in_transaction():
+            return await self._wait(loop.run_in_executor(self._writer, job), timeout)
+        async with self._write_lock:
+            return await self._wait(loop.run_in_executor(self._writer, job), timeout)
+
+    async def call(self, fn, *args, timeout=None, **kwargs):
+        # Для вызовов, которые сами не держат подключение, а только ждут
+        # (например, commit группы в WriteBehindQueue): в пуле цикла событий,
+        # внутри транзакции — в потоке писателя.
+        loop = asyncio.get_running_loop()
+        job = functools.partial(fn, *args, **kwargs)
+        pool = self._writer if self._in_transaction() else None
+        return await self._wait(loop.run_in_executor(pool, job), timeout)
+
+    async def stream(self, fn, *args, batch_size=DEFAULT_BATCH_SIZE, timeout=None):
+        # Асинхронный итератор по результату генератора fn(*args). Генератор
+        # создаётся и продвигается в одном потоке, записи передаются порциями;
+        # timeout действует на ожидание каждой порции.
+        if self._in_transaction():
+            source = self._stream_in_transaction(fn, args, batch_size, timeout)
+        else:
+            source = self._stream_from_reader(fn, args, batch_size, timeout)
+        async with _closing(source):
+            async for batch in source:
+                for item in batch:
+                    yield item
+
+    async def _stream_in_transaction(self, fn, args, batch_size, timeout):
+        # Поток писателя один, поэтому порции можно читать отдельными вызовами
+        loop = asyncio.get_running_loop()
+        gen = await self._wait(loop.run_in_executor(self._writer, fn, *args), timeout)
+        try:
+            while True:
+                batch = await self._wait(
+                    loop.run_in_executor(self._writer, _take, gen, batch_size), timeout
+                )
+                if not batch:
+                    return
+                yield batch
+        finally:
+            self._writer.submit(gen.close)
+
+    async def _stream_from_reader(self, fn, args, batch_size, timeout):
+        loop = asyncio.get_running_loop()
+        stream = _ReaderStream(loop, self.db.pool, fn, args, batch_size)
+        loop.run_in_executor(self._readers, stream.produce)
+        try:
+            while True:
+                batch = await self._wait(stream.next_batch(), timeout)
+                if batch is None:
+                    return
+                yield batch
+        finally:
+            stream.cancel()
+
+    @asynccontextmanager
+    async def transaction(self):
+        # Как DatabaseManager.transaction(), но BEGIN/COMMIT и все вызовы
+        # внутри блока выполняются в потоке писателя; вложенный блок — SAVEPOINT.
+        if self._in_transaction():
+            async with self._transaction_block():
+                yield self
+            return
+        async with self._write_lock:
+            self._active = object()
+            token = _transaction.set(self._active)
+            try:
+                async with self._transaction_block():
+                    yield self
+            finally:
+                _transaction.reset(token)
+                self._active = None
+
+    @asynccontextmanager
+    async def _transaction_block(self):
+        loop = asyncio.get_running_loop()
+        block = self.db.transaction()
+        enter = loop.run_in_executor(self._writer, block.__enter__)
+        try:
+            await asyncio.shield(enter)
+        except asyncio.CancelledError:
+            # BEGIN мог успеть выполниться — откатываем следом в том же потоке
+            enter.add_done_callback(functools.partial(_rollback_if_entered, self._writer, block))
+            raise
+        try:
+            yield
+        except BaseException as exc:
+            exit_ = loop.run_in_executor(
+                self._writer, block.__exit__, type(exc), exc, exc.__traceback__
+            )
+            await asyncio.shield(exit_)
+            raise
+        # shield: при отмене во время COMMIT он всё равно будет выполнен
+        await asyncio.shield(loop.run_in_executor(self._writer, block.__exit__, None, None, None))
+
+    def close(self) -> None:
+        self._readers.shutdown(wait=True, cancel_futures=True)
+        self._writer.shutdown(wait=True)
+
+
+def _take(gen, count) -> list:
+    return list(islice(gen, count))
+
+
+def _rollback_if_entered(writer, block, future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        error = asyncio.CancelledError()
+        writer.submit(block.__exit__, type(error), error, None)
+
+
+@asynccontextmanager
+async def _closing(agen):
+    try:
+        yield agen
+    finally:
+        await agen.aclose()
@@ -0,0 +1,121 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class PoolClosedError(RuntimeError):
+    pass
+
+
+class ConnectionPool:
+    """Один писатель и до size читателей поверх одного файла SQLite.
+
+    В режиме WAL читатели не блокируют писателя, поэтому чтения из разных
+    потоков идут параллельно, а все записи сериализуются через write_lock.
+    """
+
+    def __init__(self, db_path, size=4, configure=None, timeout=5.0) -> None:
+        if size < 0:
+            raise ValueError("size must not be negative")
+        self.db_path = db_path
+        self.timeout = timeout
+        self._configure = configure
+        # Каждое подключение к :memory: — отдельная база, читателям там нечего читать.
+        self.size = 0 if db_path == ":memory:" else size
+        self.write_lock = threading.RLock()
+        self.writer = self._connect()
+        self._idle = queue.LifoQueue()
+        self._all: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._closed = False
+
+    def _connect(self, readonly=False) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=self.timeout)
+        conn.row_factory = sqlite3.Row
+        if self._configure:
+            self._configure(conn)
+        if readonly:
+            conn.execute("PRAGMA query_only = ON;")
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _checkout(self) -> sqlite3.Connection:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._create_or_wait()
+            if self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+
+    def _create_or_wait(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._closed:
+                raise PoolClosedError("connection pool is closed")
+            if len(self._all) < self.size:
+                conn = self._connect(readonly=True)
+                self._all.append(conn)
+                return conn
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError("no reader connection available") from None
+
+    def _discard(self, conn) -> None:
+        with self._lock:
+            if conn in self._all:
+                self._all.remove(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    @contextmanager
+    def reader(self):
+        # Поток, уже держащий читателя (вложенный вызов), получает его же.
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            yield held
+            return
+        if not self.size:
+            with self.write_lock:
+                yield self.writer
+            return
+        conn = self._checkout()
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            if conn.in_transaction:
+                conn.rollback()
+            if self._closed:
+                conn.close()
+            else:
+                self._idle.put(conn)
+
+    def connections(self) -> list[sqlite3.Connection]:
+        with self._lock:
+            return [self.writer, *self._all]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": self.size, "open": len(self._all), "idle": self._idle.qsize()}
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            readers, self._all = self._all, []
+        for conn in readers:
+            conn.close()
+        self.writer.close()
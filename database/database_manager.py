@@ -1,100 +1,1045 @@
+import base64
+import copy
+import json
+import re
 import sqlite3
+import string
+import threading
+import unicodedata
+from contextlib import contextmanager
+from itertools import islice
+from database.cache import MISSING, LRUCache
+from database.connection_pool import ConnectionPool
+from database.instrumentation import Instrumentation
 from models.task import Task
 from models.project import Project
 from models.user import User
+from models.task_frame import TaskFrame
 from datetime import datetime
 
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_BATCH_SIZE = 500
+
+# Наборы PRAGMA для разных режимов работы. WAL во всех профилях: читатели не
+# блокируют писателя; профили отличаются ценой синхронизации и объёмом кэшей.
+PRAGMA_PROFILES = {
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -8000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+        "wal_autocheckpoint": 1000,
+    },
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -32000,
+        "mmap_size": 128 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+        "wal_autocheckpoint": 1000,
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -128000,
+        "mmap_size": 512 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 10000,
+        "wal_autocheckpoint": 4000,
+    },
+}
+CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+DEFAULT_PAGE_SIZE = 100
+# Старые сборки SQLite ограничивают число параметров запроса 999
+MAX_SQL_VARIABLES = 900
+# Колонки, по которым разрешены сортировка и фильтры при постраничной выборке.
+# Имена подставляются в SQL, поэтому всё, чего нет в этих списках, отклоняется.
+PAGE_ORDERS = {
+    "tasks": ("id", "due_date", "priority"),
+    "projects": ("id", "start_date", "end_date"),
+    "users": ("id", "registration_date"),
+}
+PAGE_FILTERS = {
+    "tasks": ("status", "priority", "project_id", "assignee_id"),
+    "projects": ("status",),
+    "users": ("role",),
+}
+
+TASK_INSERT_SQL = (
+    "INSERT INTO tasks(title, description, priority, status, due_date, project_id, assignee_id)"
+    " VALUES(?,?,?,?,?,?,?)"
+)
+PROJECT_INSERT_SQL = (
+    "INSERT INTO projects(name, description, start_date, end_date, status) VALUES(?,?,?,?,?)"
+)
+USER_INSERT_SQL = "INSERT INTO users(username, email, role, registration_date) VALUES(?,?,?,?)"
+
+
+def _task_params(task: Task) -> tuple:
+    return (
+        task.title,
+        task.description,
+        task.priority,
+        task.status,
+        task.due_date.isoformat() if task.due_date else None,
+        task.project_id,
+        task.assignee_id,
+    )
+
+
+def _project_params(project: Project) -> tuple:
+    return (
+        project.name,
+        project.description,
+        project.start_date.isoformat() if project.start_date else None,
+        project.end_date.isoformat() if project.end_date else None,
+        project.status,
+    )
+
+
+def _user_params(user: User) -> tuple:
+    return (user.username, user.email, user.role, user.registration_date.isoformat())
+
+
+# Управляемый набор индексов: create_tables создаёт недостающие. rowid (id) —
+# неявно последняя колонка любого индекса, поэтому ORDER BY <колонка>, id
+# обслуживается индексом по одной колонке. idx_tasks_project и
+# idx_tasks_assignee не покрываются составными: выборки по проекту и
+# исполнителю идут в порядке id, и без них SQLite сортирует все строки.
+MANAGED_INDEXES = {
+    "idx_tasks_status": "tasks(status)",
+    "idx_tasks_due": "tasks(due_date)",
+    "idx_tasks_priority": "tasks(priority)",
+    "idx_tasks_project": "tasks(project_id)",
+    "idx_tasks_project_due": "tasks(project_id, due_date)",
+    "idx_tasks_project_status": "tasks(project_id, status)",
+    "idx_tasks_assignee": "tasks(assignee_id)",
+    "idx_tasks_assignee_due": "tasks(assignee_id, due_date)",
+    "idx_tasks_assignee_status_due": "tasks(assignee_id, status, due_date)",
+    # частичный индекс только по незавершённым задачам — для выборки просроченных
+    "idx_tasks_open_due": "tasks(due_date) WHERE status != 'completed'",
+    "idx_projects_start": "projects(start_date)",
+    "idx_projects_end": "projects(end_date)",
+    "idx_users_registered": "users(registration_date)",
+}
+
+
+# Полнотекстовый индекс по задачам (external content): строки хранятся только
+# в tasks, а tasks_fts держит инвертированный индекс, который обновляют триггеры.
+FTS_SCHEMA = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, content='tasks', content_rowid='id'
+    );""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END;""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END;""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END;""",
+)
+# Слова так, как их режет токенизатор unicode61: буквы и цифры, а "_" и
+# прочие символы — разделители ("foo_bar" — два слова)
+FTS_TERM_RE = re.compile(r"[^\W_]+")
+# Пробы analyze_indexes, которым полный проход или сортировка нужны по
+# построению, и почему. Ожидания страниц page_* задаёт _page_full_pass.
+EXPECTED_FULL_PASSES = {
+    "get_all_tasks": "весь список",
+    "get_all_projects": "весь список",
+    "get_all_users": "весь список",
+    "search_tasks": "результаты FTS5 сортируются по релевантности",
+    "search_like": "LIKE с ведущим % индекс не использует (поиск без FTS5)",
+    "get_project_stats": "статистика по всем проектам",
+    "get_open_task_counts project": "без счётчиков агрегирует все открытые задачи",
+    "get_open_task_counts assignee": "без счётчиков агрегирует все открытые задачи",
+    "count_tasks": "COUNT(*) читает самый узкий индекс целиком",
+    "count_projects": "COUNT(*) читает самый узкий индекс целиком",
+    "count_users": "COUNT(*) читает самый узкий индекс целиком",
+}
+# Фильтры page_tasks, для которых есть составной индекс (фильтр, сортировка)
+PAGE_SORTED_FILTERS = {("project_id", "due_date"), ("assignee_id", "due_date")}
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+# Материализованные счётчики задач (по проекту и по исполнителю в разрезе статуса),
+# которые триггеры поддерживают при каждом изменении tasks. NULL хранится как 0.
+COUNTER_TABLES = {"project": "task_counts_by_project", "assignee": "task_counts_by_assignee"}
+
+
+def _counter_schema() -> list[str]:
+    statements = []
+    for key, table in COUNTER_TABLES.items():
+        column = f"{key}_id"
+        inc = (
+            f"INSERT INTO {table}({column}, status, count) "
+            f"VALUES (COALESCE(new.{column}, 0), new.status, 1) "
+            f"ON CONFLICT({column}, status) DO UPDATE SET count = count + 1;"
+        )
+        dec = (
+            f"UPDATE {table} SET count = count - 1 "
+            f"WHERE {column} = COALESCE(old.{column}, 0) AND status = old.status;"
+        )
+        statements += [
+            f"""CREATE TABLE IF NOT EXISTS {table}(
+                {column} INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY({column}, status)
+            ) WITHOUT ROWID;""",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON tasks BEGIN {inc} END;",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON tasks BEGIN {dec} END;",
+            f"""CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE OF status, {column} ON tasks
+                WHEN old.status IS NOT new.status OR old.{column} IS NOT new.{column}
+                BEGIN {dec} {inc} END;""",
+        ]
+    return statements
+
+
+# Журнал изменений для инкрементального обновления представлений. Вставки не
+# журналируются: id растут (AUTOINCREMENT), и новые строки — это id больше
+# запомненного sqlite_sequence. Триггеры UPDATE/DELETE увеличивают общий счётчик
+# и записывают его значение в строку журнала, одну на запись таблицы.
+TRACKED_TABLES = ("tasks", "projects", "users")
+
+
+def _change_log_schema() -> list[str]:
+    statements = [
+        """CREATE TABLE IF NOT EXISTS change_log(
+            table_name TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            seq INTEGER NOT NULL,
+            deleted INTEGER NOT NULL,
+            PRIMARY KEY(table_name, row_id)
+        ) WITHOUT ROWID;""",
+        "CREATE INDEX IF NOT EXISTS idx_change_log_seq ON change_log(table_name, seq);",
+        """CREATE TABLE IF NOT EXISTS change_seq(
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            seq INTEGER NOT NULL
+        );""",
+        "INSERT OR IGNORE INTO change_seq(id, seq) VALUES (0, 0);",
+    ]
+    for table in TRACKED_TABLES:
+        for event, deleted in (("UPDATE", 0), ("DELETE", 1)):
+            statements.append(
+                f"""CREATE TRIGGER IF NOT EXISTS {table}_log_{event.lower()}
+                AFTER {event} ON {table} BEGIN
+                    UPDATE change_seq SET seq = seq + 1 WHERE id = 0;
+                    INSERT INTO change_log(table_name, row_id, seq, deleted)
+                    VALUES ('{table}', old.id, (SELECT seq FROM change_seq WHERE id = 0), {deleted})
+                    ON CONFLICT(table_name, row_id)
+                    DO UPDATE SET seq = excluded.seq, deleted = excluded.deleted;
+                END;"""
+            )
+    return statements
+
+
+def _page_full_pass(order_by, kind, column) -> str | None:
+    # Почему страница page_* читает больше строк, чем LIMIT; None — не должна
+    if kind == "offset":
+        return "OFFSET пропускает строки по одной"
+    if kind == "after null" and order_by != "id":
+        return "после NULL страница идёт по индексу сортировки до LIMIT"
+    if column and column != order_by and order_by != "id" and (
+        (column, order_by) not in PAGE_SORTED_FILTERS
+    ):
+        return "фильтр и сортировка по разным колонкам: совпавшие строки сортируются"
+    return None
+
+
+def _is_full_pass(detail) -> bool:
+    # Строка плана, читающая всю таблицу или индекс (кроме FTS5), либо сортировка
+    # во временном B-дереве — первая строка появится только после чтения всех.
+    if "USE TEMP B-TREE" in detail:
+        return True
+    return detail.startswith("SCAN") and "VIRTUAL TABLE" not in detail
+
+
+def _page_order(order_by) -> str:
+    # id добавляется к сортировке, чтобы ключ (order_by, id) был уникальным
+    return "id" if order_by == "id" else f"{order_by}, id"
+
+
+def _keyset_predicate(order_by, cursor) -> tuple[str, list]:
+    # Условие «строка после курсора» для сортировки по _page_order(order_by)
+    value, row_id = _decode_cursor(cursor)
+    if order_by == "id":
+        return "id > ?", [row_id]
+    if value is None:
+        # NULL в SQLite сортируется первым
+        return f"(({order_by} IS NULL AND id > ?) OR {order_by} IS NOT NULL)", [row_id]
+    return f"({order_by} > ? OR ({order_by} = ? AND id > ?))", [value, value, row_id]
+
+
+def _where_sql(where) -> str:
+    return " WHERE " + " AND ".join(where) if where else ""
+
+
+def _fts_words(text) -> list[str]:
+    # Слова text так, как их индексирует unicode61: в нижнем регистре и без
+    # диакритики у латинских букв ("Café" -> "cafe"); кириллица ("ё", "й") и
+    # лигатуры не меняются.
+    folded = "".join(map(_strip_latin_mark, unicodedata.normalize("NFC", text)))
+    return FTS_TERM_RE.findall(folded.lower())
+
+
+def _strip_latin_mark(char) -> str:
+    base, *marks = unicodedata.normalize("NFD", char)
+    if not marks or not all(map(unicodedata.combining, marks)):
+        return char
+    return base if unicodedata.name(base, "").startswith("LATIN") else char
+
+
+def _like_pattern(text) -> str:
+    # Подстрока для LIKE ... ESCAPE '\': % и _ в запросе ищутся буквально
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _fts_query(terms) -> str:
+    # Каждое слово запроса — префиксный терм: "сроч" находит "срочное".
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _project_stats_from_row(r) -> dict:
+    total = r["total"]
+    return {
+        "project_status": r["project_status"],
+        "total": total,
+        "by_status": {
+            "pending": r["pending"],
+            "in_progress": r["in_progress"],
+            "completed": r["completed"],
+        },
+        "by_priority": {1: r["priority_1"], 2: r["priority_2"], 3: r["priority_3"]},
+        "overdue": r["overdue"],
+        "completion": 100.0 * r["completed"] / total if total else 0.0,
+    }
+
+
+def _encode_cursor(value, row_id) -> str:
+    raw = json.dumps([value, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor) -> tuple:
+    try:
+        value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError, AttributeError):
+        raise ValueError(f"Invalid cursor: {cursor!r}") from None
+    return value, row_id
+
+
 class DatabaseManager:
-    def __init__(self, db_path="tasks.db") -> None:
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
-        self.conn.execute("PRAGMA foreign_keys = ON;")
+    def __init__(
+        self, db_path="tasks.db", profile="balanced", pool_size=4, cache_size=0, slow_query_ms=None
+    ) -> None:
+        if profile not in PRAGMA_PROFILES:
+            raise ValueError(f"Invalid profile: {profile}")
+        self.profile = profile
+        self.instrumentation = None
+        self.pool = ConnectionPool(db_path, size=pool_size, configure=self._configure_connection)
+        self.conn = self.pool.writer
+        self._tx_depth = 0
+        self._tx_owner = None
+        self._tx_invalidated = set()
+        self._tx_callbacks = []
+        # Кэш get_*_by_id включается явно: cache_size — максимум записей на таблицу
+        self.caches = {}
+        if cache_size:
+            self.caches = {table: LRUCache(cache_size) for table in ("tasks", "projects", "users")}
+        self.fts_enabled = self._has_table("tasks_fts")
+        self.counters_enabled = self._has_table(COUNTER_TABLES["project"])
+        self.change_tracking_enabled = self._has_table("change_log")
+        if slow_query_ms is not None:
+            self.enable_instrumentation(slow_query_ms)
+
+    def enable_instrumentation(self, slow_query_ms=100.0) -> Instrumentation:
+        # Пока инструментовка выключена, вызовы идут напрямую в методы класса
+        self.disable_instrumentation()
+        self.instrumentation = Instrumentation(slow_query_ms)
+        self.instrumentation.attach(self)
+        return self.instrumentation
+
+    def disable_instrumentation(self) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.detach(self)
+            self.instrumentation = None
+
+    def _has_table(self, name) -> bool:
+        row = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name=?", (name,)
+        ).fetchone()
+        return row is not None
+
+    def _configure_connection(self, conn) -> None:
+        conn.execute("PRAGMA foreign_keys = ON;")
+        self._apply_profile(conn)
+        if self.instrumentation is not None:
+            self.instrumentation.hook_connection(conn)
+
+    def _apply_profile(self, conn) -> None:
+        for name, value in PRAGMA_PROFILES[self.profile].items():
+            conn.execute(f"PRAGMA {name} = {value};")
+
+    def in_own_transaction(self) -> bool:
+        # True — вызывающий поток сейчас внутри своего блока transaction()
+        return bool(self._tx_depth) and self._tx_owner == threading.get_ident()
+
+    def after_transaction(self, callback) -> None:
+        # callback(committed) — когда станет известно, осталось ли сделанное
+        # сейчас в базе: после COMMIT/ROLLBACK внешней транзакции или сразу после
+        # отката SAVEPOINT, внутри которого он зарегистрирован. Вне транзакции
+        # вызывается сразу с True. Выполняется под блокировкой писателя.
+        if not self.in_own_transaction():
+            callback(True)
+            return
+        self._tx_callbacks.append((self._tx_depth, callback))
+
+    @contextmanager
+    def _reader(self):
+        # Внутри своей транзакции поток читает через писателя, чтобы видеть
+        # собственные незакоммиченные изменения; иначе — через пул читателей.
+        if self.in_own_transaction():
+            yield self.conn
+        else:
+            with self.pool.reader() as conn:
+                yield conn
+
+    def pragmas(self) -> dict:
+        return {
+            name: self.conn.execute(f"PRAGMA {name};").fetchone()[0]
+            for name in PRAGMA_PROFILES[self.profile]
+        }
+
+    def checkpoint(self, mode="PASSIVE") -> tuple[int, int, int]:
+        # Возвращает (busy, страниц в WAL, перенесено страниц) как PRAGMA wal_checkpoint.
+        mode = str(mode).upper()
+        if mode not in CHECKPOINT_MODES:
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+        with self.pool.write_lock:
+            return tuple(self.conn.execute(f"PRAGMA wal_checkpoint({mode});").fetchone())
 
     def close(self) -> None:
-        self.conn.close()
+        self.pool.close()
+
+    @contextmanager
+    def transaction(self):
+        # Внутри блока методы не коммитят сами: один COMMIT/ROLLBACK на выходе.
+        # Вложенные блоки становятся SAVEPOINT и откатываются независимо.
+        # Блокировка писателя держится до конца блока, так что транзакция одна на все потоки.
+        with self.pool.write_lock:
+            depth = self._tx_depth
+            savepoint = f"sp_{depth}"
+            if depth:
+                self.conn.execute(f"SAVEPOINT {savepoint}")
+            elif not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            self._tx_depth += 1
+            self._tx_owner = threading.get_ident()
+            try:
+                yield self
+            except BaseException:
+                self._rollback_transaction(depth, savepoint)
+                raise
+            self._commit_transaction(depth, savepoint)
+
+    def _commit_transaction(self, depth, savepoint) -> None:
+        # Кэш сбрасывается после COMMIT: иначе читатель успеет положить в него
+        # старую строку уже под новым поколением.
+        try:
+            if depth:
+                self.conn.execute(f"RELEASE {savepoint}")
+            else:
+                self.conn.commit()
+        except BaseException:
+            # COMMIT не прошёл (например, SQLITE_BUSY): без отката транзакция
+            # осталась бы открытой на писателе
+            self._rollback_transaction(depth, savepoint)
+            raise
+        self._end_transaction(depth, True)
+
+    def _rollback_transaction(self, depth, savepoint) -> None:
+        try:
+            if depth:
+                self.conn.execute(f"ROLLBACK TO {savepoint}")
+                self.conn.execute(f"RELEASE {savepoint}")
+            else:
+                self.conn.rollback()
+        finally:
+            self._end_transaction(depth, False)
+
+    def _end_transaction(self, depth, committed) -> None:
+        self._tx_depth = depth
+        if not depth:
+            self._tx_owner = None
+            # Пока транзакция шла, другие потоки могли закэшировать старые
+            # закоммиченные строки — сбрасываем затронутые ключи ещё раз.
+            pending, self._tx_invalidated = self._tx_invalidated, set()
+            self._invalidate(*pending)
+        # После RELEASE судьба изменений решается в объемлющем блоке
+        if committed and depth:
+            self._tx_callbacks = [(min(level, depth), cb) for level, cb in self._tx_callbacks]
+            return
+        finished = [cb for level, cb in self._tx_callbacks if level > depth]
+        self._tx_callbacks = [item for item in self._tx_callbacks if item[0] <= depth]
+        for callback in finished:
+            callback(committed)
+
+    def _commit(self) -> None:
+        if not self._tx_depth:
+            self.conn.commit()
+
+    @contextmanager
+    def _write(self, *invalidate):
+        # invalidate — пары (таблица, id) для сброса из кэша после записи;
+        # id=None сбрасывает кэш таблицы целиком.
+        with self.pool.write_lock:
+            try:
+                yield self.conn
+                self._commit()
+            except BaseException:
+                # Вне transaction() неявная транзакция писателя иначе осталась бы
+                # открытой и держала блокировку базы до следующей удачной записи
+                if not self._tx_depth:
+                    self.conn.rollback()
+                raise
+            self._invalidate(*invalidate)
+
+    def _invalidate(self, *keys) -> None:
+        for table, key in keys:
+            cache = self.caches.get(table)
+            if cache is not None:
+                cache.invalidate(key)
+        if self._tx_depth:
+            self._tx_invalidated.update(keys)
+
+    def _get_cached(self, table, key, use_cache, load):
+        # В кэше лежат копии моделей: изменения у вызывающего кода не портят кэш.
+        # Свои незакоммиченные данные внутри транзакции в кэш не попадают.
+        # Отсутствующие id не кэшируются, поэтому после add_* сбрасывать нечего.
+        cache = self.caches.get(table) if use_cache else None
+        if cache is None or self.in_own_transaction():
+            return load()
+        value = cache.get(key)
+        if value is not MISSING:
+            return copy.copy(value)
+        generation = cache.generation
+        value = load()
+        if value is not None:
+            cache.put(key, copy.copy(value), generation)
+        return value
+
+    def _get_many(self, table, ids, hydrate, use_cache) -> dict:
+        # Сначала кэш, затем оставшиеся id из базы; отсутствующих в базе id в результате нет.
+        ids = list(dict.fromkeys(ids))
+        cache = self.caches.get(table) if use_cache and not self.in_own_transaction() else None
+        if cache is None:
+            return self._load_many(table, ids, hydrate)
+        found = {}
+        for key in ids:
+            value = cache.get(key)
+            if value is not MISSING:
+                found[key] = copy.copy(value)
+        generation = cache.generation
+        loaded = self._load_many(table, [key for key in ids if key not in found], hydrate)
+        for key, model in loaded.items():
+            cache.put(key, copy.copy(model), generation)
+        found.update(loaded)
+        return found
+
+    def _load_many(self, table, ids, hydrate) -> dict:
+        # Запросы WHERE id IN (...) порциями по MAX_SQL_VARIABLES
+        found = {}
+        with self._reader() as conn:
+            for start in range(0, len(ids), MAX_SQL_VARIABLES):
+                chunk = ids[start:start + MAX_SQL_VARIABLES]
+                marks = ",".join("?" * len(chunk))
+                for r in conn.execute(f"SELECT * FROM {table} WHERE id IN ({marks})", chunk):
+                    model = hydrate(r)
+                    found[model.id] = model
+        return found
+
+    def cache_stats(self) -> dict:
+        return {table: cache.stats() for table, cache in self.caches.items()}
+
+    def clear_cache(self) -> None:
+        for cache in self.caches.values():
+            cache.invalidate()
 
     def create_tables(self) -> None:
-        cur = self.conn.cursor()
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS users(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT NOT NULL,
-            email TEXT NOT NULL,
-            role TEXT NOT NULL,
-            registration_date TEXT NOT NULL
-        );
-        """)
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS projects(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            description TEXT,
-            start_date TEXT,
-            end_date TEXT,
-            status TEXT NOT NULL
-        );
-        """)
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS tasks(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            description TEXT,
-            priority INTEGER NOT NULL,
-            status TEXT NOT NULL,
-            due_date TEXT,
-            project_id INTEGER,
-            assignee_id INTEGER,
-            FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE SET NULL,
-            FOREIGN KEY(assignee_id) REFERENCES users(id) ON DELETE SET NULL
-        );
-        """)
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id);")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status  ON tasks(status);")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_tasks_due     ON tasks(due_date);")
-        self.conn.commit()
+        with self._write() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+            CREATE TABLE IF NOT EXISTS users(
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                username TEXT NOT NULL,
+                email TEXT NOT NULL,
+                role TEXT NOT NULL,
+                registration_date TEXT NOT NULL
+            );
+            """)
+            cur.execute("""
+            CREATE TABLE IF NOT EXISTS projects(
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                description TEXT,
+                start_date TEXT,
+                end_date TEXT,
+                status TEXT NOT NULL
+            );
+            """)
+            cur.execute("""
+            CREATE TABLE IF NOT EXISTS tasks(
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                description TEXT,
+                priority INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                due_date TEXT,
+                project_id INTEGER,
+                assignee_id INTEGER,
+                FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE SET NULL,
+                FOREIGN KEY(assignee_id) REFERENCES users(id) ON DELETE SET NULL
+            );
+            """)
+            for name, definition in MANAGED_INDEXES.items():
+                cur.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition};")
+            self._create_fts(cur)
+
+    def _create_fts(self, cur) -> None:
+        # Без FTS5 в сборке SQLite поиск остаётся на LIKE.
+        existed = self._has_table("tasks_fts")
+        try:
+            for statement in FTS_SCHEMA:
+                cur.execute(statement)
+        except sqlite3.OperationalError:
+            self.fts_enabled = False
+            return
+        if not existed:
+            cur.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild');")
+        self.fts_enabled = True
+
+    def explain(self, sql, params=()) -> list[str]:
+        with self._reader() as conn:
+            return [r["detail"] for r in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+    def analyze_indexes(self) -> list[dict]:
+        # Прогоняет EXPLAIN QUERY PLAN по всем SELECT, которые выполняют методы
+        # чтения, и возвращает запросы с полным проходом по таблице или индексу
+        # либо с сортировкой во временном B-дереве. expected=True — так задумано
+        # для этой пробы, причина в reason.
+        probes = self._read_probes()
+        report = []
+        for name, sql in self._capture_read_queries(probes):
+            plan = self.explain(sql)
+            scans = [detail for detail in plan if _is_full_pass(detail)]
+            if scans:
+                reason = probes[name][1]
+                report.append({
+                    "probe": name,
+                    "sql": sql,
+                    "plan": plan,
+                    "scans": scans,
+                    "expected": reason is not None,
+                    "reason": reason,
+                })
+        return report
+
+    def _capture_read_queries(self, probes) -> list[tuple[str, str]]:
+        # (имя пробы, SQL) для каждого нового SELECT. Внутри своей транзакции
+        # чтения идут через писателя, поэтому трассировка на нём видит все
+        # запросы; write_lock транзакции не пускает чужие записи.
+        seen = {}
+        with self.transaction():
+            try:
+                for name, (probe, _) in probes.items():
+                    statements = []
+                    self.conn.set_trace_callback(statements.append)
+                    probe()
+                    for sql in statements:
+                        if sql.lstrip().upper().startswith("SELECT"):
+                            seen.setdefault(" ".join(sql.split()), name)
+            finally:
+                self.conn.set_trace_callback(None)
+                if self.instrumentation is not None:
+                    self.instrumentation.hook_connection(self.conn)
+        return [(name, sql) for sql, name in seen.items()]
+
+    def _read_probes(self) -> dict:
+        # имя пробы -> (вызов, причина ожидаемого полного прохода или None)
+        probes = {
+            "get_task_by_id": lambda: self.get_task_by_id(0, use_cache=False),
+            "get_project_by_id": lambda: self.get_project_by_id(0, use_cache=False),
+            "get_user_by_id": lambda: self.get_user_by_id(0, use_cache=False),
+            "get_tasks_by_ids": lambda: self.get_tasks_by_ids([0], use_cache=False),
+            "get_projects_by_ids": lambda: self.get_projects_by_ids([0], use_cache=False),
+            "get_users_by_ids": lambda: self.get_users_by_ids([0], use_cache=False),
+            "get_all_tasks": self.get_all_tasks,
+            "get_all_projects": self.get_all_projects,
+            "get_all_users": self.get_all_users,
+            "get_tasks_by_project": lambda: self.get_tasks_by_project(0),
+            "get_tasks_by_user": lambda: self.get_tasks_by_user(0),
+            "search_tasks": lambda: self.search_tasks("probe"),
+            "search_like": lambda: self._search_like("probe"),
+            "get_overdue_tasks": self.get_overdue_tasks,
+            "get_overdue_tasks project": lambda: self.get_overdue_tasks(project_id=0),
+            "get_overdue_tasks assignee": lambda: self.get_overdue_tasks(assignee_id=0),
+            "get_project_stats": self.get_project_stats,
+            "get_project_stats ids": lambda: self.get_project_stats([0]),
+            "fetch_tasks_columnar": lambda: self.fetch_tasks_columnar({"project_id": 0}),
+            "get_task_counts project": lambda: self.get_task_counts("project", 0),
+            "get_task_counts assignee": lambda: self.get_task_counts("assignee", 0),
+            "get_open_task_counts project": lambda: self.get_open_task_counts("project"),
+            "get_open_task_counts assignee": lambda: self.get_open_task_counts("assignee"),
+            "count_tasks": self.count_tasks,
+            "count_projects": self.count_projects,
+            "count_users": self.count_users,
+        }
+        probes = {name: (probe, EXPECTED_FULL_PASSES.get(name)) for name, probe in probes.items()}
+        probes.update(self._page_probes())
+        return probes
+
+    def _page_probes(self) -> dict:
+        # page_* по каждой сортировке: по offset и с курсора (в том числе после
+        # NULL), без фильтра и с каждым фильтром
+        cursors = {"after": _encode_cursor(0, 0), "after null": _encode_cursor(None, 0)}
+        page_methods = {
+            "tasks": self.page_tasks, "projects": self.page_projects, "users": self.page_users,
+        }
+        probes = {}
+        for table, page in page_methods.items():
+            for order_by in PAGE_ORDERS[table]:
+                name = f"page_{table} {order_by}"
+                probes[f"{name} offset"] = (
+                    lambda page=page, o=order_by: page(None, 1, o, None, 1),
+                    _page_full_pass(order_by, "offset", None),
+                )
+                for kind, cursor in cursors.items():
+                    for column in (None, *PAGE_FILTERS[table]):
+                        f = {column: 0} if column else None
+                        probes[f"{name} {kind} {column or ''}".rstrip()] = (
+                            lambda page=page, o=order_by, c=cursor, f=f: page(c, 1, o, f),
+                            _page_full_pass(order_by, kind, column),
+                        )
+        return probes
+
+    def optimize(self, analyze=False) -> None:
+        # PRAGMA optimize дёшев и пересобирает статистику только там, где нужно;
+        # полный ANALYZE — после массовой загрузки данных.
+        with self.pool.write_lock:
+            self.conn.execute("ANALYZE;" if analyze else "PRAGMA optimize;")
+            self._commit()
+
+    def enable_counters(self) -> None:
+        # Счётчики необязательны: триггеры добавляют работу каждой записи в tasks
+        with self.transaction():
+            for statement in _counter_schema():
+                self.conn.execute(statement)
+            self.counters_enabled = True
+            self.rebuild_counters()
+
+    def rebuild_counters(self) -> None:
+        # Пересчёт с нуля — для восстановления после ручных правок базы
+        if not self.counters_enabled:
+            raise RuntimeError("task counters are not enabled")
+        with self.transaction():
+            for key, table in COUNTER_TABLES.items():
+                column = f"{key}_id"
+                self.conn.execute(f"DELETE FROM {table}")
+                self.conn.execute(
+                    f"""INSERT INTO {table}({column}, status, count)
+                        SELECT COALESCE({column}, 0), status, COUNT(*) FROM tasks GROUP BY 1, 2"""
+                )
+
+    def get_task_counts(self, key, key_id) -> dict[str, int]:
+        # key: "project" или "assignee"; без счётчиков — обычный GROUP BY по tasks
+        if key not in COUNTER_TABLES:
+            raise ValueError(f"Invalid counter key: {key}")
+        column = f"{key}_id"
+        if self.counters_enabled:
+            sql = (
+                f"SELECT status, count FROM {COUNTER_TABLES[key]}"
+                f" WHERE {column} = ? AND count > 0"
+            )
+        else:
+            sql = f"SELECT status, COUNT(*) FROM tasks WHERE {column} = ? GROUP BY status"
+        with self._reader() as conn:
+            return dict(conn.execute(sql, (key_id,)).fetchall())
+
+    def get_open_task_counts(self, key) -> dict[int, int]:
+        # Число незавершённых задач на каждый проект/исполнителя (0 — без привязки)
+        if key not in COUNTER_TABLES:
+            raise ValueError(f"Invalid counter key: {key}")
+        column = f"{key}_id"
+        if self.counters_enabled:
+            sql = (
+                f"SELECT {column}, SUM(count) FROM {COUNTER_TABLES[key]} "
+                f"WHERE status != 'completed' GROUP BY {column} HAVING SUM(count) > 0"
+            )
+        else:
+            sql = (
+                f"SELECT COALESCE({column}, 0), COUNT(*) FROM tasks "
+                f"WHERE status != 'completed' GROUP BY 1"
+            )
+        with self._reader() as conn:
+            return dict(conn.execute(sql).fetchall())
+
+    def enable_change_tracking(self) -> None:
+        # Как и счётчики, журнал необязателен: каждое UPDATE/DELETE пишет в него строку
+        with self.transaction():
+            for statement in _change_log_schema():
+                self.conn.execute(statement)
+            self.change_tracking_enabled = True
+
+    def data_version(self, table) -> tuple[int, int] | None:
+        # (последний выданный id, номер последнего изменения); None — журнал выключен
+        changes = self.get_changes(table)
+        return changes and changes["version"]
+
+    def get_changes(self, table, since=None) -> dict | None:
+        # Что изменилось в таблице после версии since: updated/deleted — id строк,
+        # существовавших в since; inserted — число строк, добавленных после since
+        # и ещё не удалённых. Без since — текущая версия и число строк (total).
+        # Всё читается одним снимком, цена зависит от числа изменений, а не от
+        # размера таблицы. None — журнал изменений выключен.
+        if table not in TRACKED_TABLES:
+            raise ValueError(f"Invalid table: {table}")
+        if not self.change_tracking_enabled:
+            return None
+        with self._reader() as conn:
+            # Внутри транзакции вызывающего снимок и так один
+            snapshot = not conn.in_transaction
+            if snapshot:
+                conn.execute("BEGIN")
+            try:
+                row = conn.execute(
+                    "SELECT (SELECT seq FROM sqlite_sequence WHERE name = ?), "
+                    "(SELECT seq FROM change_seq WHERE id = 0)",
+                    (table,),
+                ).fetchone()
+                version = (row[0] or 0, row[1] or 0)
+                if since is None:
+                    total = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                    return {"version": version, "total": total}
+                last_id, seq = since
+                rows = conn.execute(
+                    "SELECT row_id, deleted FROM change_log "
+                    "WHERE table_name = ? AND seq > ? AND row_id <= ?",
+                    (table, seq, last_id),
+                ).fetchall()
+                inserted = conn.execute(
+                    f"SELECT COUNT(*) FROM {table} WHERE id > ?", (last_id,)
+                ).fetchone()[0]
+            finally:
+                if snapshot:
+                    conn.rollback()
+        return {
+            "version": version,
+            "updated": [r[0] for r in rows if not r[1]],
+            "deleted": [r[0] for r in rows if r[1]],
+            "inserted": inserted,
+        }
 
     def add_task(self, task: Task) -> int:
-        cur = self.conn.cursor()
-        cur.execute(
-            """INSERT INTO tasks(title, description, priority, status, due_date, project_id, assignee_id)
-               VALUES(?,?,?,?,?,?,?)""",
-            (
-                task.title,
-                task.description,
-                task.priority,
-                task.status,
-                task.due_date.isoformat() if task.due_date else None,
-                task.project_id,
-                task.assignee_id,
-            ),
-        )
-        self.conn.commit()
+        with self._write() as conn:
+            cur = conn.execute(TASK_INSERT_SQL, _task_params(task))
         return cur.lastrowid
 
+    def add_tasks_bulk(self, tasks, chunk_size=DEFAULT_CHUNK_SIZE) -> list[int]:
+        return self._insert_bulk(TASK_INSERT_SQL, _task_params, tasks, chunk_size)
+
+    def _insert_bulk(self, sql, to_params, models, chunk_size) -> list[int]:
+        # Все чанки пишутся в одной транзакции: один commit вместо commit на строку.
+        # AUTOINCREMENT выдаёт id подряд, поэтому id чанка восстанавливаются
+        # по last_insert_rowid() без отдельного запроса на каждую строку.
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        ids: list[int] = []
+        models = iter(models)
+        with self.transaction():
+            while True:
+                chunk = list(islice(models, chunk_size))
+                if not chunk:
+                    break
+                self.conn.executemany(sql, [to_params(m) for m in chunk])
+                last_id = self.conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                first_id = last_id - len(chunk) + 1
+                for offset, model in enumerate(chunk):
+                    model.id = first_id + offset
+                ids.extend(range(first_id, last_id + 1))
+        return ids
+
+    def get_task_by_id(self, task_id, use_cache=True) -> Task | None:
+        return self._get_cached("tasks", task_id, use_cache, lambda: self._load_task(task_id))
 
-    def get_task_by_id(self, task_id) -> Task | None:
-        r = self.conn.execute("SELECT * FROM tasks WHERE id=?", (task_id,)).fetchone()
+    def get_tasks_by_ids(self, ids, use_cache=True) -> dict[int, Task]:
+        return self._get_many("tasks", ids, Task.from_row, use_cache)
+
+    def _load_task(self, task_id) -> Task | None:
+        with self._reader() as conn:
+            r = conn.execute("SELECT * FROM tasks WHERE id=?", (task_id,)).fetchone()
         if not r:
             return None
-        from models.task import Task
-        from datetime import datetime
-        due = datetime.fromisoformat(r["due_date"]) if r["due_date"] else None
-        t = Task(r["title"], r["description"], r["priority"], due, r["project_id"], r["assignee_id"])
-        t.id = r["id"]
-        t.status = r["status"]
-        return t
+        return Task.from_row(r)
 
     def get_all_tasks(self) -> list[Task]:
-        rows = self.conn.execute("SELECT * FROM tasks ORDER BY id").fetchall()
-        from models.task import Task
-        from datetime import datetime
-        result = []
-        for r in rows:
-            due = datetime.fromisoformat(r["due_date"]) if r["due_date"] else None
-        t = Task(r["title"], r["description"], r["priority"], due, r["project_id"], r["assignee_id"])
-        t.id = r["id"]; t.status = r["status"]
-        result.append(t)
-        return result
+        return list(self.iter_tasks())
+
+    def iter_tasks(self, batch_size=DEFAULT_BATCH_SIZE):
+        return self._iter_tasks("SELECT * FROM tasks ORDER BY id", (), batch_size)
+
+    def iter_tasks_by_project(self, project_id, batch_size=DEFAULT_BATCH_SIZE):
+        return self._iter_tasks(
+            "SELECT * FROM tasks WHERE project_id=? ORDER BY id", (project_id,), batch_size
+        )
+
+    def iter_tasks_by_user(self, user_id, batch_size=DEFAULT_BATCH_SIZE):
+        return self._iter_tasks(
+            "SELECT * FROM tasks WHERE assignee_id=? ORDER BY id", (user_id,), batch_size
+        )
+
+    def get_overdue_tasks(
+        self, now=None, project_id=None, assignee_id=None, limit=None
+    ) -> list[Task]:
+        # due_date хранится в ISO-формате, поэтому сравнение строк совпадает с
+        # хронологическим; условие status != 'completed' включает частичный индекс.
+        now = now or datetime.now()
+        sql = "SELECT * FROM tasks WHERE status != 'completed' AND due_date < ?"
+        params = [now.isoformat()]
+        if project_id is not None:
+            sql += " AND project_id = ?"
+            params.append(project_id)
+        if assignee_id is not None:
+            sql += " AND assignee_id = ?"
+            params.append(assignee_id)
+        sql += " ORDER BY due_date, id LIMIT ?"
+        params.append(-1 if limit is None else limit)
+        with self._reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [Task.from_row(r) for r in rows]
+
+    def page_tasks(
+        self, after=None, limit=DEFAULT_PAGE_SIZE, order_by="id", filters=None, offset=None
+    ):
+        return self._page("tasks", Task.from_row, after, limit, order_by, filters, offset)
+
+    def count_tasks(self, filters=None) -> int:
+        return self._count("tasks", filters)
+
+    def _page(self, table, hydrate, after, limit, order_by, filters, offset=None):
+        # Keyset-пагинация: вместо OFFSET продолжаем с ключа (order_by, id) последней
+        # строки предыдущей страницы, так что цена страницы не зависит от её номера.
+        # Возвращает (записи, курсор следующей страницы или None).
+        # offset (вместо after) — переход сразу к строке с этим номером, например
+        # при перетаскивании полосы прокрутки.
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        after = self._page_start(table, after, order_by, filters, offset)
+        if after is MISSING:
+            return [], None
+        where, params = self._filter_clauses(table, filters)
+        if after is not None:
+            clause, cursor_params = _keyset_predicate(order_by, after)
+            where.append(clause)
+            params.extend(cursor_params)
+        sql = f"SELECT * FROM {table}{_where_sql(where)} ORDER BY {_page_order(order_by)} LIMIT ?"
+        with self._reader() as conn:
+            rows = conn.execute(sql, params + [limit + 1]).fetchall()
+        if len(rows) <= limit:
+            return [hydrate(r) for r in rows], None
+        rows = rows[:limit]
+        return [hydrate(r) for r in rows], _encode_cursor(rows[-1][order_by], rows[-1]["id"])
+
+    def _page_start(self, table, after, order_by, filters, offset):
+        # Курсор, с которого начинается страница; MISSING — offset за концом выборки
+        if order_by not in PAGE_ORDERS[table]:
+            raise ValueError(f"Invalid order_by: {order_by}")
+        if offset is None or after is not None:
+            return after
+        return self._cursor_at(table, offset, order_by, filters)
+
+    def _cursor_at(self, table, offset, order_by, filters):
+        # Ключ строки перед offset. OFFSET всё равно перебирает offset записей,
+        # так что цена растёт со смещением; выбираются только order_by и id.
+        # С индексом по order_by (и фильтру) это проход по покрывающему индексу,
+        # но при сортировке по id идёт SCAN самой таблицы (rowid — её ключ), а
+        # фильтр без составного индекса с order_by сортирует все совпавшие строки.
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+        if not offset:
+            return None
+        where, params = self._filter_clauses(table, filters)
+        sql = (
+            f"SELECT {order_by}, id FROM {table}{_where_sql(where)}"
+            f" ORDER BY {_page_order(order_by)} LIMIT 1 OFFSET ?"
+        )
+        with self._reader() as conn:
+            row = conn.execute(sql, params + [offset - 1]).fetchone()
+        if row is None:
+            return MISSING          # offset за концом выборки
+        return _encode_cursor(row[0], row[1])
+
+    def _count(self, table, filters) -> int:
+        where, params = self._filter_clauses(table, filters)
+        sql = f"SELECT COUNT(*) FROM {table}{_where_sql(where)}"
+        with self._reader() as conn:
+            return conn.execute(sql, params).fetchone()[0]
+
+    @staticmethod
+    def _filter_clauses(table, filters) -> tuple[list[str], list]:
+        where, params = [], []
+        for column, value in (filters or {}).items():
+            if column not in PAGE_FILTERS[table]:
+                raise ValueError(f"Invalid filter: {column}")
+            where.append(f"{column} IS ?")
+            params.append(value)
+        return where, params
+
+    def fetch_tasks_columnar(self, filters=None, batch_size=DEFAULT_CHUNK_SIZE) -> TaskFrame:
+        # Срок переводится в секунды от эпохи на стороне SQLite, объекты Task не создаются
+        where, params = self._filter_clauses("tasks", filters)
+        sql = (
+            "SELECT id, priority, project_id, assignee_id, "
+            "CAST(strftime('%s', due_date) AS INTEGER), status FROM tasks"
+        )
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY id"
+        frame = TaskFrame()
+        with self._reader() as conn:
+            cur = conn.execute(sql, params)
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    frame.append(*row)
+        return frame
+
+    def _iter_tasks(self, sql, params, batch_size):
+        # Строки читаются порциями по batch_size, в памяти живёт только текущая порция.
+        # Подключение читателя занято, пока генератор не исчерпан или не закрыт.
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        with self._reader() as conn:
+            cur = conn.execute(sql, params)
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                for r in rows:
+                    yield Task.from_row(r)
 
     def update_task(self, task_id, **kwargs) -> bool:
         if not kwargs:
@@ -106,97 +1051,148 @@ class DatabaseManager:
             cols.append(f"{k}=?")
             params.append(v)
         params.append(task_id)
-        self.conn.execute(f"UPDATE tasks SET {', '.join(cols)} WHERE id=?", params)
-        self.conn.commit()
+        with self._write(("tasks", task_id)) as conn:
+            conn.execute(f"UPDATE tasks SET {', '.join(cols)} WHERE id=?", params)
         return True
 
+    def update_task_statuses(self, statuses) -> int:
+        # statuses — {task_id: статус}; все обновления одной транзакцией и одним COMMIT.
+        # Возвращает число обновлённых строк.
+        if not statuses:
+            return 0
+        keys = [("tasks", task_id) for task_id in statuses]
+        with self._write(*keys) as conn:
+            cur = conn.executemany(
+                "UPDATE tasks SET status=? WHERE id=?",
+                [(status, task_id) for task_id, status in statuses.items()],
+            )
+        return cur.rowcount
+
     def delete_task(self, task_id) -> bool:
-        self.conn.execute("DELETE FROM tasks WHERE id=?", (task_id,))
-        self.conn.commit()
+        with self._write(("tasks", task_id)) as conn:
+            conn.execute("DELETE FROM tasks WHERE id=?", (task_id,))
         return True
 
-    def search_tasks(self, query) -> list[Task]:
-        q = f"%{str(query).strip()}%"
-        rows = self.conn.execute(
-        "SELECT * FROM tasks WHERE title LIKE ? OR description LIKE ? ORDER BY id", (q, q)
-    ).fetchall()
-        from models.task import Task
-        from datetime import datetime
-        out = []
-        for r in rows:
-            due = datetime.fromisoformat(r["due_date"]) if r["due_date"] else None
-            t = Task(r["title"], r["description"], r["priority"], due, r["project_id"], r["assignee_id"])
-            t.id = r["id"]; t.status = r["status"]
-            out.append(t)
-        return out
+    def search_tasks(self, query, limit=None) -> list[Task]:
+        return [task for task, _ in self.search_task_snippets(query, limit)]
 
-    def get_tasks_by_project(self, project_id) -> list[Task]:
-        rows = self.conn.execute(
-        "SELECT * FROM tasks WHERE project_id=? ORDER BY id", (project_id,)
-        ).fetchall()
-        from models.task import Task
-        from datetime import datetime
-        out = []
-        for r in rows:
-            due = datetime.fromisoformat(r["due_date"]) if r["due_date"] else None
-        t = Task(r["title"], r["description"], r["priority"], due, r["project_id"], r["assignee_id"])
-        t.id = r["id"]; t.status = r["status"]
-        out.append(t)
-        return out
+    def search_task_snippets(self, query, limit=None, mark=("[", "]")) -> list[tuple[Task, str]]:
+        # Результаты по релевантности (bm25) с фрагментом текста, где совпадения
+        # обрамлены mark; без FTS5 — LIKE в порядке id, фрагментом служит заголовок.
+        backend, terms = self.search_key(query)
+        if backend == "like":
+            return [(t, t.title) for t in self._search_like(query, limit)]
+        with self._reader() as conn:
+            rows = conn.execute(
+                """SELECT tasks.*, snippet(tasks_fts, -1, ?, ?, '…', 12) AS snippet
+                   FROM tasks_fts JOIN tasks ON tasks.id = tasks_fts.rowid
+                   WHERE tasks_fts MATCH ?
+                   ORDER BY bm25(tasks_fts), tasks.id
+                   LIMIT ?""",
+                (mark[0], mark[1], _fts_query(terms), -1 if limit is None else limit),
+            ).fetchall()
+        return [(Task.from_row(r), r["snippet"]) for r in rows]
+
+    def search_key(self, query) -> tuple[str, tuple[str, ...]]:
+        # Каким поиском search_tasks выполнит query: ("fts", слова) или
+        # ("like", (подстрока,)). Термы приведены к регистру, в котором их
+        # сравнивает поиск, — по ключам можно понять, сужает ли запрос другой.
+        terms = _fts_words(str(query)) if self.fts_enabled else []
+        if terms:
+            return "fts", tuple(terms)
+        # LIKE в SQLite не различает регистр только у ASCII
+        return "like", (str(query).strip().translate(ASCII_LOWER),)
+
+    def _search_like(self, query, limit=None) -> list[Task]:
+        q = _like_pattern(str(query).strip())
+        with self._reader() as conn:
+            rows = conn.execute(
+                "SELECT * FROM tasks WHERE title LIKE ? ESCAPE '\\'"
+                " OR description LIKE ? ESCAPE '\\' ORDER BY id LIMIT ?",
+                (q, q, -1 if limit is None else limit),
+            ).fetchall()
+        return [Task.from_row(r) for r in rows]
+
+    def task_matches(self, task, query) -> bool:
+        # Условие search_tasks для уже загруженной задачи, без запроса к базе:
+        # по нему поиск по мере ввода уточняет прошлые результаты.
+        backend, terms = self.search_key(query)
+        texts = (task.title or "", task.description or "")
+        if backend == "like":
+            return any(terms[0] in text.translate(ASCII_LOWER) for text in texts)
+        words = _fts_words(" ".join(texts))
+        return all(any(word.startswith(term) for word in words) for term in terms)
 
+    def get_tasks_by_project(self, project_id) -> list[Task]:
+        return list(self.iter_tasks_by_project(project_id))
 
     def get_tasks_by_user(self, user_id) -> list[Task]:
-        rows = self.conn.execute(
-        "SELECT * FROM tasks WHERE assignee_id=? ORDER BY id", (user_id,)
-        ).fetchall()
-        from models.task import Task
-        from datetime import datetime
-        out = []
-        for r in rows:
-            due = datetime.fromisoformat(r["due_date"]) if r["due_date"] else None
-        t = Task(r["title"], r["description"], r["priority"], due, r["project_id"], r["assignee_id"])
-        t.id = r["id"]; t.status = r["status"]
-        out.append(t)
-        return out
+        return list(self.iter_tasks_by_user(user_id))
 
     def add_project(self, project: Project) -> int:
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO projects(name, description, start_date, end_date, status) VALUES(?,?,?,?,?)",
-            (
-                project.name,
-                project.description,
-                project.start_date.isoformat() if project.start_date else None,
-                project.end_date.isoformat() if project.end_date else None,
-                project.status,
-            ),
-        )
-        self.conn.commit()
+        with self._write() as conn:
+            cur = conn.execute(PROJECT_INSERT_SQL, _project_params(project))
         return cur.lastrowid
 
-    def get_project_by_id(self, project_id) -> Project | None:
-        r = self.conn.execute("SELECT * FROM projects WHERE id=?", (project_id,)).fetchone()
+    def add_projects_bulk(self, projects, chunk_size=DEFAULT_CHUNK_SIZE) -> list[int]:
+        return self._insert_bulk(PROJECT_INSERT_SQL, _project_params, projects, chunk_size)
+
+    def get_project_by_id(self, project_id, use_cache=True) -> Project | None:
+        return self._get_cached(
+            "projects", project_id, use_cache, lambda: self._load_project(project_id)
+        )
+
+    def get_projects_by_ids(self, ids, use_cache=True) -> dict[int, Project]:
+        return self._get_many("projects", ids, Project.from_row, use_cache)
+
+    def _load_project(self, project_id) -> Project | None:
+        with self._reader() as conn:
+            r = conn.execute("SELECT * FROM projects WHERE id=?", (project_id,)).fetchone()
         if not r:
             return None
-        from models.project import Project
-        from datetime import datetime
-        start = datetime.fromisoformat(r["start_date"]) if r["start_date"] else None
-        end = datetime.fromisoformat(r["end_date"]) if r["end_date"] else None
-        p = Project(r["name"], r["description"], start, end)
-        p.id = r["id"]; p.status = r["status"]
-        return p
+        return Project.from_row(r)
+
     def get_all_projects(self) -> list[Project]:
-        rows = self.conn.execute("SELECT * FROM projects ORDER BY id").fetchall()
-        from models.project import Project
-        from datetime import datetime
-        out = []
-        for r in rows:
-            start = datetime.fromisoformat(r["start_date"]) if r["start_date"] else None
-            end = datetime.fromisoformat(r["end_date"]) if r["end_date"] else None
-            p = Project(r["name"], r["description"], start, end)
-            p.id = r["id"]; p.status = r["status"]
-            out.append(p)
-        return out
+        with self._reader() as conn:
+            rows = conn.execute("SELECT * FROM projects ORDER BY id").fetchall()
+        return [Project.from_row(r) for r in rows]
+
+    def page_projects(
+        self, after=None, limit=DEFAULT_PAGE_SIZE, order_by="id", filters=None, offset=None
+    ):
+        return self._page("projects", Project.from_row, after, limit, order_by, filters, offset)
+
+    def count_projects(self, filters=None) -> int:
+        return self._count("projects", filters)
+
+    def get_project_stats(self, project_ids=None, now=None) -> dict[int, dict]:
+        # Один GROUP BY на порцию проектов: счётчики задач по статусам и приоритетам,
+        # число просроченных и процент выполнения. project_ids=None — все проекты.
+        now = (now or datetime.now()).isoformat()
+        sql = """SELECT p.id, p.status AS project_status, COUNT(t.id) AS total,
+                     COALESCE(SUM(t.status = 'pending'), 0) AS pending,
+                     COALESCE(SUM(t.status = 'in_progress'), 0) AS in_progress,
+                     COALESCE(SUM(t.status = 'completed'), 0) AS completed,
+                     COALESCE(SUM(t.priority = 1), 0) AS priority_1,
+                     COALESCE(SUM(t.priority = 2), 0) AS priority_2,
+                     COALESCE(SUM(t.priority = 3), 0) AS priority_3,
+                     COALESCE(SUM(t.status != 'completed' AND t.due_date < ?), 0) AS overdue
+                 FROM projects p LEFT JOIN tasks t ON t.project_id = p.id"""
+        if project_ids is None:
+            chunks = [None]
+        else:
+            ids = list(dict.fromkeys(project_ids))
+            chunks = [ids[i:i + MAX_SQL_VARIABLES] for i in range(0, len(ids), MAX_SQL_VARIABLES)]
+        stats = {}
+        with self._reader() as conn:
+            for chunk in chunks:
+                query, params = sql, [now]
+                if chunk is not None:
+                    query += f" WHERE p.id IN ({','.join('?' * len(chunk))})"
+                    params.extend(chunk)
+                for r in conn.execute(query + " GROUP BY p.id ORDER BY p.id", params):
+                    stats[r["id"]] = _project_stats_from_row(r)
+        return stats
 
     def update_project(self, project_id, **kwargs) -> bool:
         if not kwargs:
@@ -208,46 +1204,49 @@ class DatabaseManager:
             cols.append(f"{k}=?")
             params.append(v)
         params.append(project_id)
-        self.conn.execute(f"UPDATE projects SET {', '.join(cols)} WHERE id=?", params)
-        self.conn.commit()
+        with self._write(("projects", project_id)) as conn:
+            conn.execute(f"UPDATE projects SET {', '.join(cols)} WHERE id=?", params)
         return True
 
     def delete_project(self, project_id) -> bool:
-        self.conn.execute("DELETE FROM projects WHERE id=?", (project_id,))
-        self.conn.commit()
+        # ON DELETE SET NULL меняет project_id у задач, поэтому кэш задач сбрасывается целиком
+        with self._write(("projects", project_id), ("tasks", None)) as conn:
+            conn.execute("DELETE FROM projects WHERE id=?", (project_id,))
         return True
 
     def add_user(self, user: User) -> int:
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO users(username, email, role, registration_date) VALUES(?,?,?,?)",
-            (user.username, user.email, user.role, user.registration_date.isoformat()),
-        )
-        self.conn.commit()
+        with self._write() as conn:
+            cur = conn.execute(USER_INSERT_SQL, _user_params(user))
         return cur.lastrowid
 
-    def get_user_by_id(self, user_id) -> User | None:
-        r = self.conn.execute("SELECT * FROM users WHERE id=?", (user_id,)).fetchone()
+    def add_users_bulk(self, users, chunk_size=DEFAULT_CHUNK_SIZE) -> list[int]:
+        return self._insert_bulk(USER_INSERT_SQL, _user_params, users, chunk_size)
+
+    def get_user_by_id(self, user_id, use_cache=True) -> User | None:
+        return self._get_cached("users", user_id, use_cache, lambda: self._load_user(user_id))
+
+    def get_users_by_ids(self, ids, use_cache=True) -> dict[int, User]:
+        return self._get_many("users", ids, User.from_row, use_cache)
+
+    def _load_user(self, user_id) -> User | None:
+        with self._reader() as conn:
+            r = conn.execute("SELECT * FROM users WHERE id=?", (user_id,)).fetchone()
         if not r:
             return None
-        from models.user import User
-        from datetime import datetime
-        u = User(r["username"], r["email"], r["role"])
-        u.id = r["id"]
-        u.registration_date = datetime.fromisoformat(r["registration_date"])
-        return u
+        return User.from_row(r)
 
     def get_all_users(self) -> list[User]:
-        rows = self.conn.execute("SELECT * FROM users ORDER BY id").fetchall()
-        from models.user import User
-        from datetime import datetime
-        out = []
-        for r in rows:
-            u = User(r["username"], r["email"], r["role"])
-        u.id = r["id"]
-        u.registration_date = datetime.fromisoformat(r["registration_date"])
-        out.append(u)
-        return out
+        with self._reader() as conn:
+            rows = conn.execute("SELECT * FROM users ORDER BY id").fetchall()
+        return [User.from_row(r) for r in rows]
+
+    def page_users(
+        self, after=None, limit=DEFAULT_PAGE_SIZE, order_by="id", filters=None, offset=None
+    ):
+        return self._page("users", User.from_row, after, limit, order_by, filters, offset)
+
+    def count_users(self, filters=None) -> int:
+        return self._count("users", filters)
 
     def update_user(self, user_id, **kwargs) -> bool:
         if not kwargs:
@@ -257,11 +1256,12 @@ class DatabaseManager:
             cols.append(f"{k}=?")
             params.append(v)
         params.append(user_id)
-        self.conn.execute(f"UPDATE users SET {', '.join(cols)} WHERE id=?", params)
-        self.conn.commit()
+        with self._write(("users", user_id)) as conn:
+            conn.execute(f"UPDATE users SET {', '.join(cols)} WHERE id=?", params)
         return True
 
     def delete_user(self, user_id) -> bool:
-        self.conn.execute("DELETE FROM users WHERE id=?", (user_id,))
-        self.conn.commit()
+        # ON DELETE SET NULL меняет assignee_id у задач, поэтому кэш задач сбрасывается целиком
+        with self._write(("users", user_id), ("tasks", None)) as conn:
+            conn.execute("DELETE FROM users WHERE id=?", (user_id,))
         return True
\ No newline at end of file
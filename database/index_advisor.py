@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Советник по индексам: показывает запросы DatabaseManager, которые читают
+таблицу целиком или сортируют во временном B-дереве, и по запросу обновляет
+статистику планировщика.
+Запуск: python -m database.index_advisor database/tasks.db [--optimize | --analyze]
+"""
+
+import argparse
+
+from database.database_manager import DatabaseManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("db_path")
+    parser.add_argument("--optimize", action="store_true", help="выполнить PRAGMA optimize")
+    parser.add_argument("--analyze", action="store_true", help="выполнить полный ANALYZE")
+    parser.add_argument("--all", action="store_true", help="показать и ожидаемые полные выборки")
+    args = parser.parse_args()
+
+    db = DatabaseManager(args.db_path)
+    try:
+        db.create_tables()
+        if args.optimize or args.analyze:
+            db.optimize(analyze=args.analyze)
+        report = [r for r in db.analyze_indexes() if args.all or not r["expected"]]
+        for entry in report:
+            reason = f" (ожидаемо: {entry['reason']})" if entry["expected"] else ""
+            print(f"[{entry['probe']}]{reason}")
+            print(entry["sql"])
+            for detail in entry["plan"]:
+                print(f"    {detail}")
+        print(f"запросов с полным проходом: {len(report)}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+import functools
+import inspect
+import json
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+
+# Верхние границы корзин гистограммы задержек, мс; последняя корзина — всё, что дольше
+HISTOGRAM_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+# Для перцентилей храним последние SAMPLE_SIZE замеров каждого метода
+SAMPLE_SIZE = 1024
+PROGRESS_STEP = 1000
+# Эти методы не оборачиваются: управление ресурсами и транзакциями и сама
+# инструментовка; in_own_transaction вызывается внутри каждого чтения
+NOT_INSTRUMENTED = {
+    "close", "transaction", "in_own_transaction", "after_transaction",
+    "enable_instrumentation", "disable_instrumentation",
+    "pragmas", "explain", "analyze_indexes", "cache_stats", "clear_cache",
+}
+
+
+class MethodStats:
+    __slots__ = ("calls", "errors", "rows", "total_ms", "max_ms", "histogram", "samples")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+
+    def record(self, elapsed_ms, rows, failed) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.rows += rows
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.histogram[bisect_left(HISTOGRAM_BOUNDS_MS, elapsed_ms)] += 1
+        self.samples.append(elapsed_ms)
+
+    def snapshot(self) -> dict:
+        ordered = sorted(self.samples)
+
+        def percentile(p):
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else 0.0
+
+        labels = [f"<={bound}" for bound in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}"]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(percentile(0.50), 3),
+            "p95_ms": round(percentile(0.95), 3),
+            "p99_ms": round(percentile(0.99), 3),
+            "histogram_ms": dict(zip(labels, self.histogram)),
+        }
+
+
+def _count_rows(result) -> int:
+    if result is None or isinstance(result, bool):
+        return 0
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[0], list):
+        return len(result[0])       # (страница, курсор) из page_*
+    try:
+        return len(result)
+    except TypeError:
+        return 1
+
+
+class Instrumentation:
+    """Счётчики вызовов, гистограммы задержек и журнал медленных запросов.
+
+    Подключается к конкретному DatabaseManager через attach(): публичные методы
+    оборачиваются на уровне экземпляра, на подключения ставятся trace- и
+    progress-колбэки sqlite3. Пока инструментовка не подключена, накладных
+    расходов нет: экземпляр использует обычные методы класса.
+    """
+
+    def __init__(self, slow_query_ms=100.0, slow_log_size=200) -> None:
+        self.slow_query_ms = slow_query_ms
+        self.methods: dict[str, MethodStats] = {}
+        self.slow_log = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    # --- колбэки sqlite3 ---
+
+    def _frames(self) -> list:
+        frames = getattr(self._local, "frames", None)
+        if frames is None:
+            frames = self._local.frames = []
+        return frames
+
+    def _on_statement(self, sql) -> None:
+        for frame in self._frames():
+            frame["sql"].append(sql)
+
+    def _on_progress(self) -> int:
+        for frame in self._frames():
+            frame["vm_steps"] += PROGRESS_STEP
+        return 0
+
+    def hook_connection(self, conn) -> None:
+        conn.set_trace_callback(self._on_statement)
+        conn.set_progress_handler(self._on_progress, PROGRESS_STEP)
+
+    @staticmethod
+    def unhook_connection(conn) -> None:
+        conn.set_trace_callback(None)
+        conn.set_progress_handler(None, PROGRESS_STEP)
+
+    # --- обёртки методов ---
+
+    def attach(self, db) -> None:
+        for name, method in inspect.getmembers(db, inspect.ismethod):
+            if not name.startswith("_") and name not in NOT_INSTRUMENTED:
+                setattr(db, name, self._wrap(name, method))
+        for conn in db.pool.connections():
+            self.hook_connection(conn)
+
+    def detach(self, db) -> None:
+        for name in list(vars(db)):
+            if getattr(vars(db)[name], "__instrumented__", False):
+                delattr(db, name)
+        for conn in db.pool.connections():
+            self.unhook_connection(conn)
+
+    def _wrap(self, name, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            frame = self._enter()
+            failed = True
+            try:
+                result = method(*args, **kwargs)
+                failed = False
+            finally:
+                if failed:
+                    self._exit(name, frame, 0, True)
+            if inspect.isgenerator(result):
+                return self._wrap_generator(name, frame, result)
+            self._exit(name, frame, _count_rows(result), False)
+            return result
+
+        wrapper.__instrumented__ = True
+        return wrapper
+
+    def _wrap_generator(self, name, frame, gen):
+        # Время генератора — от вызова до исчерпания или закрытия; запросы
+        # приписываются ему, только пока выполняется его тело.
+        rows, failed = 0, True
+        self._pop(frame)
+        try:
+            while True:
+                self._frames().append(frame)
+                try:
+                    item = next(gen)
+                except StopIteration:
+                    break
+                finally:
+                    self._pop(frame)
+                rows += 1
+                yield item
+            failed = False
+        except GeneratorExit:
+            failed = False
+            gen.close()
+            raise
+        finally:
+            self._exit(name, frame, rows, failed)
+
+    def _pop(self, frame) -> None:
+        frames = self._frames()
+        for i in range(len(frames) - 1, -1, -1):
+            if frames[i] is frame:
+                del frames[i]
+                return
+
+    def _enter(self) -> dict:
+        frame = {"started": time.perf_counter(), "sql": [], "vm_steps": 0}
+        self._frames().append(frame)
+        return frame
+
+    def _exit(self, name, frame, rows, failed) -> None:
+        elapsed_ms = (time.perf_counter() - frame["started"]) * 1000
+        self._pop(frame)
+        with self._lock:
+            stats = self.methods.get(name)
+            if stats is None:
+                stats = self.methods[name] = MethodStats()
+            stats.record(elapsed_ms, rows, failed)
+            if elapsed_ms >= self.slow_query_ms:
+                self.slow_log.append({
+                    "method": name,
+                    "ms": round(elapsed_ms, 3),
+                    "rows": rows,
+                    "vm_steps": frame["vm_steps"],
+                    "sql": frame["sql"],
+                    "at": datetime.now().isoformat(),
+                })
+
+    # --- экспорт ---
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "slow_query_ms": self.slow_query_ms,
+                "methods": {name: stats.snapshot() for name, stats in sorted(self.methods.items())},
+                "slow_queries": list(self.slow_log),
+            }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False, **kwargs)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.methods.clear()
+            self.slow_log.clear()
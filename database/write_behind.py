@@ -0,0 +1,214 @@
+import itertools
+import threading
+import time
+
+from database.database_manager import DEFAULT_BATCH_SIZE
+from models.task import VALID_TASK_STATUSES
+
+# buffered — update() возвращается сразу, изменение попадёт в базу со
+#            следующей группой; при падении процесса теряется то, что не успело
+#            уйти (не дольше max_delay плюс время одного COMMIT).
+# committed — update() ждёт COMMIT своей группы: гарантии как у прямой записи,
+#            но один COMMIT делится между всеми потоками, писавшими в это окно.
+# Надёжность самого COMMIT (fsync) задаётся профилем PRAGMA базы.
+DURABILITY_MODES = ("buffered", "committed")
+DEFAULT_MAX_DELAY = 0.05
+
+
+class WriteBehindClosedError(RuntimeError):
+    pass
+
+
+class _Group:
+    """Обновления, которые уйдут в базу одной транзакцией."""
+
+    __slots__ = ("statuses", "versions", "started", "done", "error")
+
+    def __init__(self) -> None:
+        self.statuses = {}
+        self.versions = {}      # task_id -> номер последнего update() этой задачи
+        self.started = None
+        self.done = threading.Event()
+        self.error = None
+
+    def wait(self, timeout=None) -> None:
+        if not self.done.wait(timeout):
+            raise TimeoutError("write-behind group was not committed in time")
+        if self.error is not None:
+            raise self.error
+
+
+class WriteBehindQueue:
+    """Отложенная запись статусов задач с групповым коммитом.
+
+    Обновления копятся в словаре {task_id: статус} — повторное обновление той же
+    задачи заменяет предыдущее (побеждает последнее). Фоновый поток сбрасывает
+    накопленное одной транзакцией, как только набралось max_batch задач или с
+    первого обновления прошло max_delay секунд. flush() — барьер: после него
+    в базе всё, что было поставлено в очередь до вызова.
+    """
+
+    def __init__(
+        self, db, max_batch=DEFAULT_BATCH_SIZE, max_delay=DEFAULT_MAX_DELAY, durability="buffered"
+    ) -> None:
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Invalid durability: {durability}")
+        if max_batch < 1:
+            raise ValueError("max_batch must be positive")
+        self.db = db
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.durability = durability
+        self.groups_committed = 0
+        self.updates_committed = 0
+        self.groups_failed = 0
+        self._error = None
+        self._group = _Group()
+        self._versions = itertools.count()
+        self._inflight = None
+        self._flush_requested = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def update(self, task_id, new_status) -> bool:
+        # Ошибка в одной записи сорвала бы всю группу, поэтому статус проверяется сразу
+        if new_status not in VALID_TASK_STATUSES:
+            raise ValueError(f"Invalid status: {new_status}")
+        if self.db.in_own_transaction():
+            return self._update_in_transaction(task_id, new_status)
+        group = self._enqueue(task_id, new_status)
+        if self.durability == "committed":
+            group.wait()
+        return True
+
+    def _enqueue(self, task_id, new_status) -> _Group:
+        with self._cond:
+            if self._closed:
+                raise WriteBehindClosedError("write-behind queue is closed")
+            group = self._group
+            if not group.statuses:
+                group.started = time.monotonic()
+            group.statuses[task_id] = new_status
+            group.versions[task_id] = next(self._versions)
+            if len(group.statuses) in (1, self.max_batch):
+                self._cond.notify_all()
+            return group
+
+    def _update_in_transaction(self, task_id, new_status) -> bool:
+        # Запись входит в транзакцию вызывающего. Фоновый поток сейчас ждёт
+        # блокировку писателя, так что отложенное обновление этой задачи ещё в
+        # очереди. Оно уже подтверждено, поэтому снимается только после COMMIT
+        # (иначе затрёт эту запись); при откате оно уйдёт в базу как обычно.
+        with self._cond:
+            version = self._group.versions.get(task_id)
+        updated = self.db.update_task(task_id, status=new_status)
+        if version is not None:
+            self.db.after_transaction(
+                lambda committed: committed and self._supersede(task_id, version)
+            )
+        return updated
+
+    def _supersede(self, task_id, version) -> None:
+        # Обновление, поставленное после записи в транзакции, остаётся в очереди
+        with self._cond:
+            group = self._group
+            if group.versions.get(task_id) != version:
+                return
+            del group.statuses[task_id]
+            del group.versions[task_id]
+            if not group.statuses:
+                # Группа опустела: ждущим её commit'а больше нечего ждать
+                self._group = _Group()
+                group.done.set()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._group.statuses)
+
+    def flush(self, timeout=None) -> None:
+        # Поднимает ошибку группы, упавшей после прошлого flush(), даже если
+        # её обновления были поставлены в режиме buffered и никто их не ждал.
+        if self.db.in_own_transaction():
+            raise RuntimeError("flush() inside a transaction would wait for its own write lock")
+        with self._cond:
+            waiting = [g for g in (self._inflight, self._group) if g is not None and g.statuses]
+            if self._group.statuses:
+                self._flush_requested = True
+                self._cond.notify_all()
+        for group in waiting:
+            group.wait(timeout)
+        with self._cond:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def close(self, timeout=None) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        with self._cond:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "pending": len(self._group.statuses),
+                "groups_committed": self.groups_committed,
+                "updates_committed": self.updates_committed,
+                "groups_failed": self.groups_failed,
+                "durability": self.durability,
+            }
+
+    def _wait_ready(self) -> bool:
+        # Ждёт, пока текущую группу пора сбрасывать; False — очередь закрыта и пуста
+        with self._cond:
+            while True:
+                group = self._group
+                if group.statuses:
+                    remaining = group.started + self.max_delay - time.monotonic()
+                    if self._group_full(group) or remaining <= 0:
+                        return True
+                    self._cond.wait(remaining)
+                elif self._closed:
+                    return False
+                else:
+                    self._cond.wait()
+
+    def _group_full(self, group) -> bool:
+        return self._closed or self._flush_requested or len(group.statuses) >= self.max_batch
+
+    def _take_group(self) -> _Group:
+        with self._cond:
+            group, self._group = self._group, _Group()
+            self._inflight = group
+            self._flush_requested = False
+            return group
+
+    def _run(self) -> None:
+        while self._wait_ready():
+            # Группа забирается уже под блокировкой писателя: пока транзакция
+            # вызывающего открыта, группа остаётся в очереди, и после её COMMIT
+            # из группы снимаются значения, которые транзакция уже перезаписала.
+            with self.db.pool.write_lock:
+                group = self._take_group()
+                try:
+                    self.db.update_task_statuses(group.statuses)
+                except Exception as exc:
+                    group.error = exc
+            with self._cond:
+                self._inflight = None
+                if group.error is None:
+                    self.groups_committed += 1
+                    self.updates_committed += len(group.statuses)
+                else:
+                    self.groups_failed += 1
+                    if self.durability == "buffered":
+                        self._error = group.error
+            group.done.set()
@@ -1,43 +1,104 @@
 #!/usr/bin/env python3
 """
-Главный файл приложения "Система управления библиотекой"
+Главный файл приложения "Система управления задачами"
 Запускает GUI приложение с использованием архитектуры MVC
 """
 
+import argparse
 import os
 import sys
-from tkinter import messagebox
+import time
 
 # Добавляем путь к модулям проекта
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-try:
-    from controllers.book_controller import BookController
-    from controllers.loan_controller import LoanController
-    from controllers.reader_controller import ReaderController
-    from database.database_manager import DatabaseManager
-    from views.main_window import MainWindow
-except ImportError as e:
-    print(f"Ошибка импорта модулей: {e}")
-    print("Убедитесь, что все файлы проекта созданы согласно заданию")
-    sys.exit(1)
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "database", "tasks.db")
 
 
-def main():
+class StartupTimer:
+    """Отметки времени запуска для --profile-startup; выключенный ничего не пишет."""
+
+    def __init__(self, enabled=False) -> None:
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.marks = []
+
+    def mark(self, name) -> None:
+        if self.enabled:
+            self.marks.append((name, time.perf_counter()))
+
+    def report(self) -> str:
+        lines = ["Время запуска (с начала, шаг):"]
+        previous = self.started
+        for name, moment in self.marks:
+            total_ms = (moment - self.started) * 1000
+            step_ms = (moment - previous) * 1000
+            lines.append(f"  {total_ms:8.1f} мс  {step_ms:+8.1f} мс  {name}")
+            previous = moment
+        return "\n".join(lines)
+
+
+def ensure_change_tracking(db_manager) -> None:
+    # Журнал изменений нужен таблицам вкладок для инкрементального обновления.
+    # Включение — запись в базу, поэтому только при первом запуске: иначе старт
+    # ждал бы блокировку писателя, пока базу заполняет пакетная загрузка.
+    if not db_manager.change_tracking_enabled:
+        db_manager.enable_change_tracking()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Система управления задачами")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="путь к файлу базы SQLite")
+    parser.add_argument(
+        "--profile-startup", action="store_true",
+        help="напечатать в stderr, сколько заняли этапы запуска до первого окна",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Главная функция приложения"""
+    args = parse_args(argv)
+    timer = StartupTimer(args.profile_startup)
+
+    # Тяжёлые модули импортируются здесь, а модули представлений — главным
+    # окном при первом выборе их вкладки
+    from tkinter import messagebox
+
+    try:
+        from controllers.project_controller import ProjectController
+        from controllers.task_controller import TaskController
+        from controllers.user_controller import UserController
+        from database.database_manager import DatabaseManager
+        from views.main_window import MainWindow
+    except ImportError as e:
+        print(f"Ошибка импорта модулей: {e}")
+        print("Убедитесь, что все файлы проекта созданы согласно заданию")
+        sys.exit(1)
+    timer.mark("импорт модулей")
+
     try:
         # Инициализация базы данных
-        db_manager = DatabaseManager("database/library.db")
+        db_manager = DatabaseManager(args.db)
         db_manager.create_tables()
+        ensure_change_tracking(db_manager)
+        timer.mark("открытие базы")
 
         # Инициализация контроллеров
-        book_controller = BookController(db_manager)
-        reader_controller = ReaderController(db_manager)
-        loan_controller = LoanController(db_manager)
+        task_controller = TaskController(db_manager)
+        project_controller = ProjectController(db_manager)
+        user_controller = UserController(db_manager)
 
         # Создание и запуск главного окна
-        root = MainWindow(book_controller, reader_controller, loan_controller)
+        root = MainWindow(task_controller, project_controller, user_controller, timer=timer)
+        timer.mark("главное окно")
+        if args.profile_startup:
+            # Дорисовать окно и первую вкладку; её данные догружаются в фоне
+            root.update()
+            timer.mark("первое окно на экране")
+            print(timer.report(), file=sys.stderr)
         root.mainloop()
+        db_manager.close()
 
     except Exception as e:
         messagebox.showerror("Ошибка", f"Ошибка запуска приложения: {e}")
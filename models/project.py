@@ -1,6 +1,10 @@
 from datetime import datetime
 
+VALID_PROJECT_STATUSES = {"active", "completed", "on_hold"}
+
 class Project:
+    __slots__ = ("id", "name", "description", "start_date", "end_date", "status")
+
     def __init__(self, name, description, start_date, end_date) -> None:
         self.id = None
         self.name = str(name).strip()
@@ -13,6 +17,19 @@ class Project:
         self.end_date = end_date
         self.status = "active"
 
+    @classmethod
+    def from_row(cls, row) -> "Project":
+        # Для строк из базы: объект собирается напрямую, минуя проверки __init__
+        project = cls.__new__(cls)
+        project.id = row["id"]
+        project.name = row["name"]
+        project.description = row["description"]
+        start, end = row["start_date"], row["end_date"]
+        project.start_date = datetime.fromisoformat(start) if start else None
+        project.end_date = datetime.fromisoformat(end) if end else None
+        project.status = row["status"]
+        return project
+
     def update_status(self, new_status) -> bool:
         if new_status not in VALID_PROJECT_STATUSES:
             raise ValueError(f"Invalid status: {new_status}")
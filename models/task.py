@@ -1,6 +1,14 @@
 from datetime import datetime
 
+VALID_TASK_STATUSES = {"pending", "in_progress", "completed"}
+
 class Task:
+    # __slots__ вместо __dict__ у каждого экземпляра: заметно меньше памяти,
+    # когда в отчётах в памяти держатся миллионы задач
+    __slots__ = (
+        "id", "title", "description", "priority", "status", "due_date", "project_id", "assignee_id",
+    )
+
     def __init__(self, title, description, priority, due_date, project_id, assignee_id) -> None:
         self.id = None
         self.title = str(title).strip()
@@ -15,6 +23,22 @@ class Task:
         self.project_id = project_id
         self.assignee_id = assignee_id
 
+    @classmethod
+    def from_row(cls, row) -> "Task":
+        # Для строк из базы: они уже прошли валидацию при вставке, поэтому
+        # объект собирается напрямую, минуя проверки __init__.
+        task = cls.__new__(cls)
+        task.id = row["id"]
+        task.title = row["title"]
+        task.description = row["description"]
+        task.priority = row["priority"]
+        task.status = row["status"]
+        due = row["due_date"]
+        task.due_date = datetime.fromisoformat(due) if due else None
+        task.project_id = row["project_id"]
+        task.assignee_id = row["assignee_id"]
+        return task
+
     def update_status(self, new_status) -> bool:
         if new_status not in VALID_TASK_STATUSES:
             raise ValueError(f"Invalid status: {new_status}")
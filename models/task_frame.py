@@ -0,0 +1,113 @@
+import calendar
+from array import array
+from datetime import datetime
+
+# Коды статусов фиксированы, чтобы фреймы из разных запросов были сопоставимы;
+# неизвестные статусы получают следующие коды в пределах одного фрейма.
+STATUS_CODES = ("pending", "in_progress", "completed")
+COMPLETED = STATUS_CODES.index("completed")
+NULL_ID = 0
+NO_DUE = -(2 ** 63)
+
+
+def to_timestamp(value: datetime) -> int:
+    # Наивное время трактуется как UTC — так же, как strftime('%s') в SQLite
+    return calendar.timegm(value.timetuple())
+
+
+class TaskFrame:
+    """Колоночное представление набора задач для аналитики.
+
+    Каждая колонка — массив из модуля array: id и внешние ключи (int64, NULL = 0),
+    приоритет (int8), код статуса (int8) и срок в секундах от эпохи (int64,
+    NO_DUE для задач без срока). Маски — bytearray из 0/1 той же длины.
+    """
+
+    __slots__ = (
+        "ids", "priorities", "project_ids", "assignee_ids", "due", "status_codes", "statuses",
+    )
+
+    def __init__(self, statuses=STATUS_CODES) -> None:
+        self.ids = array("q")
+        self.priorities = array("b")
+        self.project_ids = array("q")
+        self.assignee_ids = array("q")
+        self.due = array("q")
+        self.status_codes = array("b")
+        self.statuses = list(statuses)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, task_id, priority, project_id, assignee_id, due_ts, status) -> None:
+        self.ids.append(task_id)
+        self.priorities.append(priority)
+        self.project_ids.append(NULL_ID if project_id is None else project_id)
+        self.assignee_ids.append(NULL_ID if assignee_id is None else assignee_id)
+        self.due.append(NO_DUE if due_ts is None else due_ts)
+        self.status_codes.append(self.status_code(status))
+
+    def status_code(self, status) -> int:
+        try:
+            return self.statuses.index(status)
+        except ValueError:
+            self.statuses.append(status)
+            return len(self.statuses) - 1
+
+    def mask(self, status=None, priority=None, project_id=None, assignee_id=None) -> bytearray:
+        # Пересечение условий на равенство; None — условие не задано
+        result = bytearray(b"\x01") * len(self)
+        code = None
+        if status is not None:
+            code = self.statuses.index(status) if status in self.statuses else -1
+        checks = [
+            (self.status_codes, code),
+            (self.priorities, priority),
+            (self.project_ids, project_id),
+            (self.assignee_ids, assignee_id),
+        ]
+        for column, value in checks:
+            if value is not None:
+                result = bytearray(m and v == value for m, v in zip(result, column))
+        return result
+
+    def filter(self, mask) -> "TaskFrame":
+        frame = TaskFrame(self.statuses)
+        for name in ("ids", "priorities", "project_ids", "assignee_ids", "due", "status_codes"):
+            source = getattr(self, name)
+            getattr(frame, name).extend(v for v, keep in zip(source, mask) if keep)
+        return frame
+
+    def where(self, **conditions) -> "TaskFrame":
+        return self.filter(self.mask(**conditions))
+
+    def count_by_status(self) -> dict:
+        counts = [0] * len(self.statuses)
+        for code in self.status_codes:
+            counts[code] += 1
+        return dict(zip(self.statuses, counts))
+
+    def overdue_mask(self, now=None) -> bytearray:
+        now_ts = to_timestamp(now or datetime.now())
+        return bytearray(
+            due != NO_DUE and due < now_ts and code != COMPLETED
+            for due, code in zip(self.due, self.status_codes)
+        )
+
+    def count_overdue(self, now=None) -> int:
+        return sum(self.overdue_mask(now))
+
+    def as_numpy(self) -> dict:
+        # Представления NumPy поверх тех же буферов, без копирования
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("NumPy is required for TaskFrame.as_numpy()") from None
+        return {
+            "ids": np.frombuffer(self.ids, dtype=np.int64),
+            "priorities": np.frombuffer(self.priorities, dtype=np.int8),
+            "project_ids": np.frombuffer(self.project_ids, dtype=np.int64),
+            "assignee_ids": np.frombuffer(self.assignee_ids, dtype=np.int64),
+            "due": np.frombuffer(self.due, dtype=np.int64),
+            "status_codes": np.frombuffer(self.status_codes, dtype=np.int8),
+        }
@@ -5,6 +5,8 @@ VALID_ROLES = {"admin", "manager", "developer"}
 EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
 
 class User:
+    __slots__ = ("id", "username", "email", "role", "registration_date")
+
     def __init__(self, username, email, role) -> None:
         username = str(username).strip()
         email = str(email).strip()
@@ -23,6 +25,17 @@ class User:
         self.role = role
         self.registration_date = datetime.now()
 
+    @classmethod
+    def from_row(cls, row) -> "User":
+        # Для строк из базы: без повторной проверки email регулярным выражением
+        user = cls.__new__(cls)
+        user.id = row["id"]
+        user.username = row["username"]
+        user.email = row["email"]
+        user.role = row["role"]
+        user.registration_date = datetime.fromisoformat(row["registration_date"])
+        return user
+
     def _is_valid_email(self, email) -> bool:
         return bool(EMAIL_RE.match(str(email).strip()))
 
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from controllers.async_controllers import (
+    AsyncProjectController,
+    AsyncTaskController,
+    AsyncUserController,
+)
+from database.async_executor import AsyncExecutor
+from database.database_manager import DatabaseManager
+
+
+class TestAsyncControllers:
+    """Тесты для асинхронных контроллеров"""
+
+    def setup_method(self):
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()                          # Windows fix
+        self.db_manager = DatabaseManager(self.temp_db.name)
+        self.db_manager.create_tables()
+
+    def teardown_method(self):
+        self.db_manager.close()
+        import time
+        for _ in range(10):                 # маленький retry, пока ОС отпустит lock
+            try:
+                os.unlink(self.temp_db.name)
+                break
+            except PermissionError:
+                time.sleep(0.05)
+
+    def run(self, scenario, **kwargs):
+        # Исполнитель создаётся внутри цикла событий и закрывается после сценария
+        async def main():
+            executor = AsyncExecutor(self.db_manager, **kwargs)
+            try:
+                return await scenario(
+                    AsyncTaskController(executor),
+                    AsyncProjectController(executor),
+                    AsyncUserController(executor),
+                )
+            finally:
+                executor.close()
+        return asyncio.run(main())
+
+    def test_crud(self):
+        """Тест тех же методов, что и у синхронных контроллеров"""
+        async def scenario(tasks, projects, users):
+            project_id = await projects.add_project("Проект", "", datetime.now(), None)
+            user_id = await users.add_user("async_user", "async@example.com", "developer")
+            due = datetime.now() + timedelta(days=1)
+            task_id = await tasks.add_task("Асинхронная", "Описание", 2, due, project_id, user_id)
+            assert await tasks.update_task_status(task_id, "completed")
+            task = await tasks.get_task(task_id)
+            assert task.title == "Асинхронная"
+            assert task.status == "completed"
+            assert await projects.get_project_progress(project_id) == 100.0
+            assert [t.id for t in await users.get_user_tasks(user_id)] == [task_id]
+            assert await tasks.delete_task(task_id)
+            assert await tasks.get_task(task_id) is None
+
+        self.run(scenario)
+
+    def test_concurrent_reads(self):
+        """Тест параллельных чтений через gather"""
+        async def scenario(tasks, projects, users):
+            ids = [await tasks.add_task(f"Задача {i}", "", 1, None, None, None) for i in range(5)]
+            found = await asyncio.gather(*(tasks.get_task(i) for i in ids))
+            assert [t.title for t in found] == [f"Задача {i}" for i in range(5)]
+
+        self.run(scenario)
+
+    def test_streaming(self):
+        """Тест потокового чтения и досрочного выхода из цикла"""
+        async def scenario(tasks, projects, users):
+            for i in range(25):
+                await tasks.add_task(f"Задача {i}", "", 1, None, None, None)
+            titles = [task.title async for task in tasks.iter_tasks(batch_size=4)]
+            assert titles == [f"Задача {i}" for i in range(25)]
+
+            async for task in tasks.iter_tasks(batch_size=4):
+                break
+            # Читатель вернулся в пул, база доступна для следующих вызовов
+            assert len(await tasks.get_all_tasks()) == 25
+
+        self.run(scenario)
+
+    def test_transaction(self):
+        """Тест асинхронной транзакции: видимость своих записей и откат"""
+        async def scenario(tasks, projects, users):
+            async with tasks.transaction():
+                task_id = await tasks.add_task("В транзакции", "", 1, None, None, None)
+                assert (await tasks.get_task(task_id)).title == "В транзакции"
+                assert [t.id async for t in tasks.iter_tasks()] == [task_id]
+
+            with pytest.raises(RuntimeError):
+                async with tasks.transaction():
+                    await tasks.add_task("Откатится", "", 1, None, None, None)
+                    raise RuntimeError("boom")
+
+            assert [t.title for t in await tasks.get_all_tasks()] == ["В транзакции"]
+
+        self.run(scenario)
+
+    def test_writes_wait_for_transaction(self):
+        """Тест: запись из другой задачи не попадает внутрь чужой транзакции"""
+        async def scenario(tasks, projects, users):
+            started = asyncio.Event()
+
+            async def outsider():
+                await started.wait()
+                return await tasks.add_task("Снаружи", "", 1, None, None, None)
+
+            pending = asyncio.create_task(outsider())
+            with pytest.raises(RuntimeError):
+                async with tasks.transaction():
+                    await tasks.add_task("Внутри", "", 1, None, None, None)
+                    started.set()
+                    await asyncio.sleep(0.05)
+                    assert not pending.done()
+                    raise RuntimeError("boom")
+            await pending
+            assert [t.title for t in await tasks.get_all_tasks()] == ["Снаружи"]
+
+        self.run(scenario)
+
+    def test_timeout(self):
+        """Тест таймаута: ожидание прерывается, исполнитель остаётся рабочим"""
+        async def scenario(tasks, projects, users):
+            executor = tasks.executor
+
+            def slow():
+                import time
+                time.sleep(0.2)
+
+            with pytest.raises(TimeoutError):
+                await executor.read(slow, timeout=0.01)
+            assert await tasks.get_all_tasks() == []
+
+        self.run(scenario)
@@ -0,0 +1,142 @@
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from controllers.task_controller import TaskController
+from database.database_manager import DatabaseManager
+from models.task import Task
+from views.background_loader import BackgroundLoader
+
+
+class FakeWidget:
+    """Заменяет виджет Tk: after()/after_idle() копятся и выполняются вручную"""
+
+    def __init__(self):
+        self.callbacks = []
+        self.thread = threading.current_thread()
+
+    def after(self, ms, fn, *args):
+        self.callbacks.append((fn, args))
+        return len(self.callbacks)
+
+    def after_idle(self, fn, *args):
+        return self.after(0, fn, *args)
+
+    def after_cancel(self, poll_id):
+        pass
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def pump(self, until, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            callbacks, self.callbacks = self.callbacks, []
+            for fn, args in callbacks:
+                fn(*args)
+            time.sleep(0.005)
+        assert until()
+
+
+class TestBackgroundLoader:
+    """Тесты для фоновой загрузки данных представлений"""
+
+    def setup_method(self):
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()                          # Windows fix
+        self.db_manager = DatabaseManager(self.temp_db.name)
+        self.db_manager.create_tables()
+        self.db_manager.add_tasks_bulk(
+            Task(f"Задача {i}", "", 1, None, None, None) for i in range(10)
+        )
+        self.controller = TaskController(self.db_manager)
+        self.widget = FakeWidget()
+        self.busy = []
+        self.loader = BackgroundLoader(self.widget, on_busy=self.busy.append)
+
+    def teardown_method(self):
+        self.loader.close()
+        self.db_manager.close()
+        for _ in range(10):                 # маленький retry, пока ОС отпустит lock
+            try:
+                os.unlink(self.temp_db.name)
+                break
+            except PermissionError:
+                time.sleep(0.05)
+
+    def test_results_on_main_thread(self):
+        """Тест: запрос выполняется в рабочем потоке, а on_done — в главном"""
+        done = []
+
+        def count():
+            in_worker = threading.current_thread() is not self.widget.thread
+            return in_worker, self.controller.count_tasks()
+
+        self.loader.submit(count, on_done=lambda r: done.append((threading.current_thread(), r)))
+        assert self.loader.busy
+        self.widget.pump(lambda: done)
+
+        assert done == [(self.widget.thread, (True, 10))]
+        assert self.busy == [True, False]
+        assert not self.loader.busy
+
+    def test_superseded_and_errors(self):
+        """Тест: устаревший результат с тем же key отбрасывается, ошибка уходит в on_error"""
+        gate = threading.Event()
+        done, errors = [], []
+        self.loader.submit(gate.wait, key="window", on_done=lambda r: done.append("old"))
+        self.loader.submit(self.controller.count_tasks, key="window", on_done=done.append)
+        self.loader.submit(
+            self.controller.page_tasks, None, 10, "title; DROP TABLE tasks", on_error=errors.append
+        )
+        gate.set()
+        self.widget.pump(lambda: not self.loader.busy)
+
+        assert done == [10]
+        assert len(errors) == 1 and isinstance(errors[0], ValueError)
+
+        self.loader.submit(self.controller.count_tasks, key="window", on_done=done.append)
+        self.loader.cancel("window")
+        self.widget.pump(lambda: not self.loader.busy)
+        assert done == [10]
+
+        with pytest.raises(ValueError):
+            self.loader.submit(self.controller.page_tasks, None, 10, "title; DROP TABLE tasks")
+            self.widget.pump(lambda: False, timeout=1)
+
+    def test_run_in_chunks(self):
+        """Тест: большой список применяется порциями, новый вызов с тем же key отменяет старый"""
+        applied = []
+        self.loader.run_in_chunks(list(range(10)), applied.append, chunk_size=4, key="rows")
+        assert applied == [[0, 1, 2, 3]]
+
+        self.loader.run_in_chunks(["a"], applied.append, key="rows")
+        self.widget.pump(lambda: not self.widget.callbacks)
+        assert applied == [[0, 1, 2, 3], ["a"]]
+
+    def test_interrupt_superseded_query(self):
+        """Тест: вытесненный прерываемый запрос обрывается, поток сразу берёт следующий"""
+        self.loader.close()
+        self.loader = BackgroundLoader(self.widget, pool=self.db_manager.pool)
+        started = threading.Event()
+        done = []
+
+        def endless():
+            with self.db_manager.pool.reader() as conn:
+                # started() вызывается на каждой строке — запрос уже точно идёт
+                conn.create_function("started", 0, started.set)
+                return conn.execute(
+                    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c)"
+                    " SELECT count(started()) FROM c"
+                ).fetchone()
+
+        self.loader.submit(endless, key="search", interrupt=True, on_done=done.append)
+        assert started.wait(5)
+        self.loader.submit(
+            self.controller.count_tasks, key="search", interrupt=True, on_done=done.append
+        )
+        self.widget.pump(lambda: not self.loader.busy)
+        assert done == [10]
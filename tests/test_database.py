@@ -0,0 +1,507 @@
+import os
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from database.database_manager import DatabaseManager
+from models.project import Project
+from models.task import Task
+from models.user import User
+
+
+class TestDatabaseManager:
+    """Тесты для DatabaseManager"""
+
+    def setup_method(self):
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()                          # Windows fix
+        self.db_manager = DatabaseManager(self.temp_db.name)
+        self.db_manager.create_tables()
+
+    def teardown_method(self):
+        self.db_manager.close()
+        import time
+        for _ in range(10):                 # маленький retry, пока ОС отпустит lock
+            try:
+                os.unlink(self.temp_db.name)
+                break
+            except PermissionError:
+                time.sleep(0.05)
+
+    def test_add_tasks_bulk(self):
+        """Тест пакетной вставки задач из генератора"""
+        due = datetime.now() + timedelta(days=3)
+        tasks = (Task(f"Задача {i}", "Описание", 1 + i % 3, due, None, None) for i in range(25))
+
+        ids = self.db_manager.add_tasks_bulk(tasks, chunk_size=10)
+
+        assert len(ids) == 25
+        assert ids == sorted(ids)
+        for i, task_id in enumerate(ids):
+            task = self.db_manager.get_task_by_id(task_id)
+            assert task.title == f"Задача {i}"
+
+    def test_add_projects_and_users_bulk(self):
+        """Тест пакетной вставки проектов и пользователей"""
+        projects = [Project(f"Проект {i}", "", None, None) for i in range(3)]
+        users = [User(f"user{i}", f"user{i}@example.com", "developer") for i in range(3)]
+
+        project_ids = self.db_manager.add_projects_bulk(projects)
+        user_ids = self.db_manager.add_users_bulk(users)
+
+        assert [p.id for p in projects] == project_ids
+        assert self.db_manager.get_project_by_id(project_ids[2]).name == "Проект 2"
+        assert self.db_manager.get_user_by_id(user_ids[1]).username == "user1"
+
+    def test_add_tasks_bulk_rolls_back_on_error(self):
+        """Тест отката всей пакетной вставки при ошибке"""
+        self.db_manager.add_tasks_bulk([Task("Первая", "", 1, None, None, None)])
+
+        def broken():
+            yield Task("Вторая", "", 1, None, None, None)
+            raise RuntimeError("сбой источника")
+
+        with pytest.raises(RuntimeError):
+            self.db_manager.add_tasks_bulk(broken(), chunk_size=1)
+
+        titles = [r["title"] for r in self.db_manager.conn.execute("SELECT title FROM tasks")]
+        assert titles == ["Первая"]
+
+    def test_transaction_commits_once(self):
+        """Тест единого коммита для группы изменений"""
+        with self.db_manager.transaction():
+            task_id = self.db_manager.add_task(Task("Задача", "", 1, None, None, None))
+            self.db_manager.update_task(task_id, status="in_progress")
+            assert self.db_manager.conn.in_transaction
+
+        assert not self.db_manager.conn.in_transaction
+        assert self.db_manager.get_task_by_id(task_id).status == "in_progress"
+
+    def test_transaction_rollback(self):
+        """Тест отката транзакции при исключении"""
+        with pytest.raises(ValueError):
+            with self.db_manager.transaction():
+                self.db_manager.add_task(Task("Задача", "", 1, None, None, None))
+                raise ValueError("откат")
+
+        assert self.db_manager.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 0
+
+    def test_failed_commit_rolls_back(self):
+        """Тест: если COMMIT не прошёл, транзакция откатывается, а не остаётся открытой"""
+        writer = self.db_manager.conn
+
+        class BusyCommit:
+            def __getattr__(self, name):
+                return getattr(writer, name)
+
+            def commit(self):
+                raise sqlite3.OperationalError("database is locked")
+
+        self.db_manager.conn = BusyCommit()
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                with self.db_manager.transaction():
+                    self.db_manager.add_task(Task("Задача", "", 1, None, None, None))
+        finally:
+            self.db_manager.conn = writer
+        assert not writer.in_transaction
+        assert not self.db_manager.in_own_transaction()
+        assert self.db_manager.count_tasks() == 0
+
+    def test_failed_write_rolls_back(self):
+        """Тест: упавшая запись вне транзакции не оставляет базу заблокированной"""
+        with pytest.raises(sqlite3.IntegrityError):
+            self.db_manager.add_task(Task("Задача", "", 1, None, 999, None))
+        assert not self.db_manager.conn.in_transaction
+
+        other = sqlite3.connect(self.temp_db.name, timeout=0)
+        try:
+            other.execute("INSERT INTO users(username, email, role, registration_date)"
+                          " VALUES ('u', 'u@example.com', 'developer', '2024-01-01')")
+            other.commit()
+        finally:
+            other.close()
+
+    def test_nested_transaction_savepoint(self):
+        """Тест отката вложенной транзакции без отката внешней"""
+        with self.db_manager.transaction():
+            outer_id = self.db_manager.add_task(Task("Внешняя", "", 1, None, None, None))
+            with pytest.raises(RuntimeError):
+                with self.db_manager.transaction():
+                    self.db_manager.add_task(Task("Вложенная", "", 1, None, None, None))
+                    raise RuntimeError("откат вложенной")
+
+        rows = self.db_manager.conn.execute("SELECT id FROM tasks").fetchall()
+        assert [r["id"] for r in rows] == [outer_id]
+
+    def test_after_transaction(self):
+        """Тест колбэков after_transaction: откат SAVEPOINT сразу, остальное после COMMIT"""
+        calls = []
+
+        def record(name):
+            self.db_manager.after_transaction(lambda committed: calls.append((name, committed)))
+
+        record("вне")
+        with self.db_manager.transaction():
+            record("внешняя")
+            with self.db_manager.transaction():
+                record("release")
+            with pytest.raises(RuntimeError):
+                with self.db_manager.transaction():
+                    record("sp")
+                    raise RuntimeError("откат вложенной")
+            assert calls == [("вне", True), ("sp", False)]
+        with pytest.raises(RuntimeError):
+            with self.db_manager.transaction():
+                record("откат")
+                raise RuntimeError("откат")
+
+        assert calls[2:] == [("внешняя", True), ("release", True), ("откат", False)]
+        assert not self.db_manager.in_own_transaction()
+
+    def test_profile_pragmas(self):
+        """Тест настройки WAL и PRAGMA по профилю"""
+        pragmas = self.db_manager.pragmas()
+        assert pragmas["journal_mode"] == "wal"
+        assert pragmas["synchronous"] == 1          # NORMAL
+        assert pragmas["busy_timeout"] == 5000
+
+        fast = DatabaseManager(self.temp_db.name, profile="fast")
+        try:
+            assert fast.pragmas()["synchronous"] == 0   # OFF
+        finally:
+            fast.close()
+
+        with pytest.raises(ValueError):
+            DatabaseManager(self.temp_db.name, profile="turbo")
+
+    def test_checkpoint(self):
+        """Тест ручного чекпойнта WAL"""
+        self.db_manager.add_task(Task("Задача", "", 1, None, None, None))
+
+        busy, log_pages, checkpointed = self.db_manager.checkpoint("truncate")
+
+        assert busy == 0
+        assert log_pages == checkpointed
+        with pytest.raises(ValueError):
+            self.db_manager.checkpoint("sometimes")
+
+    def test_reads_use_pool_from_threads(self):
+        """Тест параллельных чтений через пул читателей"""
+        ids = self.db_manager.add_tasks_bulk(
+            Task(f"Задача {i}", "", 1, None, None, None) for i in range(20)
+        )
+        errors = []
+
+        def worker():
+            try:
+                assert [self.db_manager.get_task_by_id(task_id).id for task_id in ids] == ids
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert 1 <= self.db_manager.pool.stats()["open"] <= 4
+
+    def test_pool_replaces_broken_reader(self):
+        """Тест замены неисправного подключения читателя"""
+        with self.db_manager.pool.reader() as conn:
+            broken = conn
+        broken.close()
+
+        with self.db_manager.pool.reader() as conn:
+            assert conn is not broken
+            assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_transaction_reads_own_writes(self):
+        """Тест чтения своих изменений внутри транзакции"""
+        with self.db_manager.transaction():
+            task_id = self.db_manager.add_task(Task("Черновик", "", 1, None, None, None))
+            assert self.db_manager.get_task_by_id(task_id).title == "Черновик"
+
+    def test_in_memory_database(self):
+        """Тест работы с базой в памяти без читателей"""
+        db = DatabaseManager(":memory:")
+        try:
+            db.create_tables()
+            task_id = db.add_task(Task("В памяти", "", 1, None, None, None))
+            assert db.get_task_by_id(task_id).title == "В памяти"
+        finally:
+            db.close()
+
+    def test_fts_search(self):
+        """Тест полнотекстового поиска: префиксы, ранжирование, синхронизация"""
+        assert self.db_manager.fts_enabled
+        first = self.db_manager.add_task(
+            Task("Отчёт по продажам", "квартальный отчёт", 1, None, None, None)
+        )
+        second = self.db_manager.add_task(Task("Созвон", "обсудить отчёт", 2, None, None, None))
+        self.db_manager.add_task(Task("Ревью кода", "", 3, None, None, None))
+
+        results = self.db_manager.search_tasks("отч")
+        assert [t.id for t in results] == [first, second]
+        assert [t.id for t in self.db_manager.search_tasks("отч", limit=1)] == [first]
+
+        (task, snippet), = self.db_manager.search_task_snippets("созвон")
+        assert task.id == second
+        assert snippet == "[Созвон]"
+
+        self.db_manager.update_task(second, title="Встреча", description="")
+        self.db_manager.delete_task(first)
+        assert self.db_manager.search_tasks("отчёт") == []
+        assert [t.id for t in self.db_manager.search_tasks("встреча")] == [second]
+
+    def test_search_falls_back_to_like(self):
+        """Тест поиска через LIKE, когда FTS5 недоступен"""
+        task_id = self.db_manager.add_task(Task("Deploy release", "", 1, None, None, None))
+        self.db_manager.fts_enabled = False
+
+        assert [t.id for t in self.db_manager.search_tasks("ploy")] == [task_id]
+
+    def test_get_overdue_tasks(self):
+        """Тест выборки просроченных задач в SQL"""
+        now = datetime(2026, 1, 10, 12, 0)
+        late = self.db_manager.add_task(
+            Task("Просрочена", "", 1, now - timedelta(days=2), None, None)
+        )
+        later = self.db_manager.add_task(
+            Task("Просрочена сильнее", "", 1, now - timedelta(days=5), None, None)
+        )
+        done = self.db_manager.add_task(Task("Сделана", "", 1, now - timedelta(days=1), None, None))
+        self.db_manager.update_task(done, status="completed")
+        self.db_manager.add_task(Task("В срок", "", 1, now + timedelta(days=1), None, None))
+        self.db_manager.add_task(Task("Без срока", "", 1, None, None, None))
+
+        overdue = self.db_manager.get_overdue_tasks(now=now)
+        assert [t.id for t in overdue] == [later, late]
+        assert [t.id for t in self.db_manager.get_overdue_tasks(now=now, limit=1)] == [later]
+
+        plan = self.db_manager.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE status != 'completed' AND due_date < ?",
+            (now.isoformat(),),
+        ).fetchall()
+        assert any("idx_tasks_open_due" in row["detail"] for row in plan)
+
+    def test_lookup_cache(self):
+        """Тест LRU-кэша get_*_by_id и его инвалидации"""
+        db = DatabaseManager(self.temp_db.name, cache_size=2)
+        try:
+            user_id = db.add_user(User("cached", "cached@example.com", "developer"))
+            project_id = db.add_project(Project("Проект", "", None, None))
+            task_id = db.add_task(Task("Задача", "", 1, None, project_id, user_id))
+
+            first = db.get_user_by_id(user_id)
+            first.username = "изменён у вызывающего"
+            assert db.get_user_by_id(user_id).username == "cached"
+            assert db.cache_stats()["users"]["hits"] == 1
+
+            db.update_user(user_id, username="renamed")
+            assert db.get_user_by_id(user_id).username == "renamed"
+
+            assert db.get_task_by_id(task_id).project_id == project_id
+            db.delete_project(project_id)
+            assert db.get_project_by_id(project_id) is None
+            assert db.get_task_by_id(task_id).project_id is None
+
+            db.conn.execute("UPDATE tasks SET title='в обход' WHERE id=?", (task_id,))
+            db.conn.commit()
+            assert db.get_task_by_id(task_id).title == "Задача"
+            assert db.get_task_by_id(task_id, use_cache=False).title == "в обход"
+        finally:
+            db.close()
+
+    def test_lookup_cache_rollback(self):
+        """Тест кэша при откате транзакции"""
+        db = DatabaseManager(self.temp_db.name, cache_size=10)
+        try:
+            task_id = db.add_task(Task("Исходная", "", 1, None, None, None))
+            assert db.get_task_by_id(task_id).title == "Исходная"
+            with pytest.raises(RuntimeError):
+                with db.transaction():
+                    db.update_task(task_id, title="Черновик")
+                    assert db.get_task_by_id(task_id).title == "Черновик"
+                    raise RuntimeError("откат")
+            assert db.get_task_by_id(task_id).title == "Исходная"
+        finally:
+            db.close()
+
+    def test_lookup_cache_read_during_commit(self):
+        """Тест: чтение другим потоком во время COMMIT не оставляет в кэше старую строку"""
+        db = DatabaseManager(self.temp_db.name, cache_size=10)
+        seen = []
+
+        class CommitProbe:
+            # Подменяет commit(): перед настоящим COMMIT другой поток читает задачу
+            def __init__(self, conn):
+                self.conn = conn
+
+            def __getattr__(self, name):
+                return getattr(self.conn, name)
+
+            def commit(self):
+                reader = threading.Thread(
+                    target=lambda: seen.append(db.get_task_by_id(task_id).title)
+                )
+                reader.start()
+                reader.join()
+                self.conn.commit()
+
+        try:
+            task_id = db.add_task(Task("Старая", "", 1, None, None, None))
+            db.conn = CommitProbe(db.conn)
+            with db.transaction():
+                db.update_task(task_id, title="Новая")
+            db.conn = db.conn.conn
+            assert seen == ["Старая"]
+            assert db.get_task_by_id(task_id).title == "Новая"
+        finally:
+            db.close()
+
+    def test_get_many_by_ids(self):
+        """Тест пакетного получения записей по списку id"""
+        ids = self.db_manager.add_tasks_bulk(
+            Task(f"Задача {i}", "", 1, None, None, None) for i in range(2000)
+        )
+
+        found = self.db_manager.get_tasks_by_ids(ids[::-1] + [ids[0], 999999])
+
+        assert len(found) == 2000
+        assert found[ids[1500]].title == "Задача 1500"
+        assert 999999 not in found
+        assert self.db_manager.get_users_by_ids([]) == {}
+
+    def test_get_many_by_ids_uses_cache(self):
+        """Тест пакетного получения с использованием кэша"""
+        db = DatabaseManager(self.temp_db.name, cache_size=10)
+        try:
+            ids = db.add_projects_bulk(Project(f"Проект {i}", "", None, None) for i in range(3))
+            db.get_project_by_id(ids[0])
+            found = db.get_projects_by_ids(ids)
+            assert sorted(found) == ids
+            assert db.cache_stats()["projects"]["hits"] == 1
+            assert db.get_project_by_id(ids[2]).name == "Проект 2"
+            assert db.cache_stats()["projects"]["hits"] == 2
+        finally:
+            db.close()
+
+    def test_fetch_tasks_columnar(self):
+        """Тест колоночной выборки задач и агрегатов по ней"""
+        now = datetime(2026, 3, 1, 12, 0)
+        project_id = self.db_manager.add_project(Project("Проект", "", None, None))
+        ids = self.db_manager.add_tasks_bulk([
+            Task("Просрочена", "", 1, now - timedelta(days=1), project_id, None),
+            Task("В срок", "", 2, now + timedelta(days=1, microseconds=5), project_id, None),
+            Task("Без срока", "", 3, None, None, None),
+            Task("Сделана", "", 1, now - timedelta(days=3), project_id, None),
+        ])
+        self.db_manager.update_task(ids[3], status="completed")
+
+        frame = self.db_manager.fetch_tasks_columnar()
+        assert list(frame.ids) == ids
+        assert frame.count_by_status() == {"pending": 3, "in_progress": 0, "completed": 1}
+        assert list(frame.overdue_mask(now)) == [1, 0, 0, 0]
+        assert frame.due[1] - frame.due[0] == 2 * 24 * 3600
+
+        in_project = self.db_manager.fetch_tasks_columnar({"project_id": project_id})
+        assert len(in_project) == 3
+        urgent = in_project.where(priority=1, status="pending")
+        assert list(urgent.ids) == [ids[0]]
+        assert len(frame.where(status="archived")) == 0
+
+    def test_managed_indexes(self):
+        """Тест управляемого набора индексов и советника"""
+        self.db_manager.conn.execute("DROP INDEX idx_tasks_project")
+        self.db_manager.create_tables()
+
+        names = {
+            r["name"] for r in self.db_manager.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+            )
+        }
+        assert {"idx_tasks_project", "idx_tasks_assignee_status_due"} <= names
+
+        # Выборки по проекту и исполнителю идут потоком в порядке id, без сортировки
+        for column in ("project_id", "assignee_id"):
+            sql = f"SELECT * FROM tasks WHERE {column}=? ORDER BY id"
+            plan = self.db_manager.explain(sql, (1,))
+            assert not any("TEMP B-TREE" in detail for detail in plan)
+
+        report = {r["probe"]: r for r in self.db_manager.analyze_indexes()}
+        assert [name for name, r in report.items() if not r["expected"]] == []
+        assert "get_tasks_by_project" not in report
+        assert report["page_tasks due_date after null"]["expected"]
+        assert "USE TEMP B-TREE FOR ORDER BY" in report["search_tasks"]["scans"]
+        self.db_manager.optimize(analyze=True)
+
+    def test_instrumentation(self):
+        """Тест сбора метрик вызовов и журнала медленных запросов"""
+        ins = self.db_manager.enable_instrumentation(slow_query_ms=0)
+        ids = self.db_manager.add_tasks_bulk(
+            Task(f"Задача {i}", "", 1, None, None, None) for i in range(5)
+        )
+        self.db_manager.get_all_tasks()
+        assert len(list(self.db_manager.iter_tasks(batch_size=2))) == 5
+        with pytest.raises(ValueError):
+            self.db_manager.page_tasks(order_by="title")
+
+        snap = ins.snapshot()
+        assert snap["methods"]["get_all_tasks"]["calls"] == 1
+        assert snap["methods"]["get_all_tasks"]["rows"] == 5
+        assert snap["methods"]["iter_tasks"]["rows"] == 10
+        assert snap["methods"]["page_tasks"]["errors"] == 1
+        assert snap["methods"]["add_tasks_bulk"]["p99_ms"] > 0
+        slow = [e for e in snap["slow_queries"] if e["method"] == "get_all_tasks"]
+        assert any("SELECT * FROM tasks ORDER BY id" in sql for sql in slow[0]["sql"])
+        assert '"get_all_tasks"' in ins.to_json()
+
+        self.db_manager.get_task_by_id(ids[0])
+        assert "in_own_transaction" not in ins.snapshot()["methods"]
+
+        self.db_manager.disable_instrumentation()
+        assert "get_all_tasks" not in vars(self.db_manager)
+        self.db_manager.get_all_tasks()
+        assert ins.snapshot()["methods"]["get_all_tasks"]["calls"] == 1
+
+    def test_change_tracking(self):
+        """Тест журнала изменений: обновления, удаления и новые строки после версии"""
+        assert self.db_manager.get_changes("tasks") is None
+
+        ids = self.db_manager.add_tasks_bulk(
+            Task(f"Задача {i}", "", 1, None, None, None) for i in range(5)
+        )
+        self.db_manager.enable_change_tracking()
+        since = self.db_manager.data_version("tasks")
+        assert self.db_manager.get_changes("tasks") == {"version": since, "total": 5}
+
+        self.db_manager.update_task(ids[0], status="completed")
+        self.db_manager.update_task(ids[0], status="in_progress")
+        self.db_manager.delete_task(ids[1])
+        new_id = self.db_manager.add_task(Task("Новая", "", 1, None, None, None))
+        self.db_manager.update_task(new_id, status="completed")
+        gone = self.db_manager.add_task(Task("Удалится", "", 1, None, None, None))
+        self.db_manager.delete_task(gone)
+
+        changes = self.db_manager.get_changes("tasks", since)
+        assert changes["updated"] == [ids[0]]
+        assert changes["deleted"] == [ids[1]]
+        assert changes["inserted"] == 1
+        assert self.db_manager.get_changes("tasks", changes["version"])["updated"] == []
+
+        # ON DELETE SET NULL тоже попадает в журнал задач
+        project_id = self.db_manager.add_project(Project("Проект", "", None, None))
+        self.db_manager.update_task(ids[2], project_id=project_id)
+        since = self.db_manager.data_version("tasks")
+        self.db_manager.delete_project(project_id)
+        assert self.db_manager.get_changes("tasks", since)["updated"] == [ids[2]]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,82 @@
+import copy
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.project import Project
+from models.task import Task
+from models.user import User
+
+
+class TestModels:
+    """Тесты для моделей Task, Project, User"""
+
+    def test_models_have_no_instance_dict(self):
+        """Тест компактного представления моделей через __slots__"""
+        task = Task("Задача", "Описание", 1, None, 1, 1)
+        project = Project("Проект", "Описание", None, None)
+        user = User("user", "user@example.com", "developer")
+
+        for model in (task, project, user):
+            assert not hasattr(model, "__dict__")
+            with pytest.raises(AttributeError):
+                model.unexpected = 1
+
+    def test_task_behaviour_preserved(self):
+        """Тест поведения Task после перехода на __slots__"""
+        task = Task("  Задача ", None, 2, datetime.now() - timedelta(days=1), 1, 2)
+        assert task.title == "Задача"
+        assert task.description == ""
+        assert task.is_overdue() is True
+
+        assert task.update_status("completed") is True
+        assert task.is_overdue() is False
+        assert task.to_dict()["status"] == "completed"
+        with pytest.raises(ValueError):
+            task.update_status("unknown")
+        with pytest.raises(ValueError):
+            Task("Задача", "", 5, None, None, None)
+
+        clone = copy.copy(task)
+        assert clone.to_dict() == task.to_dict()
+
+    def test_project_and_user_behaviour_preserved(self):
+        """Тест поведения Project и User после перехода на __slots__"""
+        project = Project("Проект", "", None, None)
+        assert project.update_status("on_hold") is True
+        assert project.get_progress() == 50
+        with pytest.raises(ValueError):
+            project.update_status("archived")
+
+        with pytest.raises(ValueError):
+            User("user", "not-an-email", "developer")
+        user = User("user", "user@example.com", "developer")
+        user.update_info(role="manager")
+        assert user.to_dict()["role"] == "manager"
+
+    def test_from_row_skips_validation(self):
+        """Тест сборки моделей из строк базы без повторной валидации"""
+        task = Task.from_row({
+            "id": 7, "title": "Задача", "description": "", "priority": 2, "status": "in_progress",
+            "due_date": "2030-01-01T10:00:00", "project_id": None, "assignee_id": 3,
+        })
+        assert task.id == 7
+        assert task.status == "in_progress"
+        assert task.due_date == datetime(2030, 1, 1, 10, 0)
+
+        # старая запись с email, не проходящим текущую проверку, всё равно читается
+        user = User.from_row({
+            "id": 1, "username": "legacy", "email": "legacy@localhost", "role": "developer",
+            "registration_date": "2020-05-01T00:00:00",
+        })
+        assert user.email == "legacy@localhost"
+
+        project = Project.from_row({
+            "id": 2, "name": "Проект", "description": "", "start_date": None,
+            "end_date": "2030-01-01T00:00:00", "status": "completed",
+        })
+        assert project.to_dict()["end_date"] == "2030-01-01T00:00:00"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,99 @@
+import os
+import tempfile
+
+from controllers.task_controller import TaskController
+from database.database_manager import DatabaseManager
+from models.task import Task
+from views.paged_table import PageSource
+
+
+class TestPageSource:
+    """Тесты для постраничного источника строк виртуализированной таблицы"""
+
+    def setup_method(self):
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()                          # Windows fix
+        self.db_manager = DatabaseManager(self.temp_db.name)
+        self.db_manager.create_tables()
+        self.db_manager.add_tasks_bulk(
+            Task(f"Задача {i}", "", 1, None, None, None) for i in range(95)
+        )
+        self.controller = TaskController(self.db_manager)
+        self.calls = []
+
+        def page(*args):
+            self.calls.append(args)
+            return self.controller.page_tasks(*args)
+
+        self.source = PageSource(page, self.controller.count_tasks, lambda t: (t.id, t.title),
+                                 page_size=10, max_pages=3)
+
+    def teardown_method(self):
+        self.db_manager.close()
+        import time
+        for _ in range(10):                 # маленький retry, пока ОС отпустит lock
+            try:
+                os.unlink(self.temp_db.name)
+                break
+            except PermissionError:
+                time.sleep(0.05)
+
+    def titles(self, start, stop):
+        return [title for _, title in self.source.rows(start, stop)]
+
+    def test_rows_across_pages(self):
+        """Тест окна строк на стыке страниц и в конце выборки"""
+        assert self.source.count() == 95
+        assert self.titles(8, 13) == [f"Задача {i}" for i in range(8, 13)]
+        assert self.titles(90, 100) == [f"Задача {i}" for i in range(90, 95)]
+        assert self.titles(120, 125) == []
+
+    def test_sequential_pages_use_cursor(self):
+        """Тест: следующая страница продолжает курсор, переход вдаль — по offset"""
+        self.titles(0, 25)
+        assert [call[4:] for call in self.calls] == [(None,), (), ()]
+
+        self.titles(70, 75)
+        assert self.calls[-1][4] == 70
+
+    def test_memory_bounded(self):
+        """Тест: в памяти не больше max_pages страниц"""
+        for start in range(0, 95, 10):
+            self.titles(start, start + 10)
+        assert len(self.source._pages) == 3
+
+        self.source.invalidate()
+        self.calls.clear()
+        self.titles(0, 5)
+        assert len(self.calls) == 1
+
+    def test_apply_changes(self):
+        """Тест инкрементального обновления страниц по журналу изменений"""
+        self.db_manager.enable_change_tracking()
+        self.source = PageSource(
+            self.controller.page_tasks, self.controller.count_tasks, lambda t: (t.id, t.title),
+            page_size=10, changes=self.controller.get_changes,
+            load=self.controller.get_tasks_by_ids,
+        )
+        assert self.source.count() == 95
+        ids = [row[0] for row in self.source.rows(0, 60)]
+
+        self.controller.update_task(ids[2], title="Обновлена")
+        self.controller.delete_task(ids[50])
+        self.controller.add_task("Новая", "", 1, None, None, None)
+
+        assert self.source.apply_changes()
+        assert self.source.total == 95
+        assert 0 in self.source._pages          # страница до удаления осталась в кэше
+        assert 5 not in self.source._pages      # страница с удалённой строкой сброшена
+        assert self.titles(0, 3) == ["Задача 0", "Задача 1", "Обновлена"]
+        assert self.titles(49, 51) == ["Задача 49", "Задача 51"]
+        assert self.titles(94, 95) == ["Новая"]
+
+        assert self.source.apply_changes()
+        assert self.source.total == 95
+
+    def test_apply_changes_without_tracking(self):
+        """Тест: без журнала изменений нужна полная перезагрузка"""
+        self.source.count()
+        assert not self.source.apply_changes()
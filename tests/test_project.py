@@ -176,4 +176,30 @@ class TestProjectController:
 
         progress = self.controller.get_project_progress(project_id)
         assert isinstance(progress, float)
-        assert 0 <= progress <= 100
\ No newline at end of file
+        assert 0 <= progress <= 100
+
+    def test_get_project_stats(self):
+        """Тест агрегированной статистики по проектам"""
+        project_id = self.controller.add_project("С задачами", "", None, None)
+        empty_id = self.controller.add_project("Пустой", "", None, None)
+        task_controller = TaskController(self.db_manager)
+        past = datetime.now() - timedelta(days=1)
+        ids = [
+            task_controller.add_task(f"Задача {i}", "", 1 + i % 3, past, project_id, None)
+            for i in range(4)
+        ]
+        task_controller.update_task_status(ids[0], "completed")
+        task_controller.update_task_status(ids[1], "in_progress")
+
+        stats = self.controller.get_project_stats()
+
+        assert stats[project_id]["total"] == 4
+        assert stats[project_id]["by_status"] == {"pending": 2, "in_progress": 1, "completed": 1}
+        assert stats[project_id]["by_priority"] == {1: 2, 2: 1, 3: 1}
+        assert stats[project_id]["overdue"] == 3
+        assert stats[empty_id]["total"] == 0
+
+        assert self.controller.get_project_progress(project_id) == 25.0
+        self.controller.update_project_status(empty_id, "completed")
+        assert self.controller.get_all_project_progress() == {project_id: 25.0, empty_id: 100.0}
+        assert self.controller.get_project_progress(999) == 0.0
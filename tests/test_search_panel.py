@@ -0,0 +1,108 @@
+import os
+import tempfile
+
+from controllers.task_controller import TaskController
+from database.database_manager import DatabaseManager
+from models.task import Task
+from views.search_panel import SearchCache
+
+
+class TestSearchCache:
+    """Тесты для кэша поиска по мере ввода"""
+
+    def setup_method(self):
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()                          # Windows fix
+        self.db_manager = DatabaseManager(self.temp_db.name)
+        self.db_manager.create_tables()
+        words = ["срочное", "сроки", "план", "Отчёт"]
+        self.db_manager.add_tasks_bulk(
+            Task(f"Задача {i} {words[i % 4]}", f"описание {words[(i + 1) % 4]}",
+                 1, None, None, None)
+            for i in range(40)
+        )
+        self.controller = TaskController(self.db_manager)
+        self.searches = []
+        self.cache = SearchCache(
+            self.controller.task_matches, self.controller.search_key, limit=35
+        )
+
+    def teardown_method(self):
+        self.db_manager.close()
+        import time
+        for _ in range(10):                 # маленький retry, пока ОС отпустит lock
+            try:
+                os.unlink(self.temp_db.name)
+                break
+            except PermissionError:
+                time.sleep(0.05)
+
+    def search(self, query):
+        results = self.cache.get(query)
+        if results is None:
+            self.searches.append(query)
+            results = self.controller.search_tasks(query, self.cache.limit)
+            self.cache.put(query, results)
+        return {task.id for task in results}
+
+    def test_refines_complete_results(self):
+        """Тест: дописанный запрос уточняется локально и совпадает с поиском в базе"""
+        for query in ["сро", "срок", "сроки", "сроки отч", "сроки отчёт"]:
+            assert self.search(query) == {t.id for t in self.controller.search_tasks(query)}
+        assert self.searches == ["сро"]
+
+        assert self.search("Задача") and self.search("Задача 1") == {
+            t.id for t in self.controller.search_tasks("Задача 1")
+        }
+        # «Задача» нашла 35 из 40 — результат неполный, уточнять его нельзя
+        assert self.searches[-2:] == ["Задача", "Задача 1"]
+
+        self.cache.clear()
+        self.search("сроки")
+        assert self.searches[-1] == "сроки"
+
+    def test_refines_only_same_search(self):
+        """Тест: уточнение только при том же виде поиска и тех же словах, как у unicode61"""
+        ids = self.db_manager.add_tasks_bulk(
+            Task(title, "", 1, None, None, None)
+            for title in ["foo bar", "foo_bar", "foobar", "alpha-beta", "again"]
+        )
+        # "-" без слов ищется через LIKE, "-a" — уже через FTS5
+        assert self.search("-") == {ids[3]}
+        assert self.search("-a") == {ids[3], ids[4]}
+        assert self.searches == ["-", "-a"]
+
+        # "_" разделяет слова: "foo_bar" — это "foo" и "bar", уточняется из "foo"
+        assert self.search("foo") == {ids[0], ids[1], ids[2]}
+        assert self.search("foo_bar") == {ids[0], ids[1]}
+        assert self.searches[-1] == "foo"
+        assert {t.id for t in self.controller.search_tasks("foo_bar")} == {ids[0], ids[1]}
+
+    def test_refines_folded_and_literal_like(self):
+        """Тест: диакритика латиницы снимается как в unicode61, % и _ в LIKE — обычные символы"""
+        ids = self.db_manager.add_tasks_bulk(
+            Task(title, "", 1, None, None, None)
+            for title in ["café menu", "cafeteria", "Отчёт готов", "50% готово", "a_b", "axb"]
+        )
+        assert self.search("caf") == {ids[0], ids[1]}
+        assert self.search("cafe") == {ids[0], ids[1]}
+        assert self.search("отчет") == set()
+        assert {t.id for t in self.controller.search_tasks("cafe")} == {ids[0], ids[1]}
+        assert self.searches == ["caf", "отчет"]
+
+        self.db_manager.fts_enabled = False
+        self.cache.clear()
+        assert self.search("_") == {ids[4]}
+        assert self.search("a_b") == {ids[4]}
+        assert self.searches[-1] == "_"
+        assert {t.id for t in self.controller.search_tasks("a_b")} == {ids[4]}
+        assert {t.id for t in self.controller.search_tasks("0%")} == {ids[3]}
+
+    def test_task_matches_like_fallback(self):
+        """Тест: без FTS5 условие совпадает с LIKE (регистр не важен только для ASCII)"""
+        task = Task("Report Отчёт", "", 1, None, None, None)
+        assert self.controller.task_matches(task, "отч")
+        self.db_manager.fts_enabled = False
+        assert self.controller.task_matches(task, "port о") is False
+        assert self.controller.task_matches(task, "REPORT Отч")
+        assert not self.controller.task_matches(task, "отч")
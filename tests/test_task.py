@@ -282,6 +282,84 @@ class TestTaskController:
         for task in tasks:
             assert task.assignee_id == self.user_id
 
+    def test_transaction(self):
+        """Тест атомарной группы операций через контроллер"""
+        with pytest.raises(RuntimeError):
+            with self.controller.transaction():
+                task_id = self.controller.add_task(
+                    "Задача в транзакции",
+                    "Описание",
+                    1,
+                    None,
+                    self.project_id,
+                    self.user_id,
+                )
+                self.controller.update_task_status(task_id, "completed")
+                raise RuntimeError("откат")
+
+        assert self.controller.get_task(task_id) is None
+
+    def test_iter_tasks(self):
+        """Тест потоковой выборки задач порциями"""
+        for i in range(7):
+            self.controller.add_task(
+                f"Задача {i}", "Описание", 1, None, self.project_id, self.user_id
+            )
+
+        stream = self.controller.iter_tasks(batch_size=3)
+        assert not isinstance(stream, list)
+        assert [t.title for t in stream] == [f"Задача {i}" for i in range(7)]
+
+        by_project = list(self.controller.iter_tasks_by_project(self.project_id, batch_size=2))
+        by_user = list(self.controller.iter_tasks_by_user(self.user_id, batch_size=2))
+        assert len(by_project) == len(by_user) == 7
+        expected = self.controller.get_tasks_by_project(self.project_id)
+        assert [t.id for t in by_project] == [t.id for t in expected]
+
+    def test_page_tasks(self):
+        """Тест keyset-пагинации задач по сроку"""
+        base = datetime.now()
+        for i in range(5):
+            self.controller.add_task(
+                f"Задача {i}", "Описание", 1 + i % 3, base + timedelta(days=5 - i),
+                self.project_id, self.user_id,
+            )
+        self.controller.add_task("Без срока", "Описание", 1, None, self.project_id, self.user_id)
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = self.controller.page_tasks(after=cursor, limit=2, order_by="due_date")
+            assert len(page) <= 2
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        assert [t.title for t in seen] == ["Без срока"] + [f"Задача {i}" for i in range(4, -1, -1)]
+
+        page, _ = self.controller.page_tasks(filters={"priority": 1}, order_by="priority")
+        assert {t.priority for t in page} == {1}
+
+        with pytest.raises(ValueError):
+            self.controller.page_tasks(order_by="title; DROP TABLE tasks")
+
+    def test_page_tasks_offset_and_count(self):
+        """Тест перехода к странице по номеру строки и подсчёта задач"""
+        base = datetime.now()
+        for i in range(7):
+            self.controller.add_task(
+                f"Задача {i}", "", 1 + i % 2, base + timedelta(days=7 - i), None, None
+            )
+
+        assert self.controller.count_tasks() == 7
+        assert self.controller.count_tasks({"priority": 2}) == 3
+
+        page, cursor = self.controller.page_tasks(limit=2, order_by="due_date", offset=3)
+        assert [t.title for t in page] == ["Задача 3", "Задача 2"]
+        page, _ = self.controller.page_tasks(after=cursor, limit=2, order_by="due_date")
+        assert [t.title for t in page] == ["Задача 1", "Задача 0"]
+
+        assert self.controller.page_tasks(offset=7) == ([], None)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -152,6 +152,51 @@ class TestUserController:
         for task in tasks:
             assert task.assignee_id == user_id
 
+    def test_page_users(self):
+        """Тест постраничного получения пользователей"""
+        for i in range(5):
+            self.controller.add_user(f"user{i}", f"user{i}@example.com", "developer")
+
+        first, cursor = self.controller.page_users(limit=3)
+        second, last_cursor = self.controller.page_users(after=cursor, limit=3)
+
+        assert [u.username for u in first + second] == [f"user{i}" for i in range(5)]
+        assert last_cursor is None
+
+    def test_task_counters(self):
+        """Тест материализованных счётчиков задач по исполнителю"""
+        self.db_manager.enable_counters()
+        user_id = self.controller.add_user("worker", "worker@example.com", "developer")
+        other_id = self.controller.add_user("other", "other@example.com", "developer")
+        task_controller = TaskController(self.db_manager)
+        ids = [
+            task_controller.add_task(f"Задача {i}", "", 1, None, None, user_id) for i in range(3)
+        ]
+        task_controller.add_task("Чужая", "", 1, None, None, other_id)
+
+        task_controller.update_task_status(ids[0], "completed")
+        task_controller.update_task(ids[1], assignee_id=other_id)
+
+        assert self.controller.get_task_counts(user_id) == {"pending": 1, "completed": 1}
+        assert self.controller.get_workload() == {user_id: 1, other_id: 2}
+
+        self.controller.delete_user(other_id)
+        assert self.controller.get_workload() == {user_id: 1, 0: 2}
+
+        self.db_manager.conn.execute("DELETE FROM task_counts_by_assignee")
+        self.db_manager.conn.commit()
+        self.db_manager.rebuild_counters()
+        assert self.controller.get_task_counts(user_id) == {"pending": 1, "completed": 1}
+        assert self.controller.get_workload() == {user_id: 1, 0: 2}
+
+    def test_task_counts_without_counters(self):
+        """Тест подсчёта задач без материализованных счётчиков"""
+        user_id = self.controller.add_user("worker", "worker@example.com", "developer")
+        TaskController(self.db_manager).add_task("Задача", "", 1, None, None, user_id)
+
+        assert self.controller.get_task_counts(user_id) == {"pending": 1}
+        assert self.controller.get_workload() == {user_id: 1}
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,120 @@
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from controllers.task_controller import TaskController
+from database.database_manager import DatabaseManager
+from database.write_behind import WriteBehindQueue
+from models.task import Task
+
+
+class TestWriteBehindQueue:
+    """Тесты для отложенной записи статусов задач"""
+
+    def setup_method(self):
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()                          # Windows fix
+        self.db_manager = DatabaseManager(self.temp_db.name)
+        self.db_manager.create_tables()
+        self.ids = self.db_manager.add_tasks_bulk(
+            Task(f"Задача {i}", "", 1, None, None, None) for i in range(20)
+        )
+        self.queue = None
+
+    def teardown_method(self):
+        if self.queue is not None:
+            self.queue.close()
+        self.db_manager.close()
+        for _ in range(10):                 # маленький retry, пока ОС отпустит lock
+            try:
+                os.unlink(self.temp_db.name)
+                break
+            except PermissionError:
+                time.sleep(0.05)
+
+    def status(self, task_id):
+        return self.db_manager.get_task_by_id(task_id, use_cache=False).status
+
+    def test_coalescing_and_flush(self):
+        """Тест: повторные обновления схлопываются, flush() дожидается записи"""
+        self.queue = WriteBehindQueue(self.db_manager, max_delay=60)
+        controller = TaskController(self.db_manager, write_behind=self.queue)
+
+        controller.update_task_status(self.ids[0], "in_progress")
+        controller.update_task_status(self.ids[0], "completed")
+        controller.update_task_status(self.ids[1], "in_progress")
+        assert self.queue.pending() == 2
+        assert self.status(self.ids[0]) == "pending"
+
+        controller.flush()
+        assert self.status(self.ids[0]) == "completed"
+        assert self.status(self.ids[1]) == "in_progress"
+        assert self.queue.stats()["groups_committed"] == 1
+
+    def test_group_by_size(self):
+        """Тест: группа уходит в базу, когда набралось max_batch задач, не дожидаясь max_delay"""
+        self.queue = WriteBehindQueue(
+            self.db_manager, max_batch=5, max_delay=60, durability="committed"
+        )
+        threads = [
+            threading.Thread(target=self.queue.update, args=(task_id, "completed"))
+            for task_id in self.ids[:5]
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert all(self.status(task_id) == "completed" for task_id in self.ids[:5])
+        assert self.queue.stats()["groups_committed"] == 1
+        assert self.queue.stats()["updates_committed"] == 5
+
+    def test_update_inside_transaction(self):
+        """Тест: внутри транзакции обновление входит в неё, отложенное переживает откат"""
+        self.queue = WriteBehindQueue(self.db_manager, max_delay=60)
+        self.queue.update(self.ids[0], "in_progress")
+        self.queue.update(self.ids[2], "in_progress")
+
+        with pytest.raises(RuntimeError):
+            with self.db_manager.transaction():
+                self.queue.update(self.ids[0], "completed")
+                self.queue.update(self.ids[1], "completed")
+                raise RuntimeError("boom")
+        with self.db_manager.transaction():
+            self.queue.update(self.ids[2], "completed")
+
+        self.queue.flush()
+        assert self.status(self.ids[0]) == "in_progress"
+        assert self.status(self.ids[1]) == "pending"
+        assert self.status(self.ids[2]) == "completed"
+
+    def test_committed_waiter_after_rollback(self):
+        """Тест: ждущий COMMIT своей группы не получает True за откатившуюся запись"""
+        self.queue = WriteBehindQueue(self.db_manager, max_delay=0.01, durability="committed")
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(self.queue.update(self.ids[0], "in_progress"))
+        )
+        with pytest.raises(RuntimeError):
+            with self.db_manager.transaction():
+                waiter.start()
+                while not self.queue.pending():
+                    time.sleep(0.001)
+                self.queue.update(self.ids[0], "completed")
+                raise RuntimeError("boom")
+        waiter.join(5)
+
+        assert results == [True]
+        assert self.status(self.ids[0]) == "in_progress"
+
+    def test_invalid_status(self):
+        """Тест: недопустимый статус отклоняется сразу, а не при записи группы"""
+        self.queue = WriteBehindQueue(self.db_manager)
+        with pytest.raises(ValueError):
+            self.queue.update(self.ids[0], "archived")
+        with pytest.raises(ValueError):
+            WriteBehindQueue(self.db_manager, durability="never")
@@ -0,0 +1,180 @@
+import queue
+import threading
+
+POLL_MS = 15
+CHUNK_SIZE = 200
+_STOP = object()
+
+
+class BackgroundLoader:
+    """Выполняет вызовы контроллеров в рабочем потоке, а не в цикле Tk.
+
+    Tk нельзя трогать из других потоков, поэтому результаты складываются в
+    очередь, а главный поток забирает их через after() и вызывает on_done /
+    on_error. Рабочий поток читает базу своим подключением из пула читателей.
+    Вызовы с одинаковым key вытесняют друг друга: ещё не начатый устаревший
+    вызов пропускается, а результат уже начатого отбрасывается. Вызов,
+    отправленный с interrupt=True, при вытеснении ещё и прерывается через
+    sqlite3 interrupt() — для этого нужен pool, из которого поток берёт читателя.
+    """
+
+    def __init__(self, widget, poll_ms=POLL_MS, on_busy=None, pool=None) -> None:
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self.on_busy = on_busy
+        self.pool = pool
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._latest = {}
+        self._lock = threading.Lock()
+        self._running = None            # (key, generation, подключение) прерываемого вызова
+        self._pending = 0
+        self._poll_id = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="view-loader", daemon=True)
+        self._thread.start()
+        widget.bind("<Destroy>", self._on_destroy, add="+")
+
+    @property
+    def busy(self) -> bool:
+        return self._pending > 0
+
+    def submit(self, fn, *args, key=None, on_done=None, on_error=None, interrupt=False) -> None:
+        if self._closed:
+            return
+        generation = self._supersede(key)
+        self._pending += 1
+        self._jobs.put((key, generation, fn, args, on_done, on_error, interrupt))
+        if self._pending == 1 and self.on_busy:
+            self.on_busy(True)
+        self._schedule_poll()
+
+    def cancel(self, key) -> None:
+        self._supersede(key)
+
+    def run_in_chunks(self, items, apply, chunk_size=CHUNK_SIZE, key=None) -> None:
+        # Применяет apply к порциям items по одной на тик цикла Tk, чтобы вставка
+        # тысяч строк в Treeview не замораживала окно; новый вызов с тем же key
+        # останавливает предыдущий.
+        generation = self._supersede(key)
+
+        def step(start) -> None:
+            if self._closed or not self._is_current(key, generation):
+                return
+            apply(items[start:start + chunk_size])
+            if start + chunk_size < len(items):
+                self.widget.after_idle(step, start + chunk_size)
+
+        step(0)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._jobs.put(_STOP)
+        if self._poll_id is not None:
+            self.widget.after_cancel(self._poll_id)
+            self._poll_id = None
+
+    def _supersede(self, key):
+        # Новое поколение key; идущий прерываемый вызов с этим key прерывается
+        if key is None:
+            return None
+        with self._lock:
+            generation = self._latest[key] = self._latest.get(key, 0) + 1
+            running = self._running
+            # Писателя (база :memory: без читателей) не прерываем: на нём идут чужие записи
+            if running is not None and running[0] == key and running[2] is not self.pool.writer:
+                running[2].interrupt()
+        return generation
+
+    def _is_current(self, key, generation) -> bool:
+        if key is None:
+            return True
+        with self._lock:
+            return self._latest.get(key) == generation
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is _STOP:
+                return
+            key, generation, fn, args = job[:4]
+            if not self._is_current(key, generation):
+                self._results.put((job, False, None))
+                continue
+            try:
+                self._results.put((job, True, self._call(job)))
+            except Exception as exc:
+                self._results.put((job, False, exc))
+
+    def _call(self, job):
+        key, generation, fn, args, _, _, interrupt = job
+        if not interrupt or key is None or self.pool is None:
+            return fn(*args)
+        # Читатель берётся заранее: вложенные pool.reader() в этом потоке
+        # получают это же подключение, и его можно прервать из главного потока.
+        with self.pool.reader() as conn:
+            with self._lock:
+                if self._latest.get(key) != generation:
+                    return None
+                self._running = (key, generation, conn)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running = None
+
+    def _schedule_poll(self) -> None:
+        if self._poll_id is None and not self._closed:
+            self._poll_id = self.widget.after(self.poll_ms, self._poll)
+
+    def _poll(self) -> None:
+        self._poll_id = None
+        errors = self._drain()
+        if self._pending:
+            self._schedule_poll()
+        elif self.on_busy:
+            self.on_busy(False)
+        if errors:
+            # Необработанную ошибку Tk покажет через report_callback_exception
+            raise errors[0]
+
+    def _drain(self) -> list[Exception]:
+        # Раздаёт все готовые результаты; ошибки колбэков копятся до конца
+        errors = []
+        while True:
+            try:
+                job, ok, value = self._results.get_nowait()
+            except queue.Empty:
+                return errors
+            self._pending -= 1
+            error = self._deliver(job, ok, value)
+            if error is not None:
+                errors.append(error)
+
+    def _deliver(self, job, ok, value) -> Exception | None:
+        # Результат вытесненного вызова отбрасывается без колбэков
+        key, generation, _, _, on_done, on_error, _ = job
+        if not self._is_current(key, generation):
+            return None
+        try:
+            self._dispatch(ok, value, on_done, on_error)
+        except Exception as exc:
+            return exc
+        return None
+
+    @staticmethod
+    def _dispatch(ok, value, on_done, on_error) -> None:
+        # value is None при неуспехе — вызов пропущен, ошибки нет
+        if ok:
+            if on_done is not None:
+                on_done(value)
+        elif value is not None:
+            if on_error is None:
+                raise value
+            on_error(value)
+
+    def _on_destroy(self, event) -> None:
+        if event.widget is self.widget:
+            self.close()
@@ -1,17 +1,65 @@
 # Главное окно приложения согласно README.md
 
+import importlib
 import tkinter as tk
 from tkinter import ttk
-from views.book_view import BookView
-from views.reader_view import ReaderView
-from views.loan_view import LoanView
+
+# Вкладки: заголовок, модуль и класс представления, нужные ему контроллеры.
+# Модули представлений импортируются только при первом выборе вкладки.
+TABS = (
+    ("Задачи", "views.task_view", "TaskView", ("task", "project", "user")),
+    ("Проекты", "views.project_view", "ProjectView", ("project",)),
+    ("Пользователи", "views.user_view", "UserView", ("user",)),
+)
+
 
 class MainWindow(tk.Tk):
-    def __init__(self, book_controller, reader_controller, loan_controller) -> None:
+    """Главное окно с вкладками задач, проектов и пользователей.
+
+    Вкладка строится и загружает данные только при первом выборе, поэтому
+    окно появляется, не дожидаясь ни импорта всех представлений, ни чтения
+    их таблиц. timer (необязательный) получает mark() после каждой вкладки.
+    """
+
+    def __init__(self, task_controller, project_controller, user_controller, timer=None) -> None:
         super().__init__()
-        self.title("Library Management System")
-        self.geometry("900x600")
+        self.title("Система управления задачами")
+        self.geometry("1000x700")
+        self.controllers = {
+            "task": task_controller, "project": project_controller, "user": user_controller
+        }
+        self.timer = timer
+        self.views = {}
+
+        menubar = tk.Menu(self)
+        file_menu = tk.Menu(menubar, tearoff=False)
+        file_menu.add_command(label="Выход", command=self.destroy)
+        menubar.add_cascade(label="Файл", menu=file_menu)
+        self.config(menu=menubar)
+
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill="both", expand=True)
+        self.frames = []
+        for title, *_ in TABS:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            self.frames.append(frame)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        # Первая вкладка — уже после того, как окно показано
+        self.after_idle(self._on_tab_changed)
 
-        notebook = ttk.Notebook(self)
-        notebook.pack(fill="both", expand=True)
+    def build_tab(self, index):
+        view = self.views.get(index)
+        if view is not None:
+            return view
+        title, module, class_name, needs = TABS[index]
+        view_class = getattr(importlib.import_module(module), class_name)
+        view = view_class(self.frames[index], *(self.controllers[name] for name in needs))
+        view.pack(fill="both", expand=True)
+        self.views[index] = view
+        if self.timer is not None:
+            self.timer.mark(f"вкладка «{title}»")
+        return view
 
+    def _on_tab_changed(self, event=None) -> None:
+        self.build_tab(self.notebook.index("current"))
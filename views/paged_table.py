@@ -0,0 +1,289 @@
+import threading
+from collections import OrderedDict
+from tkinter import ttk
+
+DEFAULT_PAGE_SIZE = 100
+# Сколько страниц держать в памяти: текущая, соседние и несколько недавних
+MAX_CACHED_PAGES = 8
+DEFAULT_ROW_HEIGHT = 20
+
+
+class PageSource:
+    """Доступ к строкам таблицы по номеру через page_*/count_* контроллера.
+
+    Страницы читаются keyset-пагинацией: следующая продолжает курсор предыдущей,
+    а при переходе в произвольное место (перетаскивание полосы прокрутки)
+    страница запрашивается по offset. В памяти живёт не больше max_pages
+    страниц, уже переведённых в кортежи значений для Treeview.
+
+    С changes (get_changes контроллера) и load (get_*_by_ids) источник умеет
+    применять к закэшированным страницам только изменения с прошлого чтения.
+    """
+
+    def __init__(self, page, count, to_values, page_size=DEFAULT_PAGE_SIZE,
+                 order_by="id", filters=None, max_pages=MAX_CACHED_PAGES,
+                 changes=None, load=None) -> None:
+        self._page = page
+        self._count = count
+        self._changes = changes
+        self._load = load
+        self.version = None
+        self.to_values = to_values
+        self.page_size = page_size
+        self.order_by = order_by
+        self.filters = filters
+        self.max_pages = max_pages
+        self.total = 0
+        self._pages = OrderedDict()     # номер страницы -> (строки, курсор следующей)
+
+    def count(self) -> int:
+        self.version = None
+        if self._incremental():
+            # Версия и число строк — из одного снимка, иначе следующий дифф их разойдёт
+            info = self._changes()
+            if info is not None:
+                self.version = info["version"]
+                self.total = info["total"]
+                return self.total
+        self.total = self._count(self.filters)
+        return self.total
+
+    def _incremental(self) -> bool:
+        # При сортировке по id обновление не двигает строку, а новые строки —
+        # всегда в конце; для других сортировок и фильтров — полное перечитывание
+        return self._changes is not None and self.order_by == "id" and not self.filters
+
+    def apply_changes(self) -> bool:
+        # Применяет изменения с прошлого чтения; False — нужна полная перезагрузка
+        if self.version is None or not self._incremental():
+            return False
+        diff = self._changes(self.version)
+        if diff is None:
+            return False
+        self.version = diff["version"]
+        deleted, inserted = diff["deleted"], diff["inserted"]
+        self._evict_changed_pages(deleted, inserted)
+        self._patch_updated(diff["updated"])
+        self.total += inserted - len(deleted)
+        return True
+
+    def _evict_changed_pages(self, deleted, inserted) -> None:
+        # Удаление сдвигает все строки после удалённой; вставка меняет последнюю страницу
+        first_deleted = min(deleted) if deleted else None
+        for number, (values, cursor) in list(self._pages.items()):
+            shifted = deleted and (not values or values[-1][0] >= first_deleted)
+            tail = inserted and (cursor is None or len(values) < self.page_size)
+            if shifted or tail:
+                del self._pages[number]
+
+    def _patch_updated(self, updated_ids) -> None:
+        # Изменённые строки закэшированных страниц перечитываются по id на месте
+        cached = {row[0] for values, _ in self._pages.values() for row in values}
+        updated = cached.intersection(updated_ids)
+        if not updated:
+            return
+        models = self._load(list(updated))
+        for number, (values, _) in list(self._pages.items()):
+            for i, row in enumerate(values):
+                if row[0] not in updated:
+                    continue
+                if row[0] not in models:
+                    # Удалена уже после снимка — страницу перечитаем
+                    del self._pages[number]
+                    break
+                values[i] = self.to_values(models[row[0]])
+
+    def invalidate(self) -> None:
+        self._pages.clear()
+
+    def rows(self, start, stop) -> list[tuple]:
+        result = []
+        for number in range(start // self.page_size, (max(start, stop - 1)) // self.page_size + 1):
+            first = number * self.page_size
+            values = self._get_page(number)
+            result.extend(values[max(0, start - first):max(0, stop - first)])
+        return result
+
+    def _get_page(self, number) -> list[tuple]:
+        cached = self._pages.get(number)
+        if cached is not None:
+            self._pages.move_to_end(number)
+            return cached[0]
+        previous = self._pages.get(number - 1)
+        if number and previous is not None:
+            if previous[1] is None:
+                return []                # предыдущая страница была последней
+            items, cursor = self._page(previous[1], self.page_size, self.order_by, self.filters)
+        else:
+            items, cursor = self._page(
+                None, self.page_size, self.order_by, self.filters, number * self.page_size or None
+            )
+        values = [self.to_values(item) for item in items]
+        self._pages[number] = (values, cursor)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+        return values
+
+
+class PagedTable(ttk.Frame):
+    """Виртуализированная таблица: Treeview держит только видимые строки.
+
+    Элементов в Treeview ровно столько, сколько помещается в окне; при прокрутке
+    они не пересоздаются, а получают значения других строк из PageSource.
+    Полоса прокрутки показывает положение окна во всей выборке. Первая
+    колонка должна быть id записи — по нему сохраняется выделение.
+
+    С loader (BackgroundLoader) все обращения к PageSource идут в его рабочем
+    потоке, а окно перерисовывается, когда строки готовы; запросы окна
+    вытесняют друг друга, так что быстрая прокрутка читает только последнее.
+    """
+
+    def __init__(self, parent, columns, source, loader=None) -> None:
+        # columns — список (имя, заголовок, ширина)
+        super().__init__(parent)
+        self.source = source
+        self.loader = loader
+        self.top = 0
+        self.total = 0
+        self.visible = 1
+        self._selected_id = None
+        self._select_edge = None
+        # Перезагрузка, которую должен выполнить ближайший запрос окна:
+        # 0 — нет, 1 — изменения из журнала, 2 — полная
+        self._reload = 0
+        self._reload_lock = threading.Lock()
+        row_height = ttk.Style(self).lookup("Treeview", "rowheight")
+        self._row_height = int(row_height or DEFAULT_ROW_HEIGHT)
+
+        self.tree = ttk.Treeview(
+            self, columns=[c[0] for c in columns], show="headings", selectmode="browse"
+        )
+        for name, title, width in columns:
+            self.tree.heading(name, text=title)
+            self.tree.column(name, width=width)
+        self.tree.pack(fill="both", expand=True, side="left")
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", lambda e: self._scroll_by(-1 if e.delta > 0 else 1, 3))
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-1, 3))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(1, 3))
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self._scroll_by(-1, self.visible))
+        self.tree.bind("<Next>", lambda e: self._scroll_by(1, self.visible))
+        self.tree.bind("<Home>", lambda e: self.scroll_to(0) or "break")
+        self.tree.bind("<End>", lambda e: self.scroll_to(self.total) or "break")
+
+    def refresh(self) -> None:
+        # Перечитать выборку: число строк и видимое окно; остальное — по мере прокрутки
+        self._request(reload=2)
+
+    def refresh_changes(self) -> None:
+        # Применить только изменения с прошлого обновления; без журнала — как refresh()
+        self._request(reload=1)
+
+    def scroll_to(self, top) -> None:
+        top = max(0, min(int(top), self._max_top()))
+        if top != self.top:
+            self.top = top
+            self._request()
+
+    def selected_ids(self) -> list:
+        return [self.tree.item(iid)["values"][0] for iid in self.tree.selection()]
+
+    def _max_top(self) -> int:
+        return max(0, self.total - self.visible)
+
+    def _request(self, reload=0) -> None:
+        with self._reload_lock:
+            self._reload = max(self._reload, reload)
+        if self.loader is None:
+            self._show(self._fetch(self.top, self.visible))
+        else:
+            self.loader.submit(
+                self._fetch, self.top, self.visible, key=("window", id(self)), on_done=self._show
+            )
+
+    def _fetch(self, top, visible) -> tuple[int, int, list]:
+        # С loader выполняется в его рабочем потоке: только PageSource, без Tk
+        with self._reload_lock:
+            reload, self._reload = self._reload, 0
+        try:
+            if reload == 1 and not self.source.apply_changes():
+                reload = 2
+            if reload == 2:
+                self.source.invalidate()
+                self.source.count()
+        except Exception:
+            with self._reload_lock:
+                self._reload = max(self._reload, reload)
+            raise
+        total = self.source.total
+        top = max(0, min(top, total - visible))
+        return top, total, self.source.rows(top, top + visible)
+
+    def _show(self, window) -> None:
+        self.top, self.total, rows = window
+        items = list(self.tree.get_children())
+        for iid in items[len(rows):]:
+            self.tree.delete(iid)
+        del items[len(rows):]
+        for i, values in enumerate(rows):
+            if i < len(items):
+                self.tree.item(items[i], values=values)
+            else:
+                items.append(self.tree.insert("", "end", values=values))
+        if self._select_edge is not None and items:
+            # Клавиша вверх/вниз на краю окна: выделяем строку, въехавшую в окно
+            self._selected_id = rows[0 if self._select_edge < 0 else -1][0]
+        self._select_edge = None
+        # Выделение следует за записью, а не за строкой Treeview
+        selected = [iid for iid, values in zip(items, rows) if values[0] == self._selected_id]
+        self.tree.selection_set(selected)
+        if self.total:
+            bottom = min(1.0, (self.top + self.visible) / self.total)
+            self.scrollbar.set(self.top / self.total, bottom)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_resize(self, event) -> None:
+        # Заголовок таблицы занимает примерно одну строку
+        visible = max(1, event.height // self._row_height - 1)
+        if visible != self.visible:
+            self.visible = visible
+            self.top = min(self.top, self._max_top())
+            self._request()
+
+    def _on_scrollbar(self, action, amount, unit=None) -> None:
+        if action == "moveto":
+            self.scroll_to(float(amount) * self.total)
+        elif action == "scroll":
+            self._scroll_by(int(amount), self.visible if unit == "pages" else 1)
+
+    def _scroll_by(self, direction, step) -> str:
+        self.scroll_to(self.top + direction * step)
+        return "break"
+
+    def _on_select(self, event) -> None:
+        selection = self.tree.selection()
+        if selection:
+            self._selected_id = self.tree.item(selection[0])["values"][0]
+
+    def _move_selection(self, direction) -> str:
+        items = self.tree.get_children()
+        if not items:
+            return "break"
+        selection = self.tree.selection()
+        index = items.index(selection[0]) + direction if selection else 0
+        if 0 <= index < len(items):
+            self.tree.selection_set(items[index])
+            self.tree.see(items[index])
+        elif 0 <= self.top + direction <= self._max_top():
+            # Край окна: прокручиваем на строку, выделение встанет после загрузки
+            self._select_edge = direction
+            self._scroll_by(direction, 1)
+        return "break"
@@ -1,10 +1,29 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from views.background_loader import BackgroundLoader
+from views.paged_table import PagedTable, PageSource
+
+PROJECT_COLUMNS = [
+    ("id", "ID", 50),
+    ("name", "Название", 150),
+    ("description", "Описание", 300),
+    ("status", "Статус", 100),
+]
+
+
+def _project_values(project) -> tuple:
+    return (project.id, project.name, project.description, project.status)
+
+
 class ProjectView(ttk.Frame):
     def __init__(self, parent, project_controller) -> None:
         super().__init__(parent)
         self.project_controller = project_controller
+        # Запросы к базе — в рабочем потоке, чтобы окно не замирало на SQLite
+        self.loader = BackgroundLoader(
+            self, on_busy=self._on_busy, pool=project_controller.db.pool
+        )
         self.create_widgets()
         self.refresh_projects()
 
@@ -25,25 +44,13 @@ class ProjectView(ttk.Frame):
         form_frame.columnconfigure(1, weight=1)
 
         # --- таблица проектов ---
-        table_frame = ttk.Frame(self)
-        table_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-        self.tree = ttk.Treeview(table_frame, columns=("id", "name", "description", "status"), show="headings")
-        self.tree.heading("id", text="ID")
-        self.tree.heading("name", text="Название")
-        self.tree.heading("description", text="Описание")
-        self.tree.heading("status", text="Статус")
-
-        self.tree.column("id", width=50)
-        self.tree.column("name", width=150)
-        self.tree.column("description", width=300)
-        self.tree.column("status", width=100)
-
-        self.tree.pack(fill="both", expand=True, side="left")
-
-        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side="right", fill="y")
+        c = self.project_controller
+        source = PageSource(
+            c.page_projects, c.count_projects, _project_values,
+            changes=c.get_changes, load=c.get_projects_by_ids,
+        )
+        self.table = PagedTable(self, PROJECT_COLUMNS, source, loader=self.loader)
+        self.table.pack(fill="both", expand=True, padx=10, pady=10)
 
         # --- кнопки управления ---
         button_frame = ttk.Frame(self)
@@ -51,16 +58,12 @@ class ProjectView(ttk.Frame):
 
         ttk.Button(button_frame, text="Обновить список", command=self.refresh_projects).pack(side="left", padx=5)
         ttk.Button(button_frame, text="Удалить выбранный", command=self.delete_selected).pack(side="left", padx=5)
+        self.status_label = ttk.Label(button_frame, text="")
+        self.status_label.pack(side="right", padx=5)
 
     def refresh_projects(self) -> None:
-        # Очистить таблицу
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Получить все проекты и отобразить
-        projects = self.project_controller.get_all_projects()
-        for project in projects:
-            self.tree.insert("", "end", values=(project.id, project.name, project.description, project.status))
+        # Только изменения с прошлого обновления, если в базе включён журнал изменений
+        self.table.refresh_changes()
 
     def add_project(self) -> None:
         name = self.name_entry.get().strip()
@@ -70,19 +73,34 @@ class ProjectView(ttk.Frame):
             messagebox.showerror("Ошибка", "Название проекта не может быть пустым!")
             return
 
-        self.project_controller.add_project(name, desc, None, None)
+        self.loader.submit(
+            self.project_controller.add_project, name, desc, None, None,
+            on_done=self._project_added, on_error=self._show_error,
+        )
+
+    def _project_added(self, project_id) -> None:
         messagebox.showinfo("Успех", "Проект добавлен!")
         self.refresh_projects()
         self.name_entry.delete(0, tk.END)
         self.desc_entry.delete(0, tk.END)
 
     def delete_selected(self) -> None:
-        selected = self.tree.selection()
+        selected = self.table.selected_ids()
         if not selected:
             messagebox.showwarning("Внимание", "Сначала выберите проект для удаления.")
             return
 
-        project_id = self.tree.item(selected[0])["values"][0]
-        self.project_controller.delete_project(project_id)
+        self.loader.submit(
+            self.project_controller.delete_project, selected[0],
+            on_done=self._project_deleted, on_error=self._show_error,
+        )
+
+    def _project_deleted(self, result) -> None:
         messagebox.showinfo("Успех", "Проект удалён!")
-        self.refresh_projects()
\ No newline at end of file
+        self.refresh_projects()
+
+    def _on_busy(self, busy) -> None:
+        self.status_label.config(text="Загрузка…" if busy else "")
+
+    def _show_error(self, error) -> None:
+        messagebox.showerror("Ошибка", str(error))
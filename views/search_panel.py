@@ -0,0 +1,147 @@
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+
+SEARCH_LIMIT = 200
+DEBOUNCE_MS = 150
+MAX_CACHED_QUERIES = 32
+
+
+def _narrows(base, key) -> bool:
+    # Результаты key — подмножество результатов base: тот же вид поиска, и
+    # каждый терм base — начало терма key на той же позиции (у LIKE — подстрока)
+    if key[0] != base[0] or len(key[1]) < len(base[1]):
+        return False
+    if key[0] == "like":
+        return base[1][0] in key[1][0]
+    return all(term.startswith(prefix) for prefix, term in zip(base[1], key[1]))
+
+
+class SearchCache:
+    """Результаты поиска по запросам с уточнением прошлых результатов.
+
+    search_key (контроллера) говорит, каким поиском и с какими термами база
+    выполнит запрос. Если прошлый запрос того же вида заведомо шире нового
+    и его результат полный (меньше limit строк), новые результаты —
+    подмножество старых: их отбирает matches (task_matches контроллера) без
+    обращения к базе. Порядок остаётся от исходного запроса.
+    """
+
+    def __init__(self, matches, search_key, limit=SEARCH_LIMIT,
+                 max_entries=MAX_CACHED_QUERIES) -> None:
+        self.matches = matches
+        self.search_key = search_key
+        self.limit = limit
+        self.max_entries = max_entries
+        self._entries = OrderedDict()   # запрос -> (ключ поиска, результаты)
+
+    def get(self, query):
+        # Результаты query или None, если их нужно искать в базе
+        entry = self._entries.get(query)
+        if entry is not None:
+            self._entries.move_to_end(query)
+            return entry[1]
+        key = self.search_key(query)
+        wider = [
+            found for base, found in self._entries.values()
+            if len(found) < self.limit and _narrows(base, key)
+        ]
+        if not wider:
+            return None
+        results = [task for task in min(wider, key=len) if self.matches(task, query)]
+        self.put(query, results)
+        return results
+
+    def put(self, query, results) -> None:
+        self._entries[query] = (self.search_key(query), results)
+        self._entries.move_to_end(query)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class SearchPanel(ttk.LabelFrame):
+    """Поиск по мере ввода поверх search_tasks контроллера.
+
+    Запрос уходит в базу через delay_ms после последнего нажатия клавиши,
+    в рабочем потоке loader; новый запрос прерывает ещё идущий. Ответы,
+    которые можно получить из прошлых результатов, берутся из SearchCache
+    (matches и search_key — task_matches и search_key контроллера).
+    """
+
+    def __init__(self, parent, search, matches, search_key, loader, columns, to_values,
+                 limit=SEARCH_LIMIT, delay_ms=DEBOUNCE_MS) -> None:
+        # columns — список (имя, заголовок, ширина), как у PagedTable
+        super().__init__(parent, text="Поиск задач")
+        self.search = search
+        self.loader = loader
+        self.to_values = to_values
+        self.limit = limit
+        self.delay_ms = delay_ms
+        self.cache = SearchCache(matches, search_key, limit)
+        self._after_id = None
+        self._key = ("search", id(self))
+
+        self.query = tk.StringVar()
+        self.entry = ttk.Entry(self, textvariable=self.query)
+        self.entry.pack(fill="x", padx=5, pady=4)
+        self.info = ttk.Label(self, text="")
+        self.info.pack(anchor="w", padx=5)
+
+        self.tree = ttk.Treeview(self, columns=[c[0] for c in columns], show="headings", height=6)
+        for name, title, width in columns:
+            self.tree.heading(name, text=title)
+            self.tree.column(name, width=width)
+        self.tree.pack(fill="x", padx=5, pady=4)
+
+        self.query.trace_add("write", self._on_change)
+
+    def invalidate(self) -> None:
+        # Данные изменились: кэш устарел, текущий запрос перечитываем
+        self.cache.clear()
+        if self.query.get().strip():
+            self._search()
+
+    def _on_change(self, *args) -> None:
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+        self._after_id = self.after(self.delay_ms, self._search)
+
+    def _search(self) -> None:
+        self._after_id = None
+        query = self.query.get().strip()
+        results = self.cache.get(query) if query else []
+        if results is not None:
+            self.loader.cancel(self._key)
+            self._show(query, results)
+            return
+        self.info.config(text="Поиск…")
+        self.loader.submit(
+            self.search, query, self.limit, key=self._key, interrupt=True,
+            on_done=lambda found: self._found(query, found), on_error=self._failed,
+        )
+
+    def _found(self, query, results) -> None:
+        self.cache.put(query, results)
+        self._show(query, results)
+
+    def _failed(self, error) -> None:
+        self.info.config(text=f"Ошибка поиска: {error}")
+
+    def _show(self, query, results) -> None:
+        self.tree.delete(*self.tree.get_children())
+        if not query:
+            self.info.config(text="")
+        elif len(results) < self.limit:
+            self.info.config(text=f"Найдено: {len(results)}")
+        else:
+            self.info.config(text=f"Показаны первые {self.limit}, уточните запрос")
+        self.loader.run_in_chunks(
+            [self.to_values(task) for task in results], self._insert, key=("search-rows", id(self))
+        )
+
+    def _insert(self, rows) -> None:
+        for values in rows:
+            self.tree.insert("", "end", values=values)
@@ -1,12 +1,36 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from views.background_loader import BackgroundLoader
+from views.paged_table import PagedTable, PageSource
+from views.search_panel import SearchPanel
+
+TASK_COLUMNS = [
+    ("id", "ID", 60),
+    ("title", "Название", 220),
+    ("status", "Статус", 110),
+    ("priority", "Приоритет", 90),
+    ("due_date", "Срок", 120),
+    ("project_id", "Проект", 90),
+    ("assignee_id", "Исполнитель", 110),
+]
+
+
+def _task_values(t) -> tuple:
+    due = t.due_date.isoformat() if t.due_date else None
+    return (t.id, t.title, t.status, t.priority, due, t.project_id, t.assignee_id)
+
+
 class TaskView(ttk.Frame):
     def __init__(self, parent, task_controller, project_controller, user_controller) -> None:
         super().__init__(parent)
         self.task_controller = task_controller
         self.project_controller = project_controller
         self.user_controller = user_controller
+        # Запросы к базе — в рабочем потоке, чтобы окно не замирало на SQLite
+        self.loader = BackgroundLoader(
+            self, on_busy=self._on_busy, pool=task_controller.db.pool
+        )
         self.create_widgets()
         self.refresh_tasks()
 
@@ -45,63 +69,35 @@ class TaskView(ttk.Frame):
 
         form.columnconfigure(1, weight=1)
 
-        # ----- Таблица задач -----
-        table_frame = ttk.Frame(self)
-        table_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        # ----- Поиск по мере ввода -----
+        self.search = SearchPanel(
+            self, self.task_controller.search_tasks, self.task_controller.task_matches,
+            self.task_controller.search_key, self.loader, TASK_COLUMNS, _task_values,
+        )
+        self.search.pack(fill="x", padx=10, pady=5)
 
-        self.tree = ttk.Treeview(
-            table_frame,
-            columns=("id","title","status","priority","due_date","project_id","assignee_id"),
-            show="headings"
+        # ----- Таблица задач -----
+        # Виртуализированная: в Treeview только видимые строки, страницы читаются при прокрутке
+        c = self.task_controller
+        source = PageSource(
+            c.page_tasks, c.count_tasks, _task_values,
+            changes=c.get_changes, load=c.get_tasks_by_ids,
         )
-        self.tree.heading("id", text="ID")
-        self.tree.heading("title", text="Название")
-        self.tree.heading("status", text="Статус")
-        self.tree.heading("priority", text="Приоритет")
-        self.tree.heading("due_date", text="Срок")
-        self.tree.heading("project_id", text="Проект")
-        self.tree.heading("assignee_id", text="Исполнитель")
-
-        self.tree.column("id", width=60)
-        self.tree.column("title", width=220)
-        self.tree.column("status", width=110)
-        self.tree.column("priority", width=90)
-        self.tree.column("due_date", width=120)
-        self.tree.column("project_id", width=90)
-        self.tree.column("assignee_id", width=110)
-
-        self.tree.pack(fill="both", expand=True, side="left")
-
-        sb = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=sb.set)
-        sb.pack(side="right", fill="y")
+        self.table = PagedTable(self, TASK_COLUMNS, source, loader=self.loader)
+        self.table.pack(fill="both", expand=True, padx=10, pady=10)
 
         # ----- Кнопки управления -----
         bar = ttk.Frame(self)
         bar.pack(fill="x", padx=10, pady=5)
         ttk.Button(bar, text="Обновить список", command=self.refresh_tasks).pack(side="left", padx=5)
         ttk.Button(bar, text="Удалить выбранную", command=self.delete_selected).pack(side="left", padx=5)
+        self.status_label = ttk.Label(bar, text="")
+        self.status_label.pack(side="right", padx=5)
 
     def refresh_tasks(self) -> None:
-        # очистка
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        # получение задач (ожидаем модели Task)
-        tasks = self.task_controller.get_all_tasks()
-        for t in tasks:
-            # поддержка как моделей с атрибутами, так и dict-подобных (на всякий случай)
-            get = (lambda obj, name: getattr(obj, name) if hasattr(obj, name) else obj.get(name))
-            tid = get(t, "id")
-            title = get(t, "title")
-            status = get(t, "status")
-            priority = get(t, "priority")
-            due = get(t, "due_date")
-            # due может быть datetime или строка
-            if hasattr(due, "isoformat"):
-                due = due.isoformat()
-            project_id = get(t, "project_id")
-            assignee_id = get(t, "assignee_id")
-            self.tree.insert("", "end", values=(tid, title, status, priority, due, project_id, assignee_id))
+        # Только изменения с прошлого обновления, если в базе включён журнал изменений
+        self.table.refresh_changes()
+        self.search.invalidate()
 
     def add_task(self) -> None:
         title = self.e_title.get().strip()
@@ -135,26 +131,38 @@ class TaskView(ttk.Frame):
         project_id = int(proj_raw) if proj_raw else None
         assignee_id = int(ass_raw) if ass_raw else None
 
-        try:
-            self.task_controller.add_task(title, desc, priority, due_dt, project_id, assignee_id)
-            messagebox.showinfo("Успех", "Задача добавлена.")
-            self.refresh_tasks()
-            # очистка полей
-            for e in (self.e_title, self.e_desc, self.e_priority, self.e_due, self.e_project, self.e_assignee):
-                e.delete(0, tk.END)
-            self.e_priority.insert(0, "2")
-        except Exception as e:
-            messagebox.showerror("Ошибка", str(e))
+        self.loader.submit(
+            self.task_controller.add_task, title, desc, priority, due_dt, project_id, assignee_id,
+            on_done=self._task_added, on_error=self._show_error,
+        )
+
+    def _task_added(self, task_id) -> None:
+        messagebox.showinfo("Успех", "Задача добавлена.")
+        self.refresh_tasks()
+        # очистка полей
+        entries = (
+            self.e_title, self.e_desc, self.e_priority, self.e_due, self.e_project, self.e_assignee
+        )
+        for e in entries:
+            e.delete(0, tk.END)
+        self.e_priority.insert(0, "2")
 
     def delete_selected(self) -> None:
-        sel = self.tree.selection()
+        sel = self.table.selected_ids()
         if not sel:
             messagebox.showwarning("Внимание", "Выберите задачу для удаления.")
             return
-        task_id = self.tree.item(sel[0])["values"][0]
-        try:
-            self.task_controller.delete_task(task_id)
-            messagebox.showinfo("Успех", "Задача удалена.")
-            self.refresh_tasks()
-        except Exception as e:
-            messagebox.showerror("Ошибка", str(e))
\ No newline at end of file
+        self.loader.submit(
+            self.task_controller.delete_task, sel[0],
+            on_done=self._task_deleted, on_error=self._show_error,
+        )
+
+    def _task_deleted(self, result) -> None:
+        messagebox.showinfo("Успех", "Задача удалена.")
+        self.refresh_tasks()
+
+    def _on_busy(self, busy) -> None:
+        self.status_label.config(text="Загрузка…" if busy else "")
+
+    def _show_error(self, error) -> None:
+        messagebox.showerror("Ошибка", str(error))
@@ -1,10 +1,30 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from views.background_loader import BackgroundLoader
+from views.paged_table import PagedTable, PageSource
+
+USER_COLUMNS = [
+    ("id", "ID", 60),
+    ("username", "Имя", 160),
+    ("email", "Email", 220),
+    ("role", "Роль", 120),
+    ("registration_date", "Регистрация", 160),
+]
+
+
+def _user_values(u) -> tuple:
+    return (u.id, u.username, u.email, u.role, u.registration_date.isoformat())
+
+
 class UserView(ttk.Frame):
     def __init__(self, parent, user_controller) -> None:
         super().__init__(parent)
         self.user_controller = user_controller
+        # Запросы к базе — в рабочем потоке, чтобы окно не замирало на SQLite
+        self.loader = BackgroundLoader(
+            self, on_busy=self._on_busy, pool=user_controller.db.pool
+        )
         self.create_widgets()
         self.refresh_users()
 
@@ -30,53 +50,25 @@ class UserView(ttk.Frame):
         form.columnconfigure(1, weight=1)
 
         # --- Таблица пользователей ---
-        table_frame = ttk.Frame(self)
-        table_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-        self.tree = ttk.Treeview(
-            table_frame,
-            columns=("id", "username", "email", "role", "registration_date"),
-            show="headings"
+        c = self.user_controller
+        source = PageSource(
+            c.page_users, c.count_users, _user_values,
+            changes=c.get_changes, load=c.get_users_by_ids,
         )
-        for col, title, width in [
-            ("id", "ID", 60),
-            ("username", "Имя", 160),
-            ("email", "Email", 220),
-            ("role", "Роль", 120),
-            ("registration_date", "Регистрация", 160),
-        ]:
-            self.tree.heading(col, text=title)
-            self.tree.column(col, width=width)
-
-        self.tree.pack(fill="both", expand=True, side="left")
-
-        sb = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=sb.set)
-        sb.pack(side="right", fill="y")
+        self.table = PagedTable(self, USER_COLUMNS, source, loader=self.loader)
+        self.table.pack(fill="both", expand=True, padx=10, pady=10)
 
         # --- Панель действий ---
         bar = ttk.Frame(self)
         bar.pack(fill="x", padx=10, pady=6)
         ttk.Button(bar, text="Обновить список", command=self.refresh_users).pack(side="left", padx=5)
         ttk.Button(bar, text="Удалить выбранного", command=self.delete_selected).pack(side="left", padx=5)
+        self.status_label = ttk.Label(bar, text="")
+        self.status_label.pack(side="right", padx=5)
 
     def refresh_users(self) -> None:
-        # очистка
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-
-        users = self.user_controller.get_all_users()
-        for u in users:
-            # поддержка и моделей-объектов, и dict
-            get = (lambda obj, name: getattr(obj, name) if hasattr(obj, name) else obj.get(name))
-            uid = get(u, "id")
-            username = get(u, "username")
-            email = get(u, "email")
-            role = get(u, "role")
-            reg = get(u, "registration_date")
-            if hasattr(reg, "isoformat"):
-                reg = reg.isoformat()
-            self.tree.insert("", "end", values=(uid, username, email, role, reg))
+        # Только изменения с прошлого обновления, если в базе включён журнал изменений
+        self.table.refresh_changes()
 
     def add_user(self) -> None:
         username = self.e_username.get().strip()
@@ -93,25 +85,34 @@ class UserView(ttk.Frame):
             messagebox.showerror("Ошибка", "Выберите роль.")
             return
 
-        try:
-            self.user_controller.add_user(username, email, role)
-            messagebox.showinfo("Успех", "Пользователь добавлен.")
-            self.refresh_users()
-            self.e_username.delete(0, tk.END)
-            self.e_email.delete(0, tk.END)
-            self.cb_role.set("developer")
-        except Exception as e:
-            messagebox.showerror("Ошибка", str(e))
+        self.loader.submit(
+            self.user_controller.add_user, username, email, role,
+            on_done=self._user_added, on_error=self._show_error,
+        )
+
+    def _user_added(self, user_id) -> None:
+        messagebox.showinfo("Успех", "Пользователь добавлен.")
+        self.refresh_users()
+        self.e_username.delete(0, tk.END)
+        self.e_email.delete(0, tk.END)
+        self.cb_role.set("developer")
 
     def delete_selected(self) -> None:
-        sel = self.tree.selection()
+        sel = self.table.selected_ids()
         if not sel:
             messagebox.showwarning("Внимание", "Выберите пользователя для удаления.")
             return
-        user_id = self.tree.item(sel[0])["values"][0]
-        try:
-            self.user_controller.delete_user(user_id)
-            messagebox.showinfo("Успех", "Пользователь удалён.")
-            self.refresh_users()
-        except Exception as e:
-            messagebox.showerror("Ошибка", str(e))
\ No newline at end of file
+        self.loader.submit(
+            self.user_controller.delete_user, sel[0],
+            on_done=self._user_deleted, on_error=self._show_error,
+        )
+
+    def _user_deleted(self, result) -> None:
+        messagebox.showinfo("Успех", "Пользователь удалён.")
+        self.refresh_users()
+
+    def _on_busy(self, busy) -> None:
+        self.status_label.config(text="Загрузка…" if busy else "")
+
+    def _show_error(self, error) -> None:
+        messagebox.showerror("Ошибка", str(error))